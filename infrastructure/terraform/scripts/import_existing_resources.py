@@ -5,18 +5,50 @@ This script helps import existing AWS resources created via console into
 Terraform state to avoid recreation and downtime.
 
 USAGE:
-    python3 scripts/import_existing_resources.py
+    python3 scripts/import_existing_resources.py [--legacy] [--no-cache]
+
+    By default every resource of a phase is imported through a single
+    Terraform plan built from generated `import` blocks (Terraform >= 1.5).
+    Pass --legacy to fall back to one `terraform import` per resource.
+
+    AWS existence checks (5 minutes) and the caller identity (1 hour) are
+    cached in ~/.cache/tf-import-cache.json; pass --no-cache to re-verify.
+
+    Set LOG_LEVEL=DEBUG to include progress detail, or LOG_LEVEL=WARNING to
+    show only problems (default: INFO).
 
 PREREQUISITES:
     1. Backend setup completed (S3 + DynamoDB created)
     2. music-service IAM user credentials exported
     3. Terraform code written to match existing resources
+    4. boto3 installed (pip install boto3)
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import logging
 import os
+import shutil
 import subprocess  # nosec B404 - subprocess is used safely with explicit command lists
 import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+from typing import Any, ClassVar, TextIO
+
+try:
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    print("❌ Error: boto3 is not installed")
+    print("Install it with: pip install boto3")
+    sys.exit(1)
 
 # ==============================================================================
 # Configuration
@@ -61,51 +93,175 @@ ACM_CERTIFICATE_ARN = (
 )
 IAM_USER_NAME = os.getenv("IAM_USER_NAME", "music-service")
 
+# Environment variables without a usable default
+_REQUIRED_ENV: tuple[str, ...] = (
+    "AWS_ACCOUNT_ID",
+    "CLOUDFRONT_DISTRIBUTION_ID",
+    "ACM_CERTIFICATE_ID",
+)
+
+
+# Shared provider plugin cache, reused by both init runs (one at a time) and across re-runs
+TF_PLUGIN_CACHE_DIR = Path.home() / ".terraform.d" / "plugin-cache"
+
+# Results of AWS lookups, reused across iterative re-runs (disable with --no-cache)
+IMPORT_CACHE_FILE = Path.home() / ".cache" / "tf-import-cache.json"
+EXISTENCE_CACHE_TTL = 300  # seconds
+CALLER_ARN_CACHE_TTL = 3600  # seconds
+
+# Files written next to the Terraform configuration during a batched import
+IMPORTS_FILE = "imports.tf"
+IMPORT_PLAN_FILE = "import.tfplan"
+DRIFT_PLAN_FILE = "drift.tfplan"
+
+# A resource to import: (resource type, resource name, AWS resource ID)
+ImportSpec = tuple[str, str, str]
+
+# Logical resources checked by verify_resources_exist(); the script cannot
+# proceed without the required ones
+REQUIRED_RESOURCES = ("s3_bucket", "cloudfront", "acm")
+
 
 # ==============================================================================
 # Helper Functions
 # ==============================================================================
 
 
+# Only emit ANSI colors on a terminal; redirected logs (tee, CI) stay plain
+_USE_COLOR = sys.stdout.isatty()
+
+
 class Colors:
-    """ANSI color codes for terminal output."""
+    """ANSI color codes for terminal output (empty when stdout is not a TTY)."""
+
+    RED = "\033[0;31m" if _USE_COLOR else ""
+    GREEN = "\033[0;32m" if _USE_COLOR else ""
+    YELLOW = "\033[1;33m" if _USE_COLOR else ""
+    BLUE = "\033[0;34m" if _USE_COLOR else ""
+    NC = "\033[0m" if _USE_COLOR else ""  # No Color
+
+
+# Message templates, formatted once per call with str.format(msg=...)
+_RULE = f"{Colors.BLUE}{'=' * 67}{Colors.NC}"
+_HEADER_FMT = f"\n{_RULE}\n{Colors.BLUE}{{msg}}{Colors.NC}\n{_RULE}\n"
+_SUCCESS_FMT = f"{Colors.GREEN}✓ {{msg}}{Colors.NC}"
+_WARNING_FMT = f"{Colors.YELLOW}⚠ {{msg}}{Colors.NC}"
+_ERROR_FMT = f"{Colors.RED}✗ {{msg}}{Colors.NC}"
+_INFO_FMT = f"{Colors.BLUE}→ {{msg}}{Colors.NC}"
+
+
+class _StdoutHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """StreamHandler bound to whatever sys.stdout is at emit time.
+
+    Phases swap sys.stdout for a per-thread router, so the handler must not
+    hold on to the stream it was created with.
+    """
+
+    @property  # type: ignore[override]
+    def stream(self) -> Any:
+        """Current sys.stdout."""
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value: Any) -> None:
+        pass
+
+
+class _ColorFormatter(logging.Formatter):
+    """Render log records with the colored message templates."""
+
+    _FORMATS: ClassVar[dict[int, str]] = {
+        logging.DEBUG: _INFO_FMT,
+        logging.INFO: _SUCCESS_FMT,
+        logging.WARNING: _WARNING_FMT,
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record; records logged with extra={"header": True} get a banner."""
+        if getattr(record, "header", False):
+            template = _HEADER_FMT
+        else:
+            template = self._FORMATS.get(record.levelno, _ERROR_FMT)
+        return template.format(msg=record.getMessage())
+
+
+# Level from $LOG_LEVEL (default INFO): DEBUG shows progress detail ("→" lines),
+# INFO adds results, WARNING and above keep only problems
+log = logging.getLogger("import_existing_resources")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+log.propagate = False
+_handler = _StdoutHandler()
+_handler.setFormatter(_ColorFormatter())
+log.addHandler(_handler)
 
-    RED = "\033[0;31m"
-    GREEN = "\033[0;32m"
-    YELLOW = "\033[1;33m"
-    BLUE = "\033[0;34m"
-    NC = "\033[0m"  # No Color
 
+def log_header(message: str) -> None:
+    """Log a section header banner."""
+    log.info(message, extra={"header": True})
 
-def print_header(message: str) -> None:
-    """Print a formatted header."""
-    print(f"\n{Colors.BLUE}{'=' * 67}{Colors.NC}")
-    print(f"{Colors.BLUE}{message}{Colors.NC}")
-    print(f"{Colors.BLUE}{'=' * 67}{Colors.NC}\n")
 
+# ==============================================================================
+# Phase Output
+# ==============================================================================
+#
+# The infrastructure and bootstrap phases run in worker threads. Each phase
+# writes into its own buffer (routed per-thread through sys.stdout) and the
+# buffers are printed in phase order once both are done, so the two logs never
+# interleave.
+
+_phase_output = threading.local()
+_prompt_lock = threading.Lock()
 
-def print_success(message: str) -> None:
-    """Print a success message."""
-    print(f"{Colors.GREEN}✓ {message}{Colors.NC}")
 
+class _ThreadRoutedStdout(io.TextIOBase):
+    """sys.stdout stand-in that sends each thread's writes to its phase buffer."""
 
-def print_warning(message: str) -> None:
-    """Print a warning message."""
-    print(f"{Colors.YELLOW}⚠ {message}{Colors.NC}")
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
 
+    def write(self, text: str) -> int:
+        buffer: io.StringIO | None = getattr(_phase_output, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@contextlib.contextmanager
+def capture_phase_output() -> Generator[io.StringIO, None, None]:
+    """Buffer everything the current thread prints until the context exits."""
+    buffer = io.StringIO()
+    _phase_output.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _phase_output.buffer = None
 
-def print_error(message: str) -> None:
-    """Print an error message."""
-    print(f"{Colors.RED}✗ {message}{Colors.NC}")
 
+def ask(question: str) -> str:
+    """Prompt on the real terminal, even from inside a buffered phase.
 
-def print_info(message: str) -> None:
-    """Print an info message."""
-    print(f"{Colors.BLUE}→ {message}{Colors.NC}")
+    Any output the calling phase has buffered so far is written out first so
+    the question appears with its context.
+    """
+    with _prompt_lock:
+        stream = sys.__stdout__ or sys.stdout
+        buffer: io.StringIO | None = getattr(_phase_output, "buffer", None)
+        if buffer is not None:
+            stream.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        stream.write(question)
+        stream.flush()
+        return sys.stdin.readline().rstrip("\n")
 
 
 def run_command(
-    cmd: list[str], cwd: Path | None = None, check: bool = True, capture_output: bool = True
+    cmd: list[str],
+    cwd: Path | None = None,
+    check: bool = True,
+    capture_output: bool = True,
+    discard_output: bool = False,
 ) -> tuple[bool, str]:
     """Run a shell command and return success status and output.
 
@@ -114,39 +270,201 @@ def run_command(
         cwd: Working directory
         check: Raise exception on error
         capture_output: Capture stdout/stderr
+        discard_output: Send stdout/stderr to /dev/null; only the exit status
+            is reported (output is always "")
 
     Returns:
         Tuple of (success, output)
     """
+    if discard_output:
+        proc = subprocess.Popen(
+            cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )  # nosec B603 - cmd is always a list with explicit args, no shell
+        return proc.wait() == 0, ""
+
     try:
         result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=capture_output, text=True
+            cmd, cwd=cwd, check=check, capture_output=capture_output, text=True, bufsize=-1
         )  # nosec B603 - cmd is always a list with explicit args, no shell
-        return True, result.stdout if capture_output else ""
     except subprocess.CalledProcessError as e:
         if capture_output:
             return False, e.stderr or e.stdout or str(e)
         return False, str(e)
 
+    if result.returncode != 0:
+        return False, (result.stderr or result.stdout or "") if capture_output else ""
+    return True, result.stdout if capture_output else ""
 
-def check_prerequisites() -> bool:
-    """Check if all prerequisites are met."""
-    print_header("Checking Prerequisites")
 
-    # Check required environment variables
-    required_env_vars = {
-        "AWS_ACCOUNT_ID": AWS_ACCOUNT_ID,
-        "CLOUDFRONT_DISTRIBUTION_ID": CLOUDFRONT_DISTRIBUTION_ID,
-        "ACM_CERTIFICATE_ID": ACM_CERTIFICATE_ID,
+_session_lock = threading.Lock()
+
+
+@cache
+def _session() -> "boto3.Session":
+    """Return the boto3 session shared by every AWS call in this script."""
+    return boto3.Session()
+
+
+@cache
+def aws_client(service: str, region_name: str | None = None) -> Any:
+    """Get or create a boto3 client on the shared session.
+
+    Clients are thread-safe once built, but building them from a shared
+    session is not, so construction is serialized.
+
+    Args:
+        service: AWS service name (e.g., "s3")
+        region_name: Region override (e.g., "us-east-1" for ACM/CloudFront certs)
+
+    Returns:
+        boto3 client instance
+    """
+    with _session_lock:
+        return _session().client(service, region_name=region_name)
+
+
+def aws_probe(call: Callable[[], object]) -> bool | None:
+    """Run an AWS API call and report whether it succeeded.
+
+    Args:
+        call: Zero-argument callable performing the API request
+
+    Returns:
+        True if the call succeeded, None if access was denied (existence
+        unknown), False for any other client/botocore error
+    """
+    try:
+        call()
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "Unknown")
+        if error_code in ("AccessDenied", "AccessDeniedException"):
+            return None
+        return False
+    except BotoCoreError:
+        return False
+    return True
+
+
+def stream_command(cmd: list[str], cwd: Path | None = None) -> int:
+    """Run a command, echoing its output line by line as it is produced.
+
+    stderr is merged into stdout. Nothing is retained in memory.
+
+    Args:
+        cmd: Command and arguments as list
+        cwd: Working directory
+
+    Returns:
+        The command's exit code
+    """
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    ) as proc:  # nosec B603 - cmd is always a list with explicit args, no shell
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(line)
+    return proc.returncode
+
+
+def _import_cache_fingerprint() -> dict[str, str | None]:
+    """Identify the resources and credentials a cached result belongs to."""
+    access_key_id = os.getenv("AWS_ACCESS_KEY_ID", "")
+    return {
+        "s3_bucket": S3_BUCKET_NAME,
+        "cloudfront": CLOUDFRONT_DISTRIBUTION_ID,
+        "acm": ACM_CERTIFICATE_ARN,
+        "iam_user": IAM_USER_NAME,
+        # Hashed so the cache file never holds the key ID itself
+        "credentials": hashlib.sha256(access_key_id.encode()).hexdigest()[:16],
     }
 
-    missing_vars = [var for var, value in required_env_vars.items() if not value]
+
+def load_cached(section: str, ttl: float) -> dict[str, Any] | None:
+    """Load a section of the import cache if it is fresh.
+
+    Args:
+        section: Cache section name (e.g., "existence")
+        ttl: Maximum age in seconds
+
+    Returns:
+        Cached section, or None if missing, stale, or for other resources
+    """
+    try:
+        data = json.loads(IMPORT_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("fingerprint") != _import_cache_fingerprint():
+        return None
+
+    entry: dict[str, Any] | None = data.get(section)
+    if entry is None or time.time() - entry.get("ts", 0) > ttl:
+        return None
+    return entry
+
+
+def save_cached(section: str, values: dict[str, Any]) -> None:
+    """Store a section of the import cache, timestamped now.
+
+    Args:
+        section: Cache section name (e.g., "existence")
+        values: JSON-serializable values to store
+    """
+    try:
+        data = json.loads(IMPORT_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = {}
+
+    fingerprint = _import_cache_fingerprint()
+    if data.get("fingerprint") != fingerprint:
+        data = {"fingerprint": fingerprint}
+    data[section] = {"ts": time.time(), **values}
+
+    try:
+        IMPORT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        IMPORT_CACHE_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    except OSError as e:
+        log.warning(f"Could not write cache {IMPORT_CACHE_FILE}: {e}")
+
+
+@cache
+def get_caller_arn(use_cache: bool = True) -> str:
+    """Return the ARN of the active AWS identity, fetched once per run.
+
+    Args:
+        use_cache: Reuse an ARN cached on disk within CALLER_ARN_CACHE_TTL
+
+    Raises:
+        ClientError / BotoCoreError: If the credentials cannot be verified
+    """
+    if use_cache:
+        cached = load_cached("caller_arn", CALLER_ARN_CACHE_TTL)
+        if cached is not None:
+            cached_arn: str = cached["arn"]
+            return cached_arn
+
+    arn: str = aws_client("sts").get_caller_identity()["Arn"]
+    save_cached("caller_arn", {"arn": arn})
+    return arn
+
+
+def check_prerequisites(use_cache: bool = True) -> bool:
+    """Check if all prerequisites are met."""
+    log_header("Checking Prerequisites")
+
+    # Check required environment variables
+    missing_vars = [var for var in _REQUIRED_ENV if not os.getenv(var)]
 
     if missing_vars:
-        print_error(f"Missing required environment variables: {', '.join(missing_vars)}")
-        print_info("Please export the following variables:")
+        log.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        print("Please export the following variables:")
         for var in missing_vars:
-            print_info(f'  export {var}="your-{var.lower().replace("_", "-")}"')
+            print(f'  export {var}="your-{var.lower().replace("_", "-")}"')
         return False
 
     # Type assertions for mypy (variables validated above)
@@ -157,96 +475,124 @@ def check_prerequisites() -> bool:
 
     # Check AWS credentials
     if not os.getenv("AWS_ACCESS_KEY_ID") or not os.getenv("AWS_SECRET_ACCESS_KEY"):
-        print_error("AWS credentials not set!")
+        log.error("AWS credentials not set!")
         print("Please export AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
         return False
-    print_success("AWS credentials found")
+    log.info("AWS credentials found")
 
-    # Check Terraform installed
-    success, output = run_command(["terraform", "version"], check=False)
-    if not success:
-        print_error("Terraform not installed!")
+    # Check Terraform installed (PATH lookup only, no process spawned)
+    terraform_path = shutil.which("terraform")
+    if terraform_path is None:
+        log.error("Terraform not installed!")
         print("Install from: https://www.terraform.io/downloads")
         return False
-    version = output.split("\n")[0] if output else "unknown"
-    print_success(f"Terraform installed: {version}")
-
-    # Check AWS CLI installed
-    success, output = run_command(["aws", "--version"], check=False)
-    if not success:
-        print_error("AWS CLI not installed!")
-        print("Install from: https://aws.amazon.com/cli/")
-        return False
-    print_success(f"AWS CLI installed: {output.strip()}")
+    log.info(f"Terraform installed: {terraform_path}")
 
     # Verify AWS credentials work
-    success, output = run_command(
-        ["aws", "sts", "get-caller-identity", "--query", "Arn", "--output", "text"], check=False
-    )
-    if not success:
-        print_error("AWS credentials invalid!")
+    try:
+        arn = get_caller_arn(use_cache)
+    except (ClientError, BotoCoreError):
+        log.error("AWS credentials invalid!")
         return False
-    print_success(f"AWS identity verified: {output.strip()}")
+    log.info(f"AWS identity verified: {arn}")
 
     return True
 
 
-def verify_resources_exist() -> bool:
-    """Verify that all resources exist in AWS."""
+def verify_resources_exist(use_cache: bool = True) -> dict[str, bool]:
+    """Verify that all resources exist in AWS.
+
+    The four probes are independent, so they run concurrently and the results
+    are reported afterwards in a fixed order. A successful check is cached on
+    disk for EXISTENCE_CACHE_TTL seconds.
+
+    Args:
+        use_cache: Reuse a fresh cached result instead of probing AWS
+
+    Returns:
+        Existence per logical resource ("s3_bucket", "cloudfront", "acm",
+        "iam_user"). Resources that could not be checked for lack of
+        permission are reported as existing so their imports are attempted.
+    """
     # Type assertions for mypy
     assert CLOUDFRONT_DISTRIBUTION_ID is not None
     assert ACM_CERTIFICATE_ARN is not None
 
-    print_header("Verifying Existing Resources")
+    log_header("Verifying Existing Resources")
+
+    if use_cache:
+        cached = load_cached("existence", EXISTENCE_CACHE_TTL)
+        if cached is not None:
+            log.info("Using cached existence check (pass --no-cache to re-verify)")
+            return {key: bool(cached[key]) for key in (*REQUIRED_RESOURCES, "iam_user")}
+
+    s3 = aws_client("s3")
+    cloudfront = aws_client("cloudfront")
+    acm = aws_client("acm", region_name="us-east-1")
+    iam = aws_client("iam")
+
+    # (key, label, resource id, probe)
+    probes: list[tuple[str, str, str, Callable[[], object]]] = [
+        # HeadBucket: a bodiless HEAD request, unlike listing the bucket's objects
+        ("s3_bucket", "S3 bucket", S3_BUCKET_NAME, lambda: s3.head_bucket(Bucket=S3_BUCKET_NAME)),
+        (
+            "cloudfront",
+            "CloudFront distribution",
+            CLOUDFRONT_DISTRIBUTION_ID,
+            lambda: cloudfront.get_distribution(Id=CLOUDFRONT_DISTRIBUTION_ID),
+        ),
+        (
+            "acm",
+            "ACM certificate",
+            ACM_CERTIFICATE_ID or "",
+            lambda: acm.describe_certificate(CertificateArn=ACM_CERTIFICATE_ARN),
+        ),
+        ("iam_user", "IAM user", IAM_USER_NAME, lambda: iam.get_user(UserName=IAM_USER_NAME)),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        results = list(executor.map(lambda probe: aws_probe(probe[3]), probes))
+
+    existence: dict[str, bool] = {}
+
+    for (key, label, resource_id, _), result in zip(probes, results, strict=True):
+        existence[key] = result is not False
+        if result:
+            log.info(f"{label} exists: {resource_id}")
+        elif result is None:
+            log.warning(f"No permission to check {label}: {resource_id}")
+            log.debug("Will attempt import anyway (may need admin credentials later)")
+        elif key in REQUIRED_RESOURCES:
+            log.error(f"{label} not found: {resource_id}")
+        else:
+            log.warning(f"{label} not found: {resource_id} (its imports will be skipped)")
 
-    all_exist = True
+    if all(existence[key] for key in REQUIRED_RESOURCES):
+        save_cached("existence", existence)
 
-    # Check S3 bucket
-    success, _ = run_command(["aws", "s3", "ls", f"s3://{S3_BUCKET_NAME}"], check=False)
-    if success:
-        print_success(f"S3 bucket exists: {S3_BUCKET_NAME}")
-    else:
-        print_error(f"S3 bucket not found: {S3_BUCKET_NAME}")
-        all_exist = False
+    return existence
 
-    # Check CloudFront distribution
-    success, _ = run_command(
-        ["aws", "cloudfront", "get-distribution", "--id", CLOUDFRONT_DISTRIBUTION_ID], check=False
-    )
-    if success:
-        print_success(f"CloudFront distribution exists: {CLOUDFRONT_DISTRIBUTION_ID}")
-    else:
-        print_error(f"CloudFront distribution not found: {CLOUDFRONT_DISTRIBUTION_ID}")
-        all_exist = False
 
-    # Check ACM certificate
-    success, _ = run_command(
-        [
-            "aws",
-            "acm",
-            "describe-certificate",
-            "--certificate-arn",
-            ACM_CERTIFICATE_ARN,
-            "--region",
-            "us-east-1",
-        ],
-        check=False,
-    )
-    if success:
-        print_success(f"ACM certificate exists: {ACM_CERTIFICATE_ID}")
-    else:
-        print_error(f"ACM certificate not found: {ACM_CERTIFICATE_ID}")
-        all_exist = False
+def select_existing(
+    resources_by_key: dict[str, list[ImportSpec]], existence: dict[str, bool]
+) -> list[ImportSpec]:
+    """Drop imports whose underlying AWS resource is known not to exist.
 
-    # Check IAM user
-    success, _ = run_command(["aws", "iam", "get-user", "--user-name", IAM_USER_NAME], check=False)
-    if success:
-        print_success(f"IAM user exists: {IAM_USER_NAME}")
-    else:
-        print_warning(f"IAM user not found or no permission to check: {IAM_USER_NAME}")
-        print_info("Will attempt import anyway (may need admin credentials later)")
+    Args:
+        resources_by_key: Imports grouped by the logical resource they depend on
+        existence: Result of verify_resources_exist()
 
-    return all_exist
+    Returns:
+        Imports to attempt, in their original order
+    """
+    selected: list[ImportSpec] = []
+    for key, resources in resources_by_key.items():
+        if not existence.get(key, True):
+            for resource_type, resource_name, _ in resources:
+                log.warning(f"Skipping {resource_type}.{resource_name} (resource not found)")
+            continue
+        selected.extend(resources)
+    return selected
 
 
 def terraform_import(resource_type: str, resource_name: str, resource_id: str, cwd: Path) -> bool:
@@ -262,99 +608,275 @@ def terraform_import(resource_type: str, resource_name: str, resource_id: str, c
         True if import succeeded
     """
     resource_address = f"{resource_type}.{resource_name}"
-    print_info(f"Importing {resource_address}...")
+    log.debug(f"Importing {resource_address}...")
 
     success, output = run_command(
         ["terraform", "import", resource_address, resource_id], cwd=cwd, check=False
     )
 
     if success or "Import successful" in output:
-        print_success(f"{resource_address} imported")
+        log.info(f"{resource_address} imported")
         return True
     elif "already managed" in output.lower() or "already exists" in output.lower():
-        print_warning(f"{resource_address} already imported")
+        log.warning(f"{resource_address} already imported")
         return True
     else:
-        print_warning(f"{resource_address} import failed (may not exist or already imported)")
+        log.warning(f"{resource_address} import failed (may not exist or already imported)")
         return False
 
 
-def import_infrastructure_resources(terraform_dir: Path) -> None:
-    """Import infrastructure resources (S3, CloudFront, ACM)."""
-    # Type assertions for mypy
-    assert CLOUDFRONT_DISTRIBUTION_ID is not None
-    assert ACM_CERTIFICATE_ARN is not None
+def render_import_blocks(resources: list[ImportSpec]) -> str:
+    """Render Terraform `import` blocks for a list of resources.
 
-    print_header("Importing Infrastructure Resources")
+    Args:
+        resources: Resources to import
 
-    infra_dir = terraform_dir / "infrastructure"
+    Returns:
+        HCL source for an imports.tf file
+    """
+    blocks = [
+        # json.dumps yields a valid HCL string literal (quotes and escapes)
+        f"import {{\n  to = {resource_type}.{resource_name}\n  id = {json.dumps(resource_id)}\n}}\n"
+        for resource_type, resource_name, resource_id in resources
+    ]
+    return "\n".join(blocks)
 
-    # Initialize Terraform
-    print_info("Initializing Terraform...")
-    success, _ = run_command(["terraform", "init"], cwd=infra_dir)
-    if not success:
-        print_error("Terraform init failed!")
-        return
-    print_success("Terraform initialized")
 
-    # Import S3 bucket
-    terraform_import("aws_s3_bucket", "music", S3_BUCKET_NAME, infra_dir)
+def terraform_import_batch(resources: list[ImportSpec], cwd: Path) -> bool:
+    """Import several resources into Terraform state with a single plan/apply.
 
-    # Import S3 bucket versioning
-    terraform_import("aws_s3_bucket_versioning", "music", S3_BUCKET_NAME, infra_dir)
+    Writes an imports.tf file of `import` blocks, plans once (targeted at the
+    imported resources only), reports what the plan will import, and applies
+    the saved plan. If the plan would also create, modify or destroy any
+    resource, including ones outside the import set, the apply waits for
+    confirmation. imports.tf is removed afterwards, unless that confirmation
+    is declined and it is left for review.
 
-    # Import S3 bucket encryption
-    terraform_import(
-        "aws_s3_bucket_server_side_encryption_configuration", "music", S3_BUCKET_NAME, infra_dir
-    )
+    Args:
+        resources: Resources to import
+        cwd: Terraform working directory
+
+    Returns:
+        True if the imports were applied (or nothing needed importing)
+    """
+    imports_file = cwd / IMPORTS_FILE
+    plan_file = cwd / IMPORT_PLAN_FILE
+
+    addresses = [
+        f"{resource_type}.{resource_name}" for resource_type, resource_name, _ in resources
+    ]
+
+    imports_file.write_text(render_import_blocks(resources), encoding="utf-8")
+    keep_imports_file = False
+
+    try:
+        log.debug(f"Planning import of {len(resources)} resources...")
+        # Targeting keeps unrelated drift in the configuration out of the apply
+        success, output = run_command(
+            [
+                "terraform",
+                "plan",
+                "-input=false",
+                "-no-color",
+                f"-out={IMPORT_PLAN_FILE}",
+                *(f"-target={resource_address}" for resource_address in addresses),
+            ],
+            cwd=cwd,
+            check=False,
+        )
+        if not success:
+            log.error("Terraform import plan failed!")
+            print(output)
+            return False
+
+        success, output = run_command(
+            ["terraform", "show", "-json", IMPORT_PLAN_FILE], cwd=cwd, check=False
+        )
+        if not success:
+            log.error("Could not read the import plan!")
+            print(output)
+            return False
+
+        changes = {
+            change["address"]: change["change"]
+            for change in json.loads(output).get("resource_changes", [])
+        }
+
+        importing: list[str] = []
+        modifying: list[str] = []
+        for resource_address in addresses:
+            change = changes.get(resource_address)
+            if change is None or "importing" not in change:
+                log.warning(f"{resource_address} already imported")
+                continue
+            importing.append(resource_address)
+            if change.get("actions") != ["no-op"]:
+                modifying.append(resource_address)
+
+        # Targets can still pull in dependencies; never apply those silently
+        imported = set(importing)
+        modifying.extend(
+            resource_address
+            for resource_address, change in changes.items()
+            if resource_address not in imported and change.get("actions", ["no-op"]) != ["no-op"]
+        )
+
+        if not importing:
+            return True
+
+        if modifying:
+            log.warning("Applying this import will also modify:")
+            for resource_address in modifying:
+                print(f"  - {resource_address}")
+            response = ask("Apply the import plan anyway? (y/n) ")
+            if response.lower() != "y":
+                log.warning(f"Import not applied. Review {IMPORTS_FILE} and plan manually.")
+                keep_imports_file = True
+                return False
+
+        success, output = run_command(
+            ["terraform", "apply", "-input=false", "-no-color", IMPORT_PLAN_FILE],
+            cwd=cwd,
+            check=False,
+        )
+        if not success:
+            log.error("Terraform import apply failed!")
+            print(output)
+            return False
 
-    # Import S3 bucket public access block
-    terraform_import("aws_s3_bucket_public_access_block", "music", S3_BUCKET_NAME, infra_dir)
+        for resource_address in importing:
+            log.info(f"{resource_address} imported")
 
-    # Import S3 bucket policy
-    terraform_import("aws_s3_bucket_policy", "music", S3_BUCKET_NAME, infra_dir)
+        return True
+    finally:
+        plan_file.unlink(missing_ok=True)
+        # A leftover imports.tf would show up in the verification plan
+        if not keep_imports_file:
+            imports_file.unlink(missing_ok=True)
 
-    # Import CloudFront distribution
-    print_warning("CloudFront import may take a few minutes...")
-    terraform_import("aws_cloudfront_distribution", "cdn", CLOUDFRONT_DISTRIBUTION_ID, infra_dir)
 
-    # Import ACM certificate
-    terraform_import("aws_acm_certificate", "cert", ACM_CERTIFICATE_ARN, infra_dir)
+# The plugin cache is not safe for concurrent use, so inits run one at a time
+_init_lock = threading.Lock()
 
 
-def import_bootstrap_resources(terraform_dir: Path) -> None:
-    """Import bootstrap resources (IAM)."""
-    print_header("Importing Bootstrap Resources (IAM)")
+def terraform_init(cwd: Path) -> bool:
+    """Run `terraform init` in a working directory.
 
-    print_warning("IAM imports require terraform-admin credentials!")
-    success, output = run_command(
-        ["aws", "sts", "get-caller-identity", "--query", "Arn", "--output", "text"], check=False
+    The two import phases run concurrently but share TF_PLUGIN_CACHE_DIR,
+    which Terraform doesn't support writing to from two inits at once.
+
+    Args:
+        cwd: Terraform working directory
+
+    Returns:
+        True if init succeeded
+    """
+    log.debug("Initializing Terraform...")
+    with _init_lock:
+        success, _ = run_command(["terraform", "init"], cwd=cwd, discard_output=True)
+    if not success:
+        log.error("Terraform init failed!")
+        return False
+    log.info("Terraform initialized")
+    return True
+
+
+def import_resources(resources: list[ImportSpec], cwd: Path, legacy: bool = False) -> bool:
+    """Import resources using either the batched or the per-resource path.
+
+    Args:
+        resources: Resources to import
+        cwd: Terraform working directory
+        legacy: Run one `terraform import` per resource instead of a single plan
+
+    Returns:
+        True if every resource was imported
+    """
+    if not legacy:
+        return terraform_import_batch(resources, cwd)
+
+    results = [
+        terraform_import(resource_type, resource_name, resource_id, cwd)
+        for resource_type, resource_name, resource_id in resources
+    ]
+    return all(results)
+
+
+def import_infrastructure_resources(
+    infra_dir: Path, existence: dict[str, bool], legacy: bool = False
+) -> bool:
+    """Import infrastructure resources (S3, CloudFront, ACM).
+
+    Returns:
+        True if every existing resource was imported
+    """
+    # Type assertions for mypy
+    assert CLOUDFRONT_DISTRIBUTION_ID is not None
+    assert ACM_CERTIFICATE_ARN is not None
+
+    log_header("Importing Infrastructure Resources")
+
+    resources = select_existing(
+        {
+            # S3 bucket and its configuration
+            "s3_bucket": [
+                ("aws_s3_bucket", "music", S3_BUCKET_NAME),
+                ("aws_s3_bucket_versioning", "music", S3_BUCKET_NAME),
+                ("aws_s3_bucket_server_side_encryption_configuration", "music", S3_BUCKET_NAME),
+                ("aws_s3_bucket_public_access_block", "music", S3_BUCKET_NAME),
+                ("aws_s3_bucket_policy", "music", S3_BUCKET_NAME),
+            ],
+            # CloudFront distribution
+            "cloudfront": [("aws_cloudfront_distribution", "cdn", CLOUDFRONT_DISTRIBUTION_ID)],
+            # ACM certificate
+            "acm": [("aws_acm_certificate", "cert", ACM_CERTIFICATE_ARN)],
+        },
+        existence,
     )
-    if success:
-        print_info(f"Current credentials: {output.strip()}")
+    if not resources:
+        return True
+
+    # Initialize Terraform
+    if not terraform_init(infra_dir):
+        return False
+
+    log.warning("CloudFront import may take a few minutes...")
+    return import_resources(resources, infra_dir, legacy)
+
 
-    response = input("Do you have terraform-admin credentials active? (y/n) ")
+def confirm_admin_credentials(use_cache: bool = True) -> bool:
+    """Ask whether terraform-admin credentials are active for the IAM imports.
+
+    Args:
+        use_cache: Reuse a caller ARN cached on disk instead of asking STS
+    """
+    log.warning("IAM imports require terraform-admin credentials!")
+    with contextlib.suppress(ClientError, BotoCoreError):
+        log.info(f"Current credentials: {get_caller_arn(use_cache)}")
+
+    response = ask("Do you have terraform-admin credentials active? (y/n) ")
     if response.lower() != "y":
-        print_warning("Skipping IAM imports. Run this section manually with admin credentials.")
-        return
+        log.warning("Skipping IAM imports. Run this section manually with admin credentials.")
+        return False
+    return True
 
-    bootstrap_dir = terraform_dir / "bootstrap"
 
-    # Initialize Terraform
-    print_info("Initializing Terraform...")
-    success, _ = run_command(["terraform", "init"], cwd=bootstrap_dir)
-    if not success:
-        print_error("Terraform init failed!")
-        return
-    print_success("Terraform initialized")
+def import_bootstrap_resources(
+    bootstrap_dir: Path, existence: dict[str, bool], legacy: bool = False
+) -> bool:
+    """Import bootstrap resources (IAM).
+
+    Expects confirm_admin_credentials() to have been answered beforehand.
 
-    # Import IAM user
-    terraform_import("aws_iam_user", "deployer", IAM_USER_NAME, bootstrap_dir)
+    Returns:
+        True if every existing resource was imported
+    """
+    log_header("Importing Bootstrap Resources (IAM)")
 
-    # Import AWS managed policy attachments
-    print_info("Importing AWS managed policy attachments...")
+    # IAM user
+    iam_resources: list[ImportSpec] = [("aws_iam_user", "deployer", IAM_USER_NAME)]
 
-    # List of AWS managed policies to import
+    # AWS managed policy attachments
     aws_managed_policies = {
         "s3_full_access": "arn:aws:iam::aws:policy/AmazonS3FullAccess",
         "cloudfront_full_access": "arn:aws:iam::aws:policy/CloudFrontFullAccess",
@@ -365,79 +887,217 @@ def import_bootstrap_resources(terraform_dir: Path) -> None:
     for resource_name, policy_arn in aws_managed_policies.items():
         # Import format: username/policy-arn
         attachment_id = f"{IAM_USER_NAME}/{policy_arn}"
-        terraform_import(
-            "aws_iam_user_policy_attachment", resource_name, attachment_id, bootstrap_dir
-        )
+        iam_resources.append(("aws_iam_user_policy_attachment", resource_name, attachment_id))
 
+    resources = select_existing({"iam_user": iam_resources}, existence)
+    if not resources:
+        return True
 
-def verify_import(terraform_dir: Path) -> None:
-    """Verify imports by running terraform plan."""
-    print_header("Verifying Imports")
+    # Initialize Terraform
+    if not terraform_init(bootstrap_dir):
+        return False
 
-    infra_dir = terraform_dir / "infrastructure"
+    return import_resources(resources, bootstrap_dir, legacy)
 
-    print_info("Running terraform plan to check for drift...")
+
+def verify_import(infra_dir: Path) -> None:
+    """Verify imports by running terraform plan."""
+    log_header("Verifying Imports")
+
+    log.debug("Running terraform plan to check for drift...")
     print()
 
-    success, output = run_command(["terraform", "plan", "-no-color"], cwd=infra_dir, check=False)
+    # Streamed: the plan is echoed as Terraform produces it. With
+    # -detailed-exitcode, 0 = no changes, 1 = error, 2 = changes present.
+    returncode = stream_command(
+        [
+            "terraform",
+            "plan",
+            "-input=false",
+            "-no-color",
+            "-detailed-exitcode",
+            f"-out={DRIFT_PLAN_FILE}",
+        ],
+        cwd=infra_dir,
+    )
+    print()
 
-    if success:
-        if "No changes" in output:
-            print_success("Perfect! Infrastructure matches Terraform configuration.")
-        else:
-            print_warning("Configuration drift detected!")
-            print()
-            print(output)
+    try:
+        if returncode == 0:
+            log.info("Perfect! Infrastructure matches Terraform configuration.")
+        elif returncode == 2:
+            log.warning("Configuration drift detected!")
+            success, output = run_command(
+                ["terraform", "show", "-json", DRIFT_PLAN_FILE], cwd=infra_dir, check=False
+            )
+            if success:
+                for resource_change in json.loads(output).get("resource_changes", []):
+                    actions = resource_change["change"]["actions"]
+                    if actions != ["no-op"]:
+                        print(f"  - {resource_change['address']}: {', '.join(actions)}")
             print()
-            print_info("Next steps:")
+            print("Next steps:")
             print("  1. Review the plan output above")
             print("  2. Update main.tf to match AWS reality, OR")
             print("  3. Run 'terraform apply' to update AWS to match Terraform")
-    else:
-        print_error("Terraform plan failed!")
-        print(output)
+        else:
+            log.error("Terraform plan failed!")
+    finally:
+        (infra_dir / DRIFT_PLAN_FILE).unlink(missing_ok=True)
+
+
+def configure_terraform_env() -> None:
+    """Configure Terraform for non-interactive runs with a shared plugin cache.
+
+    Existing values in the environment take precedence. Inits using the cache
+    are serialized by terraform_init().
+    """
+    plugin_cache_dir = os.environ.setdefault("TF_PLUGIN_CACHE_DIR", str(TF_PLUGIN_CACHE_DIR))
+    Path(plugin_cache_dir).mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("TF_IN_AUTOMATION", "1")
+    os.environ.setdefault("TF_CLI_ARGS_init", "-input=false -lock-timeout=30s")
+
+
+def run_phase(
+    phase: Callable[..., bool], *args: object, **kwargs: object
+) -> tuple[str, bool, Exception | None]:
+    """Run an import phase with its output captured.
+
+    Returns:
+        Tuple of (everything the phase printed, whether it succeeded,
+        the exception it raised or None)
+    """
+    with capture_phase_output() as buffer:
+        try:
+            succeeded = phase(*args, **kwargs)
+        except Exception as e:
+            # Returned with the output, so a failing phase's log is still printed
+            return buffer.getvalue(), False, e
+    return buffer.getvalue(), succeeded, None
+
+
+def run_import_phases(
+    infra_dir: Path,
+    bootstrap_dir: Path,
+    existence: dict[str, bool],
+    legacy: bool = False,
+    use_cache: bool = True,
+) -> bool:
+    """Run the infrastructure and bootstrap import phases concurrently.
+
+    The phases use separate Terraform working directories and state files, so
+    they are independent. Their logs are printed in phase order once done,
+    including a failed phase's, before its exception is re-raised.
 
+    Returns:
+        True if every phase that ran imported all of its resources
+    """
+    include_bootstrap = confirm_admin_credentials(use_cache)
 
-def main() -> int:
+    results: list[tuple[str, bool, Exception | None]] = []
+    original_stdout = sys.stdout
+    sys.stdout = _ThreadRoutedStdout(original_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    run_phase,
+                    import_infrastructure_resources,
+                    infra_dir,
+                    existence,
+                    legacy=legacy,
+                )
+            ]
+            if include_bootstrap:
+                futures.append(
+                    executor.submit(
+                        run_phase,
+                        import_bootstrap_resources,
+                        bootstrap_dir,
+                        existence,
+                        legacy=legacy,
+                    )
+                )
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = original_stdout
+        for output, _, _ in results:
+            print(output, end="")
+
+    for _, _, error in results:
+        if error is not None:
+            raise error
+
+    return all(succeeded for _, succeeded, _ in results)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Import existing AWS resources into Terraform state"
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Run one `terraform import` per resource instead of a single import plan",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help=f"Ignore cached AWS lookups in {IMPORT_CACHE_FILE}",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
     """Main execution function."""
-    print_header("Terraform Import Script")
+    args = parse_args(argv)
+    configure_terraform_env()
+
+    log_header("Terraform Import Script")
     print("This script will import your existing AWS resources into Terraform state.")
     print()
-    print_warning("IMPORTANT: Make sure you've written Terraform code matching your resources!")
+    log.warning("IMPORTANT: Make sure you've written Terraform code matching your resources!")
     print()
 
-    response = input("Continue? (y/n) ")
+    response = ask("Continue? (y/n) ")
     if response.lower() != "y":
         print("Aborted.")
         return 0
 
     # Check prerequisites
-    if not check_prerequisites():
+    if not check_prerequisites(args.use_cache):
         return 1
 
     # Verify resources exist
-    if not verify_resources_exist():
-        print_error("Some resources don't exist. Please verify resource IDs in the script.")
+    existence = verify_resources_exist(args.use_cache)
+    if not all(existence[key] for key in REQUIRED_RESOURCES):
+        log.error("Some resources don't exist. Please verify resource IDs in the script.")
         return 1
 
-    print_header("Starting Import Process")
+    log_header("Starting Import Process")
 
-    # Get terraform directory
-    script_dir = Path(__file__).parent
+    # Resolve the Terraform directories once (every Terraform command is given
+    # its own cwd, so the process working directory is never changed)
+    script_dir = Path(__file__).resolve().parent
     terraform_dir = script_dir.parent
-
-    # Change to terraform directory
-    os.chdir(terraform_dir)
+    assert terraform_dir.is_dir(), f"Terraform directory not found: {terraform_dir}"
+    infra_dir = terraform_dir / "infrastructure"
+    bootstrap_dir = terraform_dir / "bootstrap"
 
     # Import resources
-    import_infrastructure_resources(terraform_dir)
-    import_bootstrap_resources(terraform_dir)
-    verify_import(terraform_dir)
+    if not run_import_phases(
+        infra_dir, bootstrap_dir, existence, legacy=args.legacy, use_cache=args.use_cache
+    ):
+        log.error("Some resources were not imported. Fix the errors above and re-run.")
+        return 1
+    verify_import(infra_dir)
 
-    print_header("Import Complete!")
-    print_success("All resources have been imported into Terraform state")
+    log_header("Import Complete!")
+    log.info("All resources have been imported into Terraform state")
     print()
-    print_info("Next steps:")
+    print("Next steps:")
     print("  1. Review terraform plan output above")
     print("  2. Fix any configuration drift in main.tf")
     print("  3. Run 'terraform plan' until it shows 'No changes'")
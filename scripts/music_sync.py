@@ -3,19 +3,22 @@
 
 Usage:
   music_sync.py sanitize [--dry-run] [--path=<dir>]
-  music_sync.py extract-covers [--dry-run] [--with-thumbs] [--thumb-format=<fmt>] [--path=<dir>]
+  music_sync.py extract-covers [--dry-run] [--with-thumbs] [--thumb-format=<fmt>] [--jobs=<n>]
+                               [--path=<dir>]
   music_sync.py extract-metadata [--output=<dir>] [--path=<dir>]
   music_sync.py build-metadata [--dry-run] [--output=<dir>] [--path=<dir>]
-  music_sync.py prepare [--dry-run] [--with-thumbs] [--thumb-format=<fmt>] [--path=<dir>]
-  music_sync.py upload albums [--dry-run] [--region=<region>] [--path=<dir>]
+  music_sync.py prepare [--dry-run] [--with-thumbs] [--thumb-format=<fmt>] [--jobs=<n>]
+                        [--path=<dir>]
+  music_sync.py upload albums [--dry-run] [--region=<region>] [--jobs=<n>] [--path=<dir>]
   music_sync.py upload covers [--dry-run] [--with-thumbs] [--region=<region>] [--path=<dir>]
   music_sync.py upload trackers [--dry-run] [--region=<region>] [--path=<dir>]
   music_sync.py upload metadata [--dry-run] [--region=<region>] [--path=<dir>]
-  music_sync.py upload-all [--dry-run] [--with-thumbs] [--region=<region>]
+  music_sync.py upload-all [--dry-run] [--with-thumbs] [--region=<region>] [--jobs=<n>]
                            [--path=<dir>]
   music_sync.py publish [--dry-run] [--with-thumbs] [--thumb-format=<fmt>]
-                        [--region=<region>] [--path=<dir>]
-  music_sync.py validate [--path=<dir>]
+                        [--region=<region>] [--jobs=<n>] [--path=<dir>]
+  music_sync.py rollback [--dry-run] [--region=<region>] [--path=<dir>]
+  music_sync.py validate [--remote] [--region=<region>] [--path=<dir>]
   music_sync.py (-h | --help)
   music_sync.py --version
 
@@ -31,6 +34,7 @@ Commands:
   upload metadata    Upload metadata JSON files to S3
   upload-all         Upload everything: albums → covers → trackers → metadata
   publish            Run full pipeline: prepare → upload-all
+  rollback           Delete objects created by an interrupted upload-all/publish
   validate           Validate directory structure and file integrity
 
 Options:
@@ -40,6 +44,9 @@ Options:
   --region=<region>       AWS region for S3 [default: us-east-1]
   --path=<dir>            Base music directory [default: ./Music]
   --output=<dir>          Output directory for metadata (defaults to <path>/metadata)
+  --remote                Also compare local albums against the S3 bucket
+  --jobs=<n>              Parallel workers; 0 picks the CPU count for cover
+                          extraction and 32 for uploads [default: 0]
   -h --help               Show this screen
   --version               Show version
 
@@ -69,70 +76,136 @@ Examples:
   music_sync.py publish --with-thumbs --dry-run
   music_sync.py publish --with-thumbs
 
+  # Undo the new uploads of an interrupted publish
+  music_sync.py rollback --dry-run
+  music_sync.py rollback
+
   # Validate directory structure
   music_sync.py validate
+
+  # Validate and check which MP3s are missing from S3
+  music_sync.py validate --remote
 """
 
+import asyncio
+import io
+import multiprocessing
+import os
 import sys
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from multiprocessing.context import BaseContext
 from pathlib import Path
+from typing import Any
 
 from docopt import docopt
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from utils.cache_utils import flush_cache
 from utils.config import Config, load_config
 from utils.file_utils import (
-    get_album_directories,
-    remove_system_files,
-    sanitize_directory,
-)
-from utils.image_utils import process_album_covers
-from utils.manifest_utils import (
-    scan_and_build_manifests,
-    write_all_manifests,
-)
-from utils.upload_utils import (
-    get_s3_client,
-    upload_album,
-    upload_all,
-    upload_covers,
-    upload_metadata,
-    upload_trackers,
+    clean_and_sanitize,
+    get_cached_album_directories,
+    iter_files,
 )
 
+# Image (PIL), manifest (mutagen) and upload (boto3) utilities are imported by
+# the commands that use them, so light commands like validate start quickly.
+
 __version__ = "3.0.0"
 
+# Albums uploaded concurrently (S3 uploads are network-bound)
+UPLOAD_WORKERS = 32
+
+# Section banners
+_BAR = "=" * 60
+_SUB = "-" * 60
+
 
 def cmd_sanitize(config: Config, dry_run: bool = False) -> None:
     """Sanitize filenames and remove system files."""
-    print("=" * 60)
+    print(_BAR)
     print("SANITIZING FILES AND DIRECTORIES")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print()
 
-    print("Step 1: Removing system files...")
-    stats = remove_system_files(config.base_path, dry_run=dry_run, verbose=True)
-    print(f"  Removed: {stats['removed']}, Errors: {stats['errors']}")
+    # One walk removes system files and renames everything else
+    print("Removing system files and sanitizing filenames...")
+    stats = clean_and_sanitize(config.base_path, dry_run=dry_run, verbose=True)
+    print(
+        f"  Removed: {stats['removed']}, Renamed: {stats['renamed']}, "
+        f"Skipped: {stats['skipped']}, Errors: {stats['errors']}",
+        flush=True,
+    )
 
-    print("\nStep 2: Sanitizing filenames...")
-    stats = sanitize_directory(config.base_path, dry_run=dry_run, verbose=True)
-    print(f"  Renamed: {stats['renamed']}, Skipped: {stats['skipped']}, Errors: {stats['errors']}")
+    # Renames invalidate any album directories listed earlier
+    config.album_dirs = None
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("SANITIZATION COMPLETE")
-    print("=" * 60)
+    print(_BAR)
+
+
+def _extract_one(
+    album_dir: Path,
+    config: Config,
+    with_thumbs: bool,
+    thumb_format: str,
+    dry_run: bool,
+) -> tuple[dict[str, Any], str]:
+    """Process cover art for one album, capturing its progress output.
+
+    Runs in a worker process; output is buffered so albums don't interleave.
+
+    Returns:
+        Tuple of (process_album_covers result, captured output)
+    """
+    from utils.image_utils import process_album_covers
+
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        print(f"Processing: {album_dir.name}")
+        result = process_album_covers(
+            album_dir.name,
+            album_dir,
+            config,
+            with_thumbs=with_thumbs,
+            thumb_format=thumb_format,
+            dry_run=dry_run,
+            verbose=True,
+        )
+    return result, buffer.getvalue()
+
+
+def _worker_context() -> BaseContext | None:
+    """Get the start method for cover extraction worker processes.
+
+    publish extracts covers while boto3 upload threads are running; forking
+    a process in that state can copy locks held by those threads, so workers
+    are started from a clean forkserver process where one is available.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
 
 
 def cmd_extract_covers(
-    config: Config, dry_run: bool = False, with_thumbs: bool = False, thumb_format: str = "png"
+    config: Config,
+    dry_run: bool = False,
+    with_thumbs: bool = False,
+    thumb_format: str = "png",
+    jobs: int | None = None,
 ) -> None:
     """Extract embedded covers and generate thumbnails."""
-    print("=" * 60)
+    print(_BAR)
     print("EXTRACTING COVER ART")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print(f"Thumbnails: {'Yes' if with_thumbs else 'No'}")
@@ -140,41 +213,43 @@ def cmd_extract_covers(
         print(f"Thumbnail format: {thumb_format.upper()}")
     print()
 
-    album_dirs = get_album_directories(config)
+    album_dirs = get_cached_album_directories(config)
     total_covers = 0
     total_thumbs = 0
 
-    for album_dir in album_dirs:
-        album_name = album_dir.name
-        print(f"Processing: {album_name}")
-
-        result = process_album_covers(
-            album_name,
-            album_dir,
-            config,
-            with_thumbs=with_thumbs,
-            thumb_format=thumb_format,
-            dry_run=dry_run,
-            verbose=True,
-        )
-
-        if result.get("cover"):
-            total_covers += 1
-        if result.get("thumbnail"):
-            total_thumbs += 1
-
-    print("\n" + "=" * 60)
+    # Albums are independent, so thumbnailing (CPU-bound PIL work) runs in
+    # separate processes; each worker's output is printed as one block.
+    # Flush first so workers don't inherit (and re-emit) buffered output.
+    sys.stdout.flush()
+    with ProcessPoolExecutor(
+        max_workers=jobs or os.cpu_count(), mp_context=_worker_context()
+    ) as executor:
+        futures = [
+            executor.submit(_extract_one, album_dir, config, with_thumbs, thumb_format, dry_run)
+            for album_dir in album_dirs
+        ]
+
+        for future in as_completed(futures):
+            result, output = future.result()
+            print(output, end="", flush=True)
+
+            if result.get("cover"):
+                total_covers += 1
+            if result.get("thumbnail"):
+                total_thumbs += 1
+
+    print("\n" + _BAR)
     print("COVER EXTRACTION COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Covers: {total_covers}")
     print(f"  Thumbnails: {total_thumbs}")
 
 
 def cmd_extract_metadata(config: Config, output_dir: str | None = None) -> None:
     """Extract MP3 metadata locally (no upload)."""
-    print("=" * 60)
+    print(_BAR)
     print("EXTRACTING METADATA")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
 
     if output_dir:
@@ -193,9 +268,11 @@ def cmd_build_metadata(
     config: Config, dry_run: bool = False, output_dir: str | None = None
 ) -> None:
     """Build all manifest JSON files."""
-    print("=" * 60)
+    from utils.manifest_utils import scan_and_build_manifests, write_all_manifests
+
+    print(_BAR)
     print("BUILDING MANIFEST FILES")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
 
@@ -220,9 +297,12 @@ def cmd_build_metadata(
         check_changes=True,
     )
 
-    print("\n" + "=" * 60)
+    # Persist cache updates now rather than only at interpreter exit
+    flush_cache()
+
+    print("\n" + _BAR)
     print("MANIFEST BUILD COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Albums: {len(manifests['albums'])}")
     print(f"  Tracks: {len(manifests['tracks'])}")
     print(f"  Trackers: {len(manifests['trackers'])}")
@@ -233,43 +313,70 @@ def cmd_build_metadata(
         sys.exit(1)
 
 
-def cmd_upload_albums(config: Config, dry_run: bool = False, region: str | None = None) -> None:
+def cmd_upload_albums(
+    config: Config,
+    dry_run: bool = False,
+    region: str | None = None,
+    jobs: int | None = None,
+) -> None:
     """Upload album MP3s and trackers to S3."""
-    print("=" * 60)
+    from utils.upload_utils import get_s3_client, get_upload_cache, upload_album
+
+    region = region or config.s3_region
+    print(_BAR)
     print("UPLOADING ALBUMS TO S3")
-    print("=" * 60)
+    print(_BAR)
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print()
 
-    s3_client = get_s3_client(region or config.s3_region)
-    album_dirs = get_album_directories(config)
+    s3_client = get_s3_client(region)
+    album_dirs = get_cached_album_directories(config)
 
     total_mp3s = 0
     total_trackers = 0
     total_errors = 0
 
-    for album_dir in album_dirs:
-        album_name = album_dir.name
-        print(f"\nAlbum: {album_name}")
-
-        stats = upload_album(
-            album_dir,
-            album_name,
-            config,
-            s3_client,
-            dry_run=dry_run,
-            verbose=True,
-        )
+    # Load the upload cache before workers share it
+    get_upload_cache()
+
+    with ThreadPoolExecutor(max_workers=jobs or UPLOAD_WORKERS) as executor:
+        # Albums upload quietly; each one's errors are printed when it finishes
+        futures = {}
+        for album_dir in album_dirs:
+            album_errors: list[str] = []
+            future = executor.submit(
+                upload_album,
+                album_dir,
+                album_dir.name,
+                config,
+                s3_client,
+                dry_run=dry_run,
+                verbose=False,
+                errors=album_errors,
+            )
+            futures[future] = (album_dir.name, album_errors)
+
+        for future in as_completed(futures):
+            stats = future.result()
+            album_name, album_errors = futures[future]
+            print(
+                f"Album: {album_name} - {stats['mp3s']} MP3s, "
+                f"{stats['trackers']} trackers, {stats['skipped']} skipped, "
+                f"{stats['errors']} errors",
+                *album_errors,
+                sep="\n",
+                flush=True,
+            )
 
-        total_mp3s += stats["mp3s"]
-        total_trackers += stats["trackers"]
-        total_errors += stats["errors"]
+            total_mp3s += stats["mp3s"]
+            total_trackers += stats["trackers"]
+            total_errors += stats["errors"]
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("ALBUM UPLOAD COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  MP3s: {total_mp3s}")
     print(f"  Trackers: {total_trackers}")
     print(f"  Errors: {total_errors}")
@@ -282,16 +389,19 @@ def cmd_upload_covers(
     region: str | None = None,
 ) -> None:
     """Upload covers and thumbnails to S3."""
-    print("=" * 60)
+    from utils.upload_utils import get_s3_client, upload_covers
+
+    region = region or config.s3_region
+    print(_BAR)
     print("UPLOADING COVERS TO S3")
-    print("=" * 60)
+    print(_BAR)
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print(f"Thumbnails: {'Yes' if with_thumbs else 'No'}")
     print()
 
-    s3_client = get_s3_client(region or config.s3_region)
+    s3_client = get_s3_client(region)
 
     stats = upload_covers(
         config,
@@ -301,9 +411,9 @@ def cmd_upload_covers(
         verbose=True,
     )
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("COVER UPLOAD COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Covers: {stats['covers']}")
     print(f"  Thumbnails: {stats['thumbs']}")
     print(f"  Errors: {stats['errors']}")
@@ -311,15 +421,18 @@ def cmd_upload_covers(
 
 def cmd_upload_trackers(config: Config, dry_run: bool = False, region: str | None = None) -> None:
     """Upload tracker files to S3."""
-    print("=" * 60)
+    from utils.upload_utils import get_s3_client, upload_trackers
+
+    region = region or config.s3_region
+    print(_BAR)
     print("UPLOADING TRACKERS TO S3")
-    print("=" * 60)
+    print(_BAR)
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print()
 
-    s3_client = get_s3_client(region or config.s3_region)
+    s3_client = get_s3_client(region)
 
     stats = upload_trackers(
         config,
@@ -328,24 +441,27 @@ def cmd_upload_trackers(config: Config, dry_run: bool = False, region: str | Non
         verbose=True,
     )
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("TRACKER UPLOAD COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Trackers: {stats['trackers']}")
     print(f"  Errors: {stats['errors']}")
 
 
 def cmd_upload_metadata(config: Config, dry_run: bool = False, region: str | None = None) -> None:
     """Upload metadata JSON files to S3."""
-    print("=" * 60)
+    from utils.upload_utils import get_s3_client, upload_metadata
+
+    region = region or config.s3_region
+    print(_BAR)
     print("UPLOADING METADATA TO S3")
-    print("=" * 60)
+    print(_BAR)
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print()
 
-    s3_client = get_s3_client(region or config.s3_region)
+    s3_client = get_s3_client(region)
 
     stats = upload_metadata(
         config,
@@ -354,9 +470,9 @@ def cmd_upload_metadata(config: Config, dry_run: bool = False, region: str | Non
         verbose=True,
     )
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("METADATA UPLOAD COMPLETE")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Files: {stats['files']}")
     print(f"  Errors: {stats['errors']}")
 
@@ -366,11 +482,12 @@ def cmd_prepare(
     dry_run: bool = False,
     with_thumbs: bool = False,
     thumb_format: str = "png",
+    jobs: int | None = None,
 ) -> None:
     """Run all pre-upload steps: sanitize → extract → build manifests."""
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("PREPARE FOR UPLOAD")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print(f"Thumbnails: {'Yes' if with_thumbs else 'No'}")
@@ -379,26 +496,28 @@ def cmd_prepare(
     print()
 
     # Step 1: Sanitize
-    print("\n" + "-" * 60)
+    print("\n" + _SUB)
     print("STEP 1: SANITIZING FILES")
-    print("-" * 60)
+    print(_SUB)
     cmd_sanitize(config, dry_run=dry_run)
 
     # Step 2: Extract covers
-    print("\n" + "-" * 60)
+    print("\n" + _SUB)
     print("STEP 2: EXTRACTING COVERS")
-    print("-" * 60)
-    cmd_extract_covers(config, dry_run=dry_run, with_thumbs=with_thumbs, thumb_format=thumb_format)
+    print(_SUB)
+    cmd_extract_covers(
+        config, dry_run=dry_run, with_thumbs=with_thumbs, thumb_format=thumb_format, jobs=jobs
+    )
 
     # Step 3: Build manifests
-    print("\n" + "-" * 60)
+    print("\n" + _SUB)
     print("STEP 3: BUILDING MANIFESTS")
-    print("-" * 60)
+    print(_SUB)
     cmd_build_metadata(config, dry_run=dry_run)
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("PREPARATION COMPLETE!")
-    print("=" * 60)
+    print(_BAR)
     print("\nYour files are ready for upload.")
     print(f"Run 'music_sync.py upload-all{' --dry-run' if dry_run else ''}' to upload to S3.")
 
@@ -408,14 +527,18 @@ def cmd_upload_all(
     dry_run: bool = False,
     with_thumbs: bool = False,
     region: str | None = None,
+    jobs: int | None = None,
 ) -> None:
     """Upload everything to S3: albums → covers → trackers → metadata."""
-    print("\n" + "=" * 60)
+    from utils.upload_utils import upload_all
+
+    region = region or config.s3_region
+    print("\n" + _BAR)
     print("UPLOAD ALL TO S3")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print(f"Thumbnails: {'Yes' if with_thumbs else 'No'}")
     print()
@@ -425,11 +548,170 @@ def cmd_upload_all(
         with_thumbs=with_thumbs,
         dry_run=dry_run,
         verbose=True,
+        jobs=jobs or UPLOAD_WORKERS,
     )
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("UPLOAD COMPLETE!")
-    print("=" * 60)
+    print(_BAR)
+
+
+async def publish_pipeline(
+    config: Config,
+    dry_run: bool = False,
+    with_thumbs: bool = False,
+    thumb_format: str = "png",
+    region: str | None = None,
+    jobs: int | None = None,
+) -> dict[str, dict[str, int]]:
+    """Publish with uploads overlapping cover extraction and manifest builds.
+
+    Each step starts as soon as its inputs are ready:
+    - sanitize → album uploads → tracker uploads
+    - sanitize → extract covers → cover uploads
+    - sanitize → extract covers → build manifests → metadata upload, once the
+      album, tracker and cover uploads have finished (skipped if any of them failed)
+
+    Returns:
+        Dict with upload statistics by category
+    """
+    from utils.upload_utils import (
+        finish_upload_session,
+        get_s3_client,
+        get_upload_cache,
+        save_upload_cache,
+        start_upload_session,
+        upload_album,
+        upload_covers,
+        upload_metadata,
+        upload_trackers,
+    )
+
+    region = region or config.s3_region
+
+    # Sanitizing renames files, so it must finish before anything is uploaded
+    print("\n" + _SUB)
+    print("STEP 1: SANITIZING FILES")
+    print(_SUB)
+    cmd_sanitize(config, dry_run=dry_run)
+
+    s3_client = get_s3_client(region)
+    get_upload_cache()
+    upload_jobs = jobs or UPLOAD_WORKERS
+    semaphore = asyncio.Semaphore(upload_jobs)
+
+    # Room for every album upload plus the preparation and final upload steps
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=upload_jobs + 3))
+
+    # Journal uploads so an interrupted publish can resume
+    if not dry_run:
+        resumed = start_upload_session(config)
+        if resumed:
+            print(f"\nResuming interrupted upload ({resumed} files already uploaded)")
+
+    async def upload_one(album_dir: Path) -> dict[str, int]:
+        album_errors: list[str] = []
+        async with semaphore:
+            stats: dict[str, int] = await asyncio.to_thread(
+                upload_album,
+                album_dir,
+                album_dir.name,
+                config,
+                s3_client,
+                dry_run=dry_run,
+                verbose=False,
+                errors=album_errors,
+            )
+        # Uploads run quietly; report this album's failures once it is done
+        if album_errors:
+            print(f"Album: {album_dir.name} - {stats['errors']} errors", *album_errors, sep="\n")
+        return stats
+
+    async def upload_media() -> tuple[list[dict[str, int]], dict[str, int]]:
+        album_stats = await asyncio.gather(
+            *(upload_one(album_dir) for album_dir in get_cached_album_directories(config))
+        )
+        # Albums also write tracker/{album}/ keys; Trackers/ must upload after so its copy wins
+        trackers = await asyncio.to_thread(upload_trackers, config, s3_client, dry_run, False)
+        return album_stats, trackers
+
+    # Albums, then trackers, upload in the background from the start
+    media = asyncio.ensure_future(upload_media())
+
+    async def build_and_upload_metadata(
+        covers_upload: "asyncio.Future[dict[str, int]]",
+    ) -> dict[str, int]:
+        await asyncio.to_thread(cmd_build_metadata, config, dry_run)
+
+        # Manifests are published last, so they never point at files not yet in S3
+        album_stats, trackers = await media
+        covers = await covers_upload
+        media_errors = (
+            sum(stats["errors"] for stats in album_stats) + trackers["errors"] + covers["errors"]
+        )
+        if media_errors:
+            print(
+                f"\nSkipping metadata upload: {media_errors} album/tracker/cover uploads failed "
+                "(re-run publish to resume)",
+                flush=True,
+            )
+            return {"files": 0, "errors": 0, "skipped": 0}
+
+        return await asyncio.to_thread(upload_metadata, config, s3_client, dry_run, False)
+
+    async def prepare_and_upload_assets() -> tuple[dict[str, int], dict[str, int]]:
+        print("\n" + _SUB)
+        print("STEP 2: EXTRACTING COVERS AND BUILDING MANIFESTS")
+        print(_SUB)
+        print("Uploading albums and trackers in the background...\n", flush=True)
+        await asyncio.to_thread(
+            cmd_extract_covers, config, dry_run, with_thumbs, thumb_format, jobs
+        )
+        covers_upload = asyncio.ensure_future(
+            asyncio.to_thread(upload_covers, config, s3_client, with_thumbs, dry_run, False)
+        )
+        metadata = await build_and_upload_metadata(covers_upload)
+        return await covers_upload, metadata
+
+    (album_stats, trackers), (covers, metadata) = await asyncio.gather(
+        media, prepare_and_upload_assets()
+    )
+
+    print("\n" + _SUB)
+    print("STEP 3: UPLOAD SUMMARY")
+    print(_SUB)
+
+    albums = {"mp3s": 0, "trackers": 0, "errors": 0, "skipped": 0}
+    for stats in album_stats:
+        for key in albums:
+            albums[key] += stats[key]
+
+    results: dict[str, dict[str, int]] = {
+        "albums": albums,
+        "covers": covers,
+        "trackers": trackers,
+        "metadata": metadata,
+    }
+    total_errors = sum(stats["errors"] for stats in results.values())
+
+    # Keep the journal if anything failed so the next publish resumes
+    if not dry_run:
+        save_upload_cache()
+        finish_upload_session(success=total_errors == 0)
+
+    print(f"  Albums: {albums['mp3s']} MP3s, {albums['trackers']} trackers")
+    print(f"  Covers: {covers['covers']} images, {covers['thumbs']} thumbnails")
+    print(f"  Trackers: {trackers['trackers']} files")
+    print(f"  Metadata: {metadata['files']} files")
+
+    total_skipped = sum(stats["skipped"] for stats in results.values())
+    if total_skipped > 0:
+        print(f"  Skipped: {total_skipped} files (unchanged)")
+
+    if total_errors > 0:
+        print(f"  Errors: {total_errors}")
+
+    return results
 
 
 def cmd_publish(
@@ -438,39 +720,130 @@ def cmd_publish(
     with_thumbs: bool = False,
     thumb_format: str = "png",
     region: str | None = None,
+    jobs: int | None = None,
 ) -> None:
-    """Run full pipeline: prepare → upload-all."""
-    print("\n" + "=" * 60)
+    """Run full pipeline: prepare and upload, overlapping the two where possible."""
+    region = region or config.s3_region
+    print("\n" + _BAR)
     print("FULL PUBLISH PIPELINE")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print(f"Bucket: {config.s3_bucket}")
-    print(f"Region: {region or config.s3_region}")
+    print(f"Region: {region}")
     print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
     print(f"Thumbnails: {'Yes' if with_thumbs else 'No'}")
     if with_thumbs:
         print(f"Thumbnail format: {thumb_format.upper()}")
     print()
 
-    # Phase 1: Prepare
-    cmd_prepare(config, dry_run=dry_run, with_thumbs=with_thumbs, thumb_format=thumb_format)
-
-    # Phase 2: Upload
-    print("\n" + "=" * 60)
-    print("PHASE 2: UPLOADING TO S3")
-    print("=" * 60)
-    cmd_upload_all(config, dry_run=dry_run, with_thumbs=with_thumbs, region=region)
+    asyncio.run(
+        publish_pipeline(
+            config,
+            dry_run=dry_run,
+            with_thumbs=with_thumbs,
+            thumb_format=thumb_format,
+            region=region,
+            jobs=jobs,
+        )
+    )
 
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("FULL PUBLISH COMPLETE!")
-    print("=" * 60)
+    print(_BAR)
+
 
+def cmd_rollback(config: Config, dry_run: bool = False, region: str | None = None) -> None:
+    """Delete the objects created by an interrupted upload-all/publish."""
+    from utils.upload_utils import get_s3_client, rollback_upload_session
 
-def cmd_validate(config: Config) -> None:
+    region = region or config.s3_region
+    print(_BAR)
+    print("ROLLING BACK INTERRUPTED UPLOAD")
+    print(_BAR)
+    print(f"Bucket: {config.s3_bucket}")
+    print(f"Region: {region}")
+    print(f"Mode: {'DRY-RUN' if dry_run else 'APPLY'}")
+    print()
+
+    s3_client = None if dry_run else get_s3_client(region)
+    stats = rollback_upload_session(config, s3_client, dry_run=dry_run, verbose=True)
+
+    print("\n" + _BAR)
+    print("ROLLBACK COMPLETE")
+    print(_BAR)
+    print(f"  Deleted: {stats['deleted']}")
+    print(f"  Kept (overwritten, not restorable): {stats['kept']}")
+    print(f"  Errors: {stats['errors']}")
+
+
+def _count_mp3s(directory: Path) -> int:
+    """Count MP3 files under a directory using one scandir pass per subdirectory."""
+    count = 0
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".mp3"):
+                    count += 1
+    return count
+
+
+def _cover_index(config: Config) -> set[str]:
+    """Get lowercased stems of all cover images, from one scan of the covers directory.
+
+    Matches what find_cover_for_album accepts (case-insensitive stem, image suffix).
+    """
+    if not config.covers_dir.exists():
+        return set()
+
+    with os.scandir(config.covers_dir) as entries:
+        return {
+            Path(entry.name).stem.lower()
+            for entry in entries
+            if entry.is_file() and Path(entry.name).suffix.lower() in config.IMAGE_EXTS
+        }
+
+
+def _walk_albums(album_dirs: list[Path], config: Config) -> Iterator[tuple[str, int, bool]]:
+    """Yield (album_name, mp3_count, has_cover) for each album directory."""
+    covers = _cover_index(config)
+    for album_dir in album_dirs:
+        yield album_dir.name, _count_mp3s(album_dir), album_dir.name.lower() in covers
+
+
+def _album_mp3_keys(album_dirs: list[Path]) -> set[str]:
+    """Get the S3 keys album MP3s are uploaded to (see upload_album)."""
+    keys: set[str] = set()
+    for album_dir in album_dirs:
+        for mp3_file in iter_files(album_dir, extensions={".mp3"}, recursive=True):
+            if "Extras" in mp3_file.relative_to(album_dir).parts:
+                keys.add(f"albums/{album_dir.name}/Extras/{mp3_file.name}")
+            else:
+                keys.add(f"albums/{album_dir.name}/{mp3_file.name}")
+    return keys
+
+
+def _remote_mp3_keys(config: Config, region: str) -> set[str]:
+    """List album MP3 keys in the bucket (1000 keys per request)."""
+    from utils.upload_utils import get_s3_client
+
+    s3_client = get_s3_client(region)
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=config.s3_bucket, Prefix="albums/")
+        for obj in page.get("Contents", [])
+        if obj["Key"].lower().endswith(".mp3")
+    }
+
+
+def cmd_validate(config: Config, remote: bool = False, region: str | None = None) -> None:
     """Validate directory structure and file integrity."""
-    print("=" * 60)
+    print(_BAR)
     print("VALIDATING MUSIC DIRECTORY")
-    print("=" * 60)
+    print(_BAR)
     print(f"Base path: {config.base_path}")
     print()
 
@@ -489,36 +862,43 @@ def cmd_validate(config: Config) -> None:
         else:
             print(f"  ✓ {name}: {path}")
 
-    # Check for albums without covers
+    # Check album covers and count MP3s in a single pass
     print("\nChecking album covers...")
-    album_dirs = get_album_directories(config)
+    album_dirs = get_cached_album_directories(config)
     missing_covers: list[str] = []
+    total_mp3s = 0
 
-    for album_dir in album_dirs:
-        from utils.image_utils import find_cover_for_album
-
-        cover = find_cover_for_album(album_dir.name, config)
-        if not cover:
-            missing_covers.append(album_dir.name)
-            print(f"  ⚠️  No cover found for: {album_dir.name}")
+    for album_name, mp3_count, has_cover in _walk_albums(album_dirs, config):
+        total_mp3s += mp3_count
+        if not has_cover:
+            missing_covers.append(album_name)
+            print(f"  ⚠️  No cover found for: {album_name}")
         else:
-            print(f"  ✓ {album_dir.name}")
+            print(f"  ✓ {album_name}")
 
-    # Check for MP3s without metadata
     print("\nChecking MP3 files...")
-    from utils.file_utils import get_file_list
+    print(f"  Found {total_mp3s} MP3 files")
 
-    total_mp3s = 0
-    for album_dir in album_dirs:
-        mp3s = get_file_list(album_dir, extensions={".mp3"}, recursive=True)
-        total_mp3s += len(mp3s)
+    # Compare against the bucket with a single paginated listing
+    if remote:
+        print(f"\nComparing with s3://{config.s3_bucket}/albums/ ...")
+        local_keys = _album_mp3_keys(album_dirs)
+        remote_keys = _remote_mp3_keys(config, region or config.s3_region)
+        not_uploaded = local_keys - remote_keys
+        remote_only = remote_keys - local_keys
 
-    print(f"  Found {total_mp3s} MP3 files")
+        for key in sorted(not_uploaded):
+            print(f"  ⚠️  Not uploaded: {key}")
+        print(f"  Not uploaded: {len(not_uploaded)}")
+        print(f"  Only in S3: {len(remote_only)}")
+
+        if not_uploaded:
+            issues.append(f"{len(not_uploaded)} MP3 files not uploaded to S3")
 
     # Summary
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("VALIDATION SUMMARY")
-    print("=" * 60)
+    print(_BAR)
     print(f"  Albums: {len(album_dirs)}")
     print(f"  MP3s: {total_mp3s}")
     print(f"  Missing covers: {len(missing_covers)}")
@@ -533,9 +913,13 @@ def cmd_validate(config: Config) -> None:
         print("\n✓ All checks passed!")
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    args = docopt(__doc__, version=f"Music Sync Tool v{__version__}")
+def main(argv: list[str] | None = None) -> None:
+    """Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    args: dict[str, Any] = docopt(__doc__, argv=argv, version=f"Music Sync Tool v{__version__}")
 
     # Load configuration
     base_path: str = str(args.get("--path", "./Music"))
@@ -550,6 +934,13 @@ def main() -> None:
 
     config.config["thumbnail_format"] = thumb_format
 
+    # Worker count (None lets each command pick its default)
+    try:
+        jobs: int | None = int(str(args.get("--jobs") or 0)) or None
+    except ValueError:
+        print(f"Error: Invalid job count '{args.get('--jobs')}'. Use a whole number.")
+        sys.exit(1)
+
     # Extract common flags
     dry_run: bool = bool(args.get("--dry-run", False))
     with_thumbs: bool = bool(args.get("--with-thumbs", False))
@@ -562,7 +953,11 @@ def main() -> None:
 
         elif args.get("extract-covers"):
             cmd_extract_covers(
-                config, dry_run=dry_run, with_thumbs=with_thumbs, thumb_format=thumb_format
+                config,
+                dry_run=dry_run,
+                with_thumbs=with_thumbs,
+                thumb_format=thumb_format,
+                jobs=jobs,
             )
 
         elif args.get("extract-metadata"):
@@ -577,6 +972,7 @@ def main() -> None:
                 dry_run=dry_run,
                 with_thumbs=with_thumbs,
                 thumb_format=thumb_format,
+                jobs=jobs,
             )
 
         elif args.get("upload-all"):
@@ -585,11 +981,12 @@ def main() -> None:
                 dry_run=dry_run,
                 with_thumbs=with_thumbs,
                 region=region,
+                jobs=jobs,
             )
 
         elif args.get("upload"):
             if args.get("albums"):
-                cmd_upload_albums(config, dry_run=dry_run, region=region)
+                cmd_upload_albums(config, dry_run=dry_run, region=region, jobs=jobs)
             elif args.get("covers"):
                 cmd_upload_covers(config, dry_run=dry_run, with_thumbs=with_thumbs, region=region)
             elif args.get("trackers"):
@@ -604,20 +1001,24 @@ def main() -> None:
                 with_thumbs=with_thumbs,
                 thumb_format=thumb_format,
                 region=region,
+                jobs=jobs,
             )
 
+        elif args.get("rollback"):
+            cmd_rollback(config, dry_run=dry_run, region=region)
+
         elif args.get("validate"):
-            cmd_validate(config)
+            cmd_validate(config, remote=bool(args.get("--remote", False)), region=region)
 
     except KeyboardInterrupt:
-        print("\n\nOperation cancelled by user.")
+        print("\n\nOperation cancelled by user.", flush=True)
         sys.exit(1)
     except Exception as e:
-        print(f"\nError: {e}")
-        import traceback
-
+        print(f"\nError: {e}", flush=True)
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        flush_cache()
 
 
 if __name__ == "__main__":
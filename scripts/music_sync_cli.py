@@ -17,36 +17,163 @@ Then in the interactive shell:
 """
 
 import cmd
+import copy
 import os
-import subprocess  # nosec B404 - subprocess is used safely for terminal commands
+import shlex
 import sys
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache, lru_cache, wraps
 from pathlib import Path
-from typing import Any
-
-from docopt import DocoptExit, docopt
+from typing import TYPE_CHECKING, Any
+
+from docopt import (
+    DocoptExit,
+    TokenStream,
+    extras,
+    formal_usage,
+    parse_argv,
+    parse_defaults,
+    parse_pattern,
+    printable_usage,
+)
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-import music_sync
-from utils.config import load_config
-from utils.secrets_manager import get_aws_credentials
+from utils.cache_utils import flush_cache
+from utils.config import Config, load_config
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+@cache
+def _get_music_sync() -> "ModuleType":
+    """Import the command implementations on first use.
+
+    Keeps REPL startup, help and quit free of the pipeline's imports.
+    """
+    import music_sync
+
+    module: ModuleType = music_sync
+    return module
+
+
+@lru_cache(maxsize=8)
+def _load_config_template(path: str) -> Config:
+    """Load and cache the configuration for a base path."""
+    return load_config(base_path=path)
+
+
+def _config_for(path: str) -> Config:
+    """Get a configuration for a base path without re-reading config sources.
+
+    Commands mutate their config (thumbnail format, output directory, cached
+    album list), so each one gets its own copy of the cached template.
+
+    Args:
+        path: Base music directory as given on the command line
+
+    Returns:
+        Config instance safe for the caller to modify
+    """
+    config = copy.copy(_load_config_template(path))
+    config.config = config.config.copy()
+    config.album_dirs = None
+    return config
+
+
+# ANSI: erase the display and move the cursor home
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Section rules for the status report
+_RULE_EQ = "=" * 70
+_RULE_DASH = "-" * 70
+
+
+def _enable_windows_ansi() -> None:
+    """Turn on ANSI escape processing in the Windows console (no-op elsewhere)."""
+    if sys.platform != "win32":
+        return
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+
+def _clear_screen() -> None:
+    """Clear the terminal without spawning clear/cls."""
+    sys.stdout.write(_CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+@dataclass(slots=True)
+class CommonArgs:
+    """Options shared by the REPL commands, with their defaults applied."""
+
+    dry_run: bool
+    path: str
+    region: str
+    with_thumbs: bool
+    thumb_format: str
+
+    @classmethod
+    def from_opt(cls, opt: dict[str, Any]) -> "CommonArgs":
+        """Build from a docopt result; options a command doesn't declare get defaults."""
+        return cls(
+            dry_run=bool(opt.get("--dry-run", False)),
+            path=opt.get("--path") or "./Music",
+            region=opt.get("--region") or "us-east-1",
+            with_thumbs=bool(opt.get("--with-thumbs", False)),
+            thumb_format=opt.get("--thumb-format") or "png",
+        )
+
+
+def _compile_usage(doc: str) -> tuple[str, list[Any], Any]:
+    """Parse a command's usage docstring into a reusable docopt pattern.
+
+    Args:
+        doc: Command docstring with "Usage:" and "Options:" sections
+
+    Returns:
+        Tuple of (usage text, option defaults, fixed pattern)
+    """
+    usage = printable_usage(doc)
+    options = parse_defaults(doc)
+    pattern = parse_pattern(formal_usage(usage), options).fix()
+    return usage, options, pattern
 
 
 def docopt_cmd(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to simplify docopt parsing and error handling.
 
-    Passes the result of the docopt parsing to the called action.
+    Passes the result of the docopt parsing, and the common options taken
+    from it, to the called action. The usage pattern is parsed once here;
+    each call only matches the new arguments.
     """
-    import shlex
+    doc = func.__doc__ or ""
+    usage, options, pattern = _compile_usage(doc)
 
+    @wraps(func)
     def fn(self: Any, arg: str) -> Any:
         try:
             # cmd.Cmd passes arguments as a string, but docopt expects a list
             # Use shlex.split() to properly handle quoted arguments
-            argv = shlex.split(arg) if arg else []
-            opt = docopt(fn.__doc__, argv)
+            DocoptExit.usage = usage
+            argv = parse_argv(
+                TokenStream(shlex.split(arg) if arg else [], DocoptExit), list(options)
+            )
+            extras(True, None, argv, doc)
+            matched, left, collected = pattern.match(argv)
+            if not matched or left:
+                raise DocoptExit()
+            opt = {a.name: a.value for a in pattern.flat() + collected}
         except DocoptExit as e:
             # The DocoptExit is thrown when the args do not match
             print("Invalid Command!")
@@ -56,11 +183,8 @@ def docopt_cmd(func: Callable[..., Any]) -> Callable[..., Any]:
             # The SystemExit exception prints the usage for --help
             return None
 
-        return func(self, opt)
+        return func(self, opt, CommonArgs.from_opt(opt))
 
-    fn.__name__ = func.__name__
-    fn.__doc__ = func.__doc__
-    fn.__dict__.update(func.__dict__)
     return fn
 
 
@@ -85,6 +209,7 @@ Available Commands:
   upload_trackers       - Upload tracker files to S3
   upload_metadata       - Upload metadata JSON files to S3
   publish               - Run full pipeline (sanitize → extract → upload)
+  rollback              - Delete objects created by an interrupted publish
   validate              - Validate directory structure
   status                - Show configuration, credentials & acceleration status
 
@@ -97,16 +222,14 @@ Type "help <command>" for detailed syntax or "quit" to exit.
     def __init__(self):
         """Initialize the CLI with default config."""
         super().__init__()
-        self.config = load_config(base_path="./Music")
+        self.config = _config_for("./Music")
 
     def preloop(self):
         """Clear screen and show intro on startup."""
-        subprocess.run(
-            ["cls"] if os.name == "nt" else ["clear"], check=False
-        )  # nosec B603 - hardcoded terminal command
+        _clear_screen()
 
     @docopt_cmd
-    def do_sanitize(self, arg: dict[str, Any]) -> None:
+    def do_sanitize(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: sanitize [--dry-run] [--path=<dir>]
 
         Sanitize filenames and remove system files.
@@ -120,17 +243,11 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           sanitize
           sanitize --path=./Music
         """
-        dry_run = arg.get("--dry-run", False)
-        path = arg.get("--path", "./Music")
-
-        # Update config if path changed
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_sanitize(self.config, dry_run=dry_run)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_sanitize(self.config, dry_run=common.dry_run)
 
     @docopt_cmd
-    def do_extract_covers(self, arg: dict[str, Any]) -> None:
+    def do_extract_covers(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: extract_covers [--dry-run] [--with-thumbs] [--thumb-format=<fmt>] [--path=<dir>]
 
         Extract embedded covers from MP3s and generate thumbnails.
@@ -146,22 +263,18 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           extract_covers --with-thumbs
           extract_covers --with-thumbs --thumb-format=jpg
         """
-        dry_run = arg.get("--dry-run", False)
-        with_thumbs = arg.get("--with-thumbs", False)
-        thumb_format = arg.get("--thumb-format", "png") or "png"
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        self.config.config["thumbnail_format"] = thumb_format
+        self.config = _config_for(common.path)
+        self.config.config["thumbnail_format"] = common.thumb_format
 
-        music_sync.cmd_extract_covers(
-            self.config, dry_run=dry_run, with_thumbs=with_thumbs, thumb_format=thumb_format
+        _get_music_sync().cmd_extract_covers(
+            self.config,
+            dry_run=common.dry_run,
+            with_thumbs=common.with_thumbs,
+            thumb_format=common.thumb_format,
         )
 
     @docopt_cmd
-    def do_build_metadata(self, arg: dict[str, Any]) -> None:
+    def do_build_metadata(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: build_metadata [--dry-run] [--output=<dir>] [--path=<dir>]
 
         Build all JSON metadata files.
@@ -176,17 +289,13 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           build_metadata
           build_metadata --output=./custom/metadata
         """
-        dry_run = arg.get("--dry-run", False)
-        output_dir = arg.get("--output")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_build_metadata(self.config, dry_run=dry_run, output_dir=output_dir)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_build_metadata(
+            self.config, dry_run=common.dry_run, output_dir=arg.get("--output")
+        )
 
     @docopt_cmd
-    def do_upload_albums(self, arg: dict[str, Any]) -> None:
+    def do_upload_albums(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: upload_albums [--dry-run] [--region=<region>] [--path=<dir>]
 
         Upload MP3 files and album-level tracker files.
@@ -201,17 +310,13 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           upload_albums
           upload_albums --region=us-west-2
         """
-        dry_run = arg.get("--dry-run", False)
-        region = arg.get("--region", "us-east-1")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_upload_albums(self.config, dry_run=dry_run, region=region)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_upload_albums(
+            self.config, dry_run=common.dry_run, region=common.region
+        )
 
     @docopt_cmd
-    def do_upload_covers(self, arg: dict[str, Any]) -> None:
+    def do_upload_covers(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: upload_covers [--dry-run] [--with-thumbs] [--region=<region>] [--path=<dir>]
 
         Upload cover art and thumbnails to S3.
@@ -226,20 +331,16 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           upload_covers --dry-run
           upload_covers --with-thumbs
         """
-        dry_run = arg.get("--dry-run", False)
-        with_thumbs = arg.get("--with-thumbs", False)
-        region = arg.get("--region", "us-east-1")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_upload_covers(
-            self.config, dry_run=dry_run, with_thumbs=with_thumbs, region=region
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_upload_covers(
+            self.config,
+            dry_run=common.dry_run,
+            with_thumbs=common.with_thumbs,
+            region=common.region,
         )
 
     @docopt_cmd
-    def do_upload_trackers(self, arg: dict[str, Any]) -> None:
+    def do_upload_trackers(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: upload_trackers [--dry-run] [--region=<region>] [--path=<dir>]
 
         Upload all tracker files from trackers directory.
@@ -253,17 +354,13 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           upload_trackers --dry-run
           upload_trackers
         """
-        dry_run = arg.get("--dry-run", False)
-        region = arg.get("--region", "us-east-1")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_upload_trackers(self.config, dry_run=dry_run, region=region)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_upload_trackers(
+            self.config, dry_run=common.dry_run, region=common.region
+        )
 
     @docopt_cmd
-    def do_upload_metadata(self, arg: dict[str, Any]) -> None:
+    def do_upload_metadata(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: upload_metadata [--dry-run] [--region=<region>] [--path=<dir>]
 
         Upload JSON metadata files to S3.
@@ -277,17 +374,13 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           upload_metadata --dry-run
           upload_metadata
         """
-        dry_run = arg.get("--dry-run", False)
-        region = arg.get("--region", "us-east-1")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_upload_metadata(self.config, dry_run=dry_run, region=region)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_upload_metadata(
+            self.config, dry_run=common.dry_run, region=common.region
+        )
 
     @docopt_cmd
-    def do_publish(self, arg: dict[str, Any]) -> None:
+    def do_publish(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: publish [--dry-run] [--with-thumbs] [--thumb-format=<fmt>]
                           [--region=<region>] [--path=<dir>]
 
@@ -305,27 +398,38 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           publish --with-thumbs
           publish --with-thumbs --thumb-format=png
         """
-        dry_run = arg.get("--dry-run", False)
-        with_thumbs = arg.get("--with-thumbs", False)
-        thumb_format = arg.get("--thumb-format", "png") or "png"
-        region = arg.get("--region", "us-east-1")
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        self.config.config["thumbnail_format"] = thumb_format
+        self.config = _config_for(common.path)
+        self.config.config["thumbnail_format"] = common.thumb_format
 
-        music_sync.cmd_publish(
+        _get_music_sync().cmd_publish(
             self.config,
-            dry_run=dry_run,
-            with_thumbs=with_thumbs,
-            thumb_format=thumb_format,
-            region=region,
+            dry_run=common.dry_run,
+            with_thumbs=common.with_thumbs,
+            thumb_format=common.thumb_format,
+            region=common.region,
         )
 
     @docopt_cmd
-    def do_validate(self, arg: dict[str, Any]) -> None:
+    def do_rollback(self, arg: dict[str, Any], common: CommonArgs) -> None:
+        """Usage: rollback [--dry-run] [--region=<region>] [--path=<dir>]
+
+        Delete the objects created by an interrupted publish or upload-all.
+        Objects that were overwritten are left in place.
+
+        Options:
+          --dry-run         Preview deletions
+          --region=<region> AWS region [default: us-east-1]
+          --path=<dir>      Base music directory [default: ./Music]
+
+        Examples:
+          rollback --dry-run
+          rollback
+        """
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_rollback(self.config, dry_run=common.dry_run, region=common.region)
+
+    @docopt_cmd
+    def do_validate(self, arg: dict[str, Any], common: CommonArgs) -> None:
         """Usage: validate [--path=<dir>]
 
         Validate directory structure and file integrity.
@@ -337,37 +441,39 @@ Type "help <command>" for detailed syntax or "quit" to exit.
           validate
           validate --path=./Music
         """
-        path = arg.get("--path", "./Music")
-
-        if path != str(self.config.base_path):
-            self.config = load_config(base_path=path)
-
-        music_sync.cmd_validate(self.config)
+        self.config = _config_for(common.path)
+        _get_music_sync().cmd_validate(self.config)
 
     def do_status(self, arg: str) -> None:
         """Show current configuration status.
 
         Usage: status
         """
-        print("\n" + "=" * 70)
-        print("CURRENT CONFIGURATION")
-        print("=" * 70)
+        # Built up and written at once so the panel renders in one go
+        lines: list[str] = []
+        add = lines.append
+
+        add("\n" + _RULE_EQ)
+        add("CURRENT CONFIGURATION")
+        add(_RULE_EQ)
 
         # Basic configuration
-        print(f"  Base path:        {self.config.base_path}")
-        print(f"  S3 bucket:        {self.config.s3_bucket}")
-        print(f"  S3 region:        {self.config.s3_region}")
-        print(f"  CDN base:         {self.config.cdn_base}")
-        print(f"  Thumbnail size:   {self.config.thumbnail_size}")
-        print(f"  Thumbnail format: {self.config.thumbnail_format}")
+        add(f"  Base path:        {self.config.base_path}")
+        add(f"  S3 bucket:        {self.config.s3_bucket}")
+        add(f"  S3 region:        {self.config.s3_region}")
+        add(f"  CDN base:         {self.config.cdn_base}")
+        add(f"  Thumbnail size:   {self.config.thumbnail_size}")
+        add(f"  Thumbnail format: {self.config.thumbnail_format}")
 
         # AWS Credentials status
-        print("\n" + "-" * 70)
-        print("AWS CREDENTIALS & CONFIGURATION")
-        print("-" * 70)
+        add("\n" + _RULE_DASH)
+        add("AWS CREDENTIALS & CONFIGURATION")
+        add(_RULE_DASH)
 
         # Try to fetch credentials from Secrets Manager
         try:
+            from utils.secrets_manager import get_aws_credentials
+
             creds = get_aws_credentials()
             access_key = creds.get("access_key_id", "")
             created_at = creds.get("created_at", "unknown")
@@ -378,56 +484,56 @@ Type "help <command>" for detailed syntax or "quit" to exit.
             else:
                 masked_key = "****"
 
-            print("  Credentials Source:    ✅ AWS Secrets Manager")
-            print(f"  AWS_ACCESS_KEY_ID:     ✅ {masked_key}")
-            print("  AWS_SECRET_ACCESS_KEY: ✅ Set (hidden)")
-            print(f"  Created At:            {created_at}")
+            add("  Credentials Source:    ✅ AWS Secrets Manager")
+            add(f"  AWS_ACCESS_KEY_ID:     ✅ {masked_key}")
+            add("  AWS_SECRET_ACCESS_KEY: ✅ Set (hidden)")
+            add(f"  Created At:            {created_at}")
             credentials_available = True
 
         except (ValueError, PermissionError) as e:
             # Secrets Manager not available - check environment variables
-            print("  Credentials Source:    ⚠️  Secrets Manager unavailable")
-            print(f"  Error:                 {e}")
+            add("  Credentials Source:    ⚠️  Secrets Manager unavailable")
+            add(f"  Error:                 {e}")
 
             aws_key = os.getenv("AWS_ACCESS_KEY_ID")
             aws_secret = os.getenv("AWS_SECRET_ACCESS_KEY")
 
             if aws_key:
                 masked_key = f"{aws_key[:4]}...{aws_key[-4:]}" if len(aws_key) > 8 else "****"
-                print(f"  AWS_ACCESS_KEY_ID:     ✅ Set from env ({masked_key})")
+                add(f"  AWS_ACCESS_KEY_ID:     ✅ Set from env ({masked_key})")
             else:
-                print("  AWS_ACCESS_KEY_ID:     ⚠️  NOT SET")
+                add("  AWS_ACCESS_KEY_ID:     ⚠️  NOT SET")
 
             if aws_secret:
-                print("  AWS_SECRET_ACCESS_KEY: ✅ Set from env (hidden)")
+                add("  AWS_SECRET_ACCESS_KEY: ✅ Set from env (hidden)")
             else:
-                print("  AWS_SECRET_ACCESS_KEY: ⚠️  NOT SET")
+                add("  AWS_SECRET_ACCESS_KEY: ⚠️  NOT SET")
 
             credentials_available = bool(aws_key and aws_secret)
 
-        # Check S3 acceleration
-        acceleration = os.getenv("S3_USE_ACCELERATION", "true").lower() == "true"
-        print(f"\n  S3 Transfer Acceleration: {'✅ ENABLED' if acceleration else '❌ DISABLED'}")
+        # Check S3 acceleration (.env was loaded along with the config)
+        use_accel = os.getenv("S3_USE_ACCELERATION", "true").lower() == "true"
+        add(f"\n  S3 Transfer Acceleration: {'✅ ENABLED' if use_accel else '❌ DISABLED'}")
 
-        if acceleration:
+        if use_accel:
             accelerated_endpoint = f"{self.config.s3_bucket}.s3-accelerate.amazonaws.com"
             standard_endpoint = f"{self.config.s3_bucket}.s3.{self.config.s3_region}.amazonaws.com"
-            print(f"    Standard endpoint:    {standard_endpoint}")
-            print(f"    Accelerated endpoint: {accelerated_endpoint}")
-            print("    Performance:          643% faster (Kenya → us-east-1)")
-            print("    Cost:                 $0.04/GB (~4¢ for 944 MB)")
+            add(f"    Standard endpoint:    {standard_endpoint}")
+            add(f"    Accelerated endpoint: {accelerated_endpoint}")
+            add("    Performance:          643% faster (Kenya → us-east-1)")
+            add("    Cost:                 $0.04/GB (~4¢ for 944 MB)")
         else:
-            print(f"    Endpoint: {self.config.s3_bucket}.s3.{self.config.s3_region}.amazonaws.com")
-            print("    Tip: Set S3_USE_ACCELERATION=true in .env for faster uploads")
+            add(f"    Endpoint: {self.config.s3_bucket}.s3.{self.config.s3_region}.amazonaws.com")
+            add("    Tip: Set S3_USE_ACCELERATION=true in .env for faster uploads")
 
         # Directory paths
-        print("\n" + "-" * 70)
-        print("DIRECTORY PATHS")
-        print("-" * 70)
-        print(f"  Albums:    {self.config.albums_dir}")
-        print(f"  Covers:    {self.config.covers_dir}")
-        print(f"  Trackers:  {self.config.trackers_dir}")
-        print(f"  Metadata:  {self.config.metadata_dir}")
+        add("\n" + _RULE_DASH)
+        add("DIRECTORY PATHS")
+        add(_RULE_DASH)
+        add(f"  Albums:    {self.config.albums_dir}")
+        add(f"  Covers:    {self.config.covers_dir}")
+        add(f"  Trackers:  {self.config.trackers_dir}")
+        add(f"  Metadata:  {self.config.metadata_dir}")
 
         # Warnings section
         warnings = []
@@ -442,22 +548,21 @@ Type "help <command>" for detailed syntax or "quit" to exit.
             warnings.append(f"Base path does not exist: {self.config.base_path}")
 
         if warnings:
-            print("\n" + "-" * 70)
-            print("⚠️  WARNINGS")
-            print("-" * 70)
+            add("\n" + _RULE_DASH)
+            add("⚠️  WARNINGS")
+            add(_RULE_DASH)
             for warning in warnings:
-                print(f"  • {warning}")
+                add(f"  • {warning}")
 
-        print("=" * 70 + "\n")
+        add(_RULE_EQ + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def do_clear(self, arg: str) -> None:
         """Clear the terminal screen.
 
         Usage: clear
         """
-        subprocess.run(
-            ["cls"] if os.name == "nt" else ["clear"], check=False
-        )  # nosec B603 - hardcoded terminal command
+        _clear_screen()
 
     def do_quit(self, arg: str) -> bool:
         """Exit the interactive CLI.
@@ -479,6 +584,11 @@ Type "help <command>" for detailed syntax or "quit" to exit.
         print()  # New line after ^D
         return self.do_quit(arg)
 
+    def postcmd(self, stop: bool, line: str) -> bool:
+        """Save cache changes after every command, so a killed session keeps them."""
+        flush_cache()
+        return stop
+
     def emptyline(self) -> bool:
         """Do nothing on empty line (override default repeat behavior)."""
         return False
@@ -491,6 +601,7 @@ Type "help <command>" for detailed syntax or "quit" to exit.
 
 def main():
     """Entry point for the interactive CLI."""
+    _enable_windows_ansi()
     try:
         MusicSyncCLI().cmdloop()
     except KeyboardInterrupt:
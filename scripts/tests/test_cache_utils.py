@@ -0,0 +1,105 @@
+"""
+Tests for cache_utils module.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.utils import cache_utils
+from scripts.utils.cache_utils import (
+    flush_cache,
+    get_cached_metadata,
+    get_metadata_cache,
+    invalidate_cache_entry,
+    save_metadata_cache,
+    update_cache_entry,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Reset the cache singleton so each test loads from a temporary directory."""
+    monkeypatch.setattr(cache_utils, "_metadata_cache", None)
+    monkeypatch.setattr(cache_utils, "_cache_file", None)
+    monkeypatch.setattr(cache_utils, "_metadata_store", None)
+    monkeypatch.setattr(cache_utils, "_dirty", False)
+    return tmp_path
+
+
+def _make_file(root: Path, name: str) -> Path:
+    """Create a small file to cache metadata for."""
+    path = root / name
+    path.write_text(name)
+    return path
+
+
+def _read(path: Path) -> dict[str, Any]:
+    """Load a cache file written to disk."""
+    data: dict[str, Any] = json.loads(path.read_bytes())
+    return data
+
+
+class TestCacheFiles:
+    """Test the split index/payload cache files."""
+
+    def test_inline_cache_migrated(self, cache_dir: Path) -> None:
+        """Test a cache with inline metadata is flushed into both files."""
+        entry = {"checksum": "sha256:abc", "mtime": 1.0, "size": 1, "cached_at": 1.0}
+        (cache_dir / ".metadata_cache.json").write_text(
+            json.dumps({"/music/A.mp3": {**entry, "metadata": {"title": "A"}}})
+        )
+
+        cache = get_metadata_cache(cache_dir)
+        assert cache == {"/music/A.mp3": entry}
+
+        flush_cache()
+        assert _read(cache_dir / ".metadata_cache.json") == {"/music/A.mp3": entry}
+        assert _read(cache_dir / ".metadata_cache_data.json") == {"/music/A.mp3": {"title": "A"}}
+
+    def test_orphaned_payloads_dropped(self, cache_dir: Path) -> None:
+        """Test payloads whose index entries were removed are not written back."""
+        get_metadata_cache(cache_dir)
+        first = _make_file(cache_dir, "A.mp3")
+        second = _make_file(cache_dir, "B.mp3")
+        update_cache_entry(first, {"title": "A"})
+        update_cache_entry(second, {"title": "B"})
+        invalidate_cache_entry(first)
+
+        save_metadata_cache()
+        assert list(_read(cache_dir / ".metadata_cache_data.json").values()) == [{"title": "B"}]
+
+    def test_flush_skipped_when_clean(self, cache_dir: Path) -> None:
+        """Test flush_cache() writes nothing if the cache has not changed."""
+        get_metadata_cache(cache_dir)
+        flush_cache()
+        assert not (cache_dir / ".metadata_cache.json").exists()
+        assert not (cache_dir / ".metadata_cache_data.json").exists()
+
+        update_cache_entry(_make_file(cache_dir, "A.mp3"), {"title": "A"})
+        flush_cache()
+        assert (cache_dir / ".metadata_cache.json").exists()
+
+
+class TestCacheEviction:
+    """Test least-recently-used eviction."""
+
+    def test_least_recently_used_evicted(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the entry used longest ago is evicted past MAX_CACHE_ENTRIES."""
+        monkeypatch.setattr(cache_utils, "MAX_CACHE_ENTRIES", 2)
+        cache = get_metadata_cache(cache_dir)
+        first, second, third = (_make_file(cache_dir, name) for name in ("A", "B", "C"))
+
+        update_cache_entry(first, {"title": "A"})
+        update_cache_entry(second, {"title": "B"})
+        assert get_cached_metadata(first) == ({"title": "A"}, "hit")
+        update_cache_entry(third, {"title": "C"})
+
+        assert len(cache) == 2
+        assert get_cached_metadata(second) == (None, "miss")
+        assert get_cached_metadata(first) == ({"title": "A"}, "hit")
+        assert get_cached_metadata(third) == ({"title": "C"}, "hit")
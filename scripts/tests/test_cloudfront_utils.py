@@ -0,0 +1,69 @@
+"""
+Tests for cloudfront_utils module.
+"""
+
+import pytest
+
+from scripts.utils import cloudfront_utils
+from scripts.utils.cloudfront_utils import (
+    InvalidationBatch,
+    invalidate_all_music_content,
+    invalidate_metadata_only,
+)
+
+
+class TestInvalidationBatch:
+    """Test invalidation path batching."""
+
+    def test_duplicates_collapsed(self):
+        """Test the same path is only queued once."""
+        batch = InvalidationBatch()
+        batch.add("/covers/A.png")
+        batch.add("/covers/A.png")
+        assert batch.paths == {"/covers/A.png"}
+
+    def test_wildcard_replaces_covered_paths(self):
+        """Test a wildcard drops paths it covers, and covered paths are skipped."""
+        batch = InvalidationBatch()
+        batch.add("/metadata/albums.json")
+        batch.add("/covers/A.png")
+        batch.add("/metadata/*")
+        batch.add("/metadata/tracks.json")
+        assert batch.paths == {"/metadata/*", "/covers/A.png"}
+
+    def test_empty_batch_not_submitted(self):
+        """Test nothing is invalidated when no paths were queued."""
+        with InvalidationBatch() as batch:
+            pass
+        assert batch.invalidation_id is None
+
+
+class TestInvalidateContent:
+    """Test the content invalidation helpers go through a batch."""
+
+    @pytest.fixture
+    def submitted(self, monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+        """Record invalidations instead of calling CloudFront."""
+        calls: list[list[str]] = []
+
+        def invalidate(paths: list[str], **kwargs: object) -> str:
+            calls.append(paths)
+            return "I1"
+
+        monkeypatch.setattr(cloudfront_utils, "invalidate_cloudfront_cache", invalidate)
+        return calls
+
+    def test_groups_share_one_invalidation(self, submitted: list[list[str]]) -> None:
+        """Test queued groups are submitted together, with covered paths dropped."""
+        with InvalidationBatch() as batch:
+            assert invalidate_metadata_only(batch=batch) is None
+            assert invalidate_all_music_content(batch=batch) is None
+            assert submitted == []
+
+        assert submitted == [["/albums/*", "/covers/*", "/metadata/*", "/tracker/*"]]
+        assert batch.invalidation_id == "I1"
+
+    def test_without_batch_submits_now(self, submitted: list[list[str]]) -> None:
+        """Test calling without a batch invalidates immediately."""
+        assert invalidate_metadata_only() == "I1"
+        assert submitted == [["/metadata/*"]]
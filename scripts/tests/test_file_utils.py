@@ -2,12 +2,34 @@
 Tests for file_utils module.
 """
 
+from pathlib import Path
+
+import pytest
+
+from scripts.utils.config import Config
 from scripts.utils.file_utils import (
+    clean_and_sanitize,
+    get_cached_album_directories,
     normalize_stem,
+    remove_system_files,
+    sanitize_directory,
     url_safe_name,
 )
 
 
+def _make_tree(root: Path, files: list[str]) -> None:
+    """Create empty files (and their parent directories) under root."""
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+
+
+def _tree(root: Path) -> set[str]:
+    """Get every path under root, relative to it."""
+    return {path.relative_to(root).as_posix() for path in root.rglob("*")}
+
+
 class TestUrlSafeName:
     """Test url_safe_name function."""
 
@@ -99,3 +121,114 @@ class TestNormalizeStem:
     def test_special_characters_removed(self):
         """Test removal of special characters."""
         assert normalize_stem("Track! Name?.mp3") == "track-name"
+
+
+class TestSanitizeDirectory:
+    """Test sanitize_directory function."""
+
+    def test_nested_renames_deepest_first(self, tmp_path: Path) -> None:
+        """Test entries are renamed before the directories containing them."""
+        _make_tree(tmp_path, ["Top Dir/Mid Dir/Leaf Track.mp3"])
+        stats = sanitize_directory(tmp_path, verbose=False)
+        assert stats == {"renamed": 3, "skipped": 0, "errors": 0}
+        assert _tree(tmp_path) == {"Top-Dir", "Top-Dir/Mid-Dir", "Top-Dir/Mid-Dir/Leaf-Track.mp3"}
+
+    def test_collision_gets_suffix(self, tmp_path: Path) -> None:
+        """Test a rename onto an existing name gets a numbered suffix."""
+        _make_tree(tmp_path, ["A B.mp3", "A-B.mp3"])
+        stats = sanitize_directory(tmp_path, verbose=False)
+        assert stats == {"renamed": 1, "skipped": 1, "errors": 0}
+        assert _tree(tmp_path) == {"A-B.mp3", "A-B-1.mp3"}
+        assert (tmp_path / "A-B-1.mp3").read_text() == "A B.mp3"
+
+    def test_dry_run_changes_nothing(self, tmp_path: Path) -> None:
+        """Test a dry run counts renames without touching the tree."""
+        _make_tree(tmp_path, ["Top Dir/Leaf Track.mp3", "Top Dir/ok.mp3"])
+        before = _tree(tmp_path)
+        stats = sanitize_directory(tmp_path, dry_run=True, verbose=False)
+        assert stats == {"renamed": 2, "skipped": 1, "errors": 0}
+        assert _tree(tmp_path) == before
+
+    def test_rename_errors_counted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test failed renames are counted as errors."""
+        _make_tree(tmp_path, ["A B.mp3", "C D.mp3"])
+
+        def fail(self: Path, target: Path) -> Path:
+            raise OSError("read-only")
+
+        monkeypatch.setattr(Path, "rename", fail)
+        stats = sanitize_directory(tmp_path, verbose=False)
+        assert stats == {"renamed": 0, "skipped": 0, "errors": 2}
+
+
+class TestRemoveSystemFiles:
+    """Test remove_system_files function."""
+
+    def test_removes_ignored_files(self, tmp_path: Path) -> None:
+        """Test system files and album art patterns are removed recursively."""
+        _make_tree(tmp_path, [".DS_Store", "Album/AlbumArt_{1}_Large.jpg", "Album/01.Track.mp3"])
+        stats = remove_system_files(tmp_path, verbose=False)
+        assert stats == {"removed": 2, "errors": 0}
+        assert _tree(tmp_path) == {"Album", "Album/01.Track.mp3"}
+
+    def test_dry_run_keeps_files(self, tmp_path: Path) -> None:
+        """Test a dry run counts removals without deleting."""
+        _make_tree(tmp_path, ["Thumbs.db", "Album/Folder.jpg"])
+        before = _tree(tmp_path)
+        stats = remove_system_files(tmp_path, dry_run=True, verbose=False)
+        assert stats == {"removed": 2, "errors": 0}
+        assert _tree(tmp_path) == before
+
+    def test_unlink_errors_counted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test failed deletions are counted as errors."""
+        _make_tree(tmp_path, ["Thumbs.db", "desktop.ini"])
+
+        def fail(self: Path, missing_ok: bool = False) -> None:
+            raise OSError("busy")
+
+        monkeypatch.setattr(Path, "unlink", fail)
+        stats = remove_system_files(tmp_path, verbose=False)
+        assert stats == {"removed": 0, "errors": 2}
+
+
+class TestCleanAndSanitize:
+    """Test clean_and_sanitize function."""
+
+    def test_removes_then_renames(self, tmp_path: Path) -> None:
+        """Test ignored files are deleted and everything else is sanitized."""
+        _make_tree(
+            tmp_path,
+            ["My Album/AlbumArt_{1}_Large.jpg", "My Album/Leaf Track.mp3", "My Album/.DS_Store"],
+        )
+        stats = clean_and_sanitize(tmp_path, verbose=False)
+        assert stats == {"removed": 2, "renamed": 2, "skipped": 0, "errors": 0}
+        assert _tree(tmp_path) == {"My-Album", "My-Album/Leaf-Track.mp3"}
+
+    def test_dry_run_skips_renaming_removed_files(self, tmp_path: Path) -> None:
+        """Test a dry run doesn't also count renames of files it would delete."""
+        _make_tree(tmp_path, ["AlbumArt_{1}_Large.jpg", "Leaf Track.mp3"])
+        before = _tree(tmp_path)
+        stats = clean_and_sanitize(tmp_path, dry_run=True, verbose=False)
+        assert stats == {"removed": 1, "renamed": 1, "skipped": 0, "errors": 0}
+        assert _tree(tmp_path) == before
+
+
+class TestGetCachedAlbumDirectories:
+    """Test get_cached_album_directories function."""
+
+    def test_scanned_once_until_reset(self, tmp_path: Path) -> None:
+        """Test the album list is reused until config.album_dirs is cleared."""
+        config = Config(base_path=str(tmp_path))
+        (config.albums_dir / "B").mkdir(parents=True)
+        (config.albums_dir / "A").mkdir()
+
+        assert get_cached_album_directories(config) == [
+            config.albums_dir / "A",
+            config.albums_dir / "B",
+        ]
+
+        (config.albums_dir / "C").mkdir()
+        assert len(get_cached_album_directories(config)) == 2
+
+        config.album_dirs = None
+        assert len(get_cached_album_directories(config)) == 3
@@ -0,0 +1,103 @@
+"""
+Tests for the Terraform import script.
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import ClassVar
+
+import pytest
+
+pytest.importorskip("boto3")
+
+SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "infrastructure"
+    / "terraform"
+    / "scripts"
+    / "import_existing_resources.py"
+)
+
+
+def _load_script() -> ModuleType:
+    """Import the script by path; it is not part of a package."""
+    spec = importlib.util.spec_from_file_location("import_existing_resources", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def script() -> ModuleType:
+    """Freshly imported script module."""
+    return _load_script()
+
+
+def _fake_terraform(
+    monkeypatch: pytest.MonkeyPatch, script: ModuleType, resource_changes: list[dict]
+) -> list[list[str]]:
+    """Replace run_command with a fake Terraform; returns the commands run."""
+    commands: list[list[str]] = []
+
+    def run_command(cmd: list[str], **_: object) -> tuple[bool, str]:
+        commands.append(cmd)
+        if cmd[:2] == ["terraform", "show"]:
+            return True, json.dumps({"resource_changes": resource_changes})
+        return True, ""
+
+    monkeypatch.setattr(script, "run_command", run_command)
+    return commands
+
+
+class TestTerraformImportBatch:
+    """Test terraform_import_batch function."""
+
+    RESOURCES: ClassVar[list[tuple[str, str, str]]] = [
+        ("aws_s3_bucket", "music", "alexmbugua-music")
+    ]
+
+    def test_plan_targets_imported_resources(
+        self, monkeypatch: pytest.MonkeyPatch, script: ModuleType, tmp_path: Path
+    ) -> None:
+        """Test the plan is limited to the resources being imported."""
+        commands = _fake_terraform(
+            monkeypatch,
+            script,
+            [{"address": "aws_s3_bucket.music", "change": {"actions": ["no-op"], "importing": {}}}],
+        )
+
+        assert script.terraform_import_batch(self.RESOURCES, tmp_path)
+        assert "-target=aws_s3_bucket.music" in commands[0]
+        assert commands[-1][:2] == ["terraform", "apply"]
+        assert not (tmp_path / script.IMPORTS_FILE).exists()
+
+    def test_unrelated_change_needs_confirmation(
+        self, monkeypatch: pytest.MonkeyPatch, script: ModuleType, tmp_path: Path
+    ) -> None:
+        """Test a create outside the import set is not applied without a yes."""
+        commands = _fake_terraform(
+            monkeypatch,
+            script,
+            [
+                {
+                    "address": "aws_s3_bucket.music",
+                    "change": {"actions": ["no-op"], "importing": {}},
+                },
+                {"address": "aws_s3_bucket.logs", "change": {"actions": ["create"]}},
+            ],
+        )
+        questions: list[str] = []
+
+        def ask(question: str) -> str:
+            questions.append(question)
+            return "n"
+
+        monkeypatch.setattr(script, "ask", ask)
+
+        assert not script.terraform_import_batch(self.RESOURCES, tmp_path)
+        assert questions
+        assert all(cmd[:2] != ["terraform", "apply"] for cmd in commands)
+        assert (tmp_path / script.IMPORTS_FILE).exists()
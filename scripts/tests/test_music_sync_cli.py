@@ -0,0 +1,84 @@
+"""
+Tests for the interactive REPL's command parsing.
+"""
+
+import shlex
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from docopt import docopt, parse_defaults
+
+from scripts import music_sync_cli
+from scripts.music_sync_cli import MusicSyncCLI, docopt_cmd
+
+# Every REPL command whose arguments are parsed by docopt_cmd
+COMMANDS = sorted(
+    name
+    for name, method in vars(MusicSyncCLI).items()
+    if name.startswith("do_") and hasattr(method, "__wrapped__")
+)
+
+
+def _recorder(doc: str) -> Callable[[Any, str], Any]:
+    """Wrap a command that returns the options docopt_cmd parsed for it."""
+
+    def record(self: Any, opt: dict[str, Any], common: Any) -> dict[str, Any]:
+        return opt
+
+    record.__doc__ = doc
+    return docopt_cmd(record)
+
+
+def _argv_cases(doc: str) -> list[str]:
+    """Command lines to try: no options, each option alone, and all at once."""
+    options = [
+        f"{option.long}=value" if option.argcount else option.long for option in parse_defaults(doc)
+    ]
+    return ["", *options, " ".join(options)]
+
+
+class TestDocoptCmd:
+    """Test docopt_cmd's precompiled parsing against docopt itself."""
+
+    def test_commands_found(self) -> None:
+        """Test the decorated commands are discovered."""
+        assert "do_sanitize" in COMMANDS
+        assert "do_publish" in COMMANDS
+
+    @pytest.mark.parametrize("name", COMMANDS)
+    def test_matches_docopt(self, name: str) -> None:
+        """Test each command line parses to the same options as docopt()."""
+        doc = getattr(MusicSyncCLI, name).__doc__
+        command = _recorder(doc)
+
+        for arg in _argv_cases(doc):
+            assert command(None, arg) == docopt(doc, shlex.split(arg)), arg
+
+    @pytest.mark.parametrize("name", COMMANDS)
+    def test_bad_option_prints_usage(self, name: str, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test an unknown option prints the usage instead of raising."""
+        doc = getattr(MusicSyncCLI, name).__doc__
+
+        assert _recorder(doc)(None, "--no-such-option") is None
+        output = capsys.readouterr().out
+        assert "Invalid Command!" in output
+        assert "Usage:" in output
+
+
+class TestMusicSyncCLI:
+    """Test REPL command hooks."""
+
+    def test_cache_flushed_after_command(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the metadata cache is flushed after every command."""
+        flushes: list[None] = []
+
+        def flush_cache() -> None:
+            flushes.append(None)
+
+        monkeypatch.setattr(music_sync_cli, "flush_cache", flush_cache)
+
+        cli = MusicSyncCLI()
+        assert cli.postcmd(False, "validate") is False
+        assert cli.postcmd(True, "quit") is True
+        assert len(flushes) == 2
@@ -0,0 +1,56 @@
+"""
+Tests for session module.
+"""
+
+from pathlib import Path
+
+from scripts.utils.session import clear_session, load_created_keys, load_session, record
+
+
+class TestUploadSession:
+    """Test upload session journal functions."""
+
+    def test_missing_journal(self, tmp_path: Path) -> None:
+        """Test loading when no session was interrupted."""
+        assert load_session(tmp_path / "session.jsonl") == {}
+
+    def test_record_and_load(self, tmp_path: Path) -> None:
+        """Test recorded uploads are loaded back."""
+        journal = tmp_path / "session.jsonl"
+        record(journal, "albums/A/01.Track.mp3", "abc")
+        record(journal, "covers/A.png", "def")
+        assert load_session(journal) == {"albums/A/01.Track.mp3": "abc", "covers/A.png": "def"}
+
+    def test_truncated_line_ignored(self, tmp_path: Path) -> None:
+        """Test a partially written last line is skipped."""
+        journal = tmp_path / "session.jsonl"
+        record(journal, "covers/A.png", "abc")
+        with journal.open("a") as f:
+            f.write('{"key": "covers/B.pn')
+        assert load_session(journal) == {"covers/A.png": "abc"}
+
+    def test_record_after_truncated_line(self, tmp_path: Path) -> None:
+        """Test a record appended after a partial line is still loaded."""
+        journal = tmp_path / "session.jsonl"
+        record(journal, "covers/A.png", "abc")
+        with journal.open("a") as f:
+            f.write('{"key": "covers/B.pn')
+        record(journal, "albums/A/01.Track.mp3", "def", created=True)
+        assert load_session(journal) == {"covers/A.png": "abc", "albums/A/01.Track.mp3": "def"}
+        assert load_created_keys(journal) == ["albums/A/01.Track.mp3"]
+
+    def test_created_keys(self, tmp_path: Path) -> None:
+        """Test only objects the session created are returned for rollback."""
+        journal = tmp_path / "session.jsonl"
+        record(journal, "albums/A/01.Track.mp3", "abc", created=True)
+        record(journal, "metadata/albums.json", "def")
+        assert load_created_keys(journal) == ["albums/A/01.Track.mp3"]
+        assert load_created_keys(tmp_path / "missing.jsonl") == []
+
+    def test_clear_session(self, tmp_path: Path) -> None:
+        """Test clearing removes the journal."""
+        journal = tmp_path / "session.jsonl"
+        record(journal, "covers/A.png", "abc")
+        clear_session(journal)
+        assert not journal.exists()
+        clear_session(journal)
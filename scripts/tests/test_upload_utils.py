@@ -0,0 +1,145 @@
+"""
+Tests for upload_utils module.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from scripts.utils import upload_utils
+from scripts.utils.config import Config
+from scripts.utils.upload_utils import (
+    finish_upload_session,
+    get_upload_cache,
+    rollback_upload_session,
+    start_upload_session,
+    upload_file,
+)
+
+
+class FakeS3Client:
+    """In-memory stand-in for the S3 calls made by upload_file and rollback."""
+
+    def __init__(self) -> None:
+        """Start with an empty bucket."""
+        self.objects: dict[str, bytes] = {}
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        """Raise a 404 for missing keys, like S3."""
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ETag": '"unknown"'}
+
+    def put_object(self, Bucket: str, Key: str, Body: Any, **kwargs: Any) -> None:  # noqa: N803
+        """Store the object body."""
+        self.objects[Key] = Body.read()
+
+    def delete_objects(self, Bucket: str, Delete: dict[str, Any]) -> dict[str, Any]:  # noqa: N803
+        """Delete the listed keys."""
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+        return {}
+
+
+@pytest.fixture
+def upload_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Config, Path]:
+    """Config and a fresh upload cache rooted in a temporary directory."""
+    monkeypatch.setattr(upload_utils, "_upload_cache", None)
+    monkeypatch.setattr(upload_utils, "_cache_file", None)
+    get_upload_cache(tmp_path)
+
+    config = Config(base_path=str(tmp_path))
+    local_file = tmp_path / "A.png"
+    local_file.write_bytes(b"cover")
+    return config, local_file
+
+
+class TestRollbackUploadSession:
+    """Test rolling back an interrupted upload session."""
+
+    def test_rolled_back_file_uploaded_again(self, upload_env: tuple[Config, Path]) -> None:
+        """Test a deleted object is not skipped as cached on the next upload."""
+        config, local_file = upload_env
+        s3_client = FakeS3Client()
+
+        start_upload_session(config)
+        assert upload_file(local_file, "covers/A.png", config, s3_client, verbose=False) == (
+            True,
+            False,
+        )
+        finish_upload_session(success=False)
+
+        stats = rollback_upload_session(config, s3_client, verbose=False)
+        assert stats == {"deleted": 1, "kept": 0, "errors": 0}
+        assert "covers/A.png" not in s3_client.objects
+        assert "covers/A.png" not in get_upload_cache()
+
+        assert upload_file(local_file, "covers/A.png", config, s3_client, verbose=False) == (
+            True,
+            False,
+        )
+        assert s3_client.objects["covers/A.png"] == b"cover"
+
+
+class TestResumeUploadSession:
+    """Test resuming an interrupted upload session."""
+
+    def test_unchanged_file_skipped(self, upload_env: tuple[Config, Path]) -> None:
+        """Test a file uploaded before the interruption is not uploaded again."""
+        config, local_file = upload_env
+        s3_client = FakeS3Client()
+
+        start_upload_session(config)
+        upload_file(local_file, "covers/A.png", config, s3_client, verbose=False)
+        finish_upload_session(success=False)
+
+        start_upload_session(config)
+        assert upload_file(local_file, "covers/A.png", config, s3_client, verbose=False) == (
+            True,
+            True,
+        )
+        finish_upload_session(success=True)
+
+    def test_changed_file_uploaded_again(self, upload_env: tuple[Config, Path]) -> None:
+        """Test a file rewritten since the interruption is not skipped."""
+        config, local_file = upload_env
+        s3_client = FakeS3Client()
+
+        start_upload_session(config)
+        upload_file(local_file, "covers/A.png", config, s3_client, verbose=False)
+        finish_upload_session(success=False)
+
+        local_file.write_bytes(b"new cover")
+        start_upload_session(config)
+        assert upload_file(local_file, "covers/A.png", config, s3_client, verbose=False) == (
+            True,
+            False,
+        )
+        finish_upload_session(success=True)
+        assert s3_client.objects["covers/A.png"] == b"new cover"
+
+
+class TestUploadErrors:
+    """Test collecting upload errors from quiet uploads."""
+
+    def test_errors_collected(
+        self, upload_env: tuple[Config, Path], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a failed quiet upload records its error instead of printing it."""
+        config, local_file = upload_env
+        errors: list[str] = []
+
+        result = upload_file(
+            local_file.with_name("missing.png"),
+            "covers/missing.png",
+            config,
+            FakeS3Client(),
+            verbose=False,
+            errors=errors,
+        )
+        assert result == (False, False)
+        assert len(errors) == 1
+        assert "missing.png" in errors[0]
+        assert capsys.readouterr().out == ""
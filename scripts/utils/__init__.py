@@ -1,38 +1,82 @@
-"""Utility modules for music sync operations."""
-
-from .config import Config
-from .file_utils import (
-    get_album_directories,
-    get_tracker_files,
-    remove_system_files,
-    sanitize_directory,
-    url_safe_name,
-)
-from .image_utils import (
-    extract_embedded_cover,
-    find_cover_for_album,
-    generate_thumbnail,
-)
-from .manifest_utils import (
-    build_albums_manifest,
-    build_master_manifest,
-    build_tracker_manifest,
-    build_tracks_manifest,
-    build_unreleased_manifest,
-)
-from .metadata_utils import (
-    extract_mp3_metadata,
-    extract_tracker_metadata,
-    format_duration,
-    human_filesize,
-)
-from .upload_utils import (
-    get_s3_client,
-    upload_album,
-    upload_covers,
-    upload_file,
-    upload_metadata,
-)
+"""Utility modules for music sync operations.
+
+Names are re-exported lazily: importing ``utils.config`` does not pull in
+PIL, mutagen or boto3 until a module that needs them is first used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Seen by type checkers only; at runtime names resolve through __getattr__
+if TYPE_CHECKING:
+    from .config import Config
+    from .file_utils import (
+        clean_and_sanitize,
+        get_album_directories,
+        get_tracker_files,
+        iter_tracker_files,
+        remove_system_files,
+        sanitize_directory,
+        url_safe_name,
+    )
+    from .image_utils import extract_embedded_cover, find_cover_for_album, generate_thumbnail
+    from .manifest_utils import (
+        build_albums_manifest,
+        build_master_manifest,
+        build_tracker_manifest,
+        build_tracks_manifest,
+        build_unreleased_manifest,
+    )
+    from .metadata_utils import (
+        extract_mp3_metadata,
+        extract_tracker_metadata,
+        format_duration,
+        human_filesize,
+    )
+    from .upload_utils import (
+        get_s3_client,
+        upload_album,
+        upload_covers,
+        upload_file,
+        upload_metadata,
+    )
+
+_EXPORTS = {
+    "Config": "config",
+    "clean_and_sanitize": "file_utils",
+    "get_album_directories": "file_utils",
+    "get_tracker_files": "file_utils",
+    "iter_tracker_files": "file_utils",
+    "remove_system_files": "file_utils",
+    "sanitize_directory": "file_utils",
+    "url_safe_name": "file_utils",
+    "extract_embedded_cover": "image_utils",
+    "find_cover_for_album": "image_utils",
+    "generate_thumbnail": "image_utils",
+    "build_albums_manifest": "manifest_utils",
+    "build_master_manifest": "manifest_utils",
+    "build_tracker_manifest": "manifest_utils",
+    "build_tracks_manifest": "manifest_utils",
+    "build_unreleased_manifest": "manifest_utils",
+    "extract_mp3_metadata": "metadata_utils",
+    "extract_tracker_metadata": "metadata_utils",
+    "format_duration": "metadata_utils",
+    "human_filesize": "metadata_utils",
+    "get_s3_client": "upload_utils",
+    "upload_album": "upload_utils",
+    "upload_covers": "upload_utils",
+    "upload_file": "upload_utils",
+    "upload_metadata": "upload_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module that defines ``name`` on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
 
 __all__ = [
     "Config",
@@ -41,6 +85,7 @@ __all__ = [
     "build_tracker_manifest",
     "build_tracks_manifest",
     "build_unreleased_manifest",
+    "clean_and_sanitize",
     "extract_embedded_cover",
     "extract_mp3_metadata",
     "extract_tracker_metadata",
@@ -51,6 +96,7 @@ __all__ = [
     "get_s3_client",
     "get_tracker_files",
     "human_filesize",
+    "iter_tracker_files",
     "remove_system_files",
     "sanitize_directory",
     "upload_album",
@@ -7,48 +7,81 @@ v3 Caching Features:
 - SHA256 checksums: File integrity verification for cache validation
 - ETag generation: MD5-based cache validation compatible with S3/CloudFront
 - TTL-based expiry: 300s (5 minutes) stale-while-revalidate strategy
+- LRU eviction: capped at MAX_CACHE_ENTRIES, least recently used entries evicted first
 - Metadata storage: Cached MP3 ID3 tags and tracker format metadata
 - Manifest cache info: Includes local_cache_path and strategy in manifest.json
 
-Cache Structure (Music/.metadata_cache.json):
+Cache Structure (Music/.metadata_cache.json), the index used for validation:
 {
   "file_path": {
     "checksum": "sha256:abc123...",
     "mtime": 1234567890.0,
     "size": 12345,
-    "metadata": { ... },  # Cached v3 metadata
     "cached_at": 1234567890.0,
-    "ttl_seconds": 300
+    "ttl_seconds": 300,
+    "expires_at": 1234568190.0
   }
 }
 
+Cached v3 metadata payloads are kept separately in Music/.metadata_cache_data.json
+({"file_path": { ... }}) and only loaded on the first cache hit or update, so
+validating, pruning and summarizing the cache never parse them.
+
 Functions:
 - get_metadata_cache(): Load or create cache singleton
 - save_metadata_cache(): Persist cache to disk
+- flush_cache(): Persist cache only if it changed (also run at exit)
 - is_metadata_cached(): Check if file needs reprocessing
 - cache_metadata(): Store extracted metadata
 - calculate_file_sha256(): Generate SHA256 checksums
 - calculate_etag(): Generate S3-compatible ETags (MD5)
+- calculate_hashes(): Generate both of the above in one pass over the file
+- batch_hash_files(): Hash many files concurrently ahead of metadata extraction
 - get_manifest_cache_info(): Export cache configuration for manifest.json
 """
 
+import atexit
 import hashlib
 import json
+import mmap
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-# Global metadata cache singleton
+# Use orjson for faster cache (de)serialization if available
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Global metadata cache singleton (index) and lazily loaded metadata payloads
 _metadata_cache: dict[str, dict[str, Any]] | None = None
 _cache_file: Path | None = None
+_metadata_store: dict[str, dict[str, Any]] | None = None
+# Set when the in-memory cache has changes not yet written to disk
+_dirty = False
+
+# Hashes computed by batch_hash_files(), keyed by path: (mtime_ns, size, sha256, etag)
+_file_hashes: dict[Path, tuple[int, int, str, str]] = {}
 
 # Cache TTL settings
 DEFAULT_CACHE_TTL_SECONDS = 300  # 5 minutes
+# Entries are kept in least-recently-used order; the oldest are evicted past this
+MAX_CACHE_ENTRIES = 10000
 CACHE_STRATEGY = "stale-while-revalidate"
 
+# Files at least this large are memory-mapped for hashing; smaller ones are read at once
+MMAP_THRESHOLD = 1 * 1024 * 1024  # 1 MB
+
+# Hashing is I/O-bound and hashlib releases the GIL, so threads overlap well
+HASH_WORKERS = min(8, os.cpu_count() or 4)
+
 
 def get_metadata_cache(cache_dir: Path | None = None) -> dict[str, dict[str, Any]]:
-    """Get or load the metadata cache from disk.
+    """Get or load the metadata cache index from disk.
 
     Cache structure:
     {
@@ -56,19 +89,21 @@ def get_metadata_cache(cache_dir: Path | None = None) -> dict[str, dict[str, Any
             "checksum": "sha256:abc123...",
             "mtime": 1234567890.0,
             "size": 12345,
-            "metadata": { ... },  # Cached metadata
             "cached_at": 1234567890.0,
-            "ttl_seconds": 300
+            "ttl_seconds": 300,
+            "expires_at": 1234568190.0
         }
     }
 
+    Metadata payloads are not part of the index; see _get_metadata_store().
+
     Args:
         cache_dir: Directory to store cache file (default: ./Music/.metadata_cache.json)
 
     Returns:
         Cache dictionary
     """
-    global _metadata_cache, _cache_file
+    global _metadata_cache, _cache_file, _metadata_store
 
     if _metadata_cache is not None:
         return _metadata_cache
@@ -81,36 +116,137 @@ def get_metadata_cache(cache_dir: Path | None = None) -> dict[str, dict[str, Any
     _cache_file = cache_dir / ".metadata_cache.json"
 
     # Load existing cache or create new
-    if _cache_file.exists():
-        try:
-            with _cache_file.open() as f:
-                loaded_cache: dict[str, dict[str, Any]] = json.load(f)
-                _metadata_cache = loaded_cache
-        except (OSError, json.JSONDecodeError):
-            # Corrupted cache, start fresh
-            _metadata_cache = {}
-    else:
-        _metadata_cache = {}
+    _metadata_cache = _read_cache_file(_cache_file)
+    _metadata_store = None
+
+    # Caches written before the index/payload split keep metadata inline
+    inline = {
+        key: entry.pop("metadata") for key, entry in _metadata_cache.items() if "metadata" in entry
+    }
+    if inline:
+        _metadata_store = {**_read_cache_file(_data_file(_cache_file)), **inline}
+        _mark_dirty()
 
-    assert _metadata_cache is not None
     return _metadata_cache
 
 
+def _data_file(cache_file: Path) -> Path:
+    """Get the metadata payload file that accompanies a cache index file."""
+    return cache_file.with_name(".metadata_cache_data.json")
+
+
+def _read_cache_file(path: Path) -> dict[str, dict[str, Any]]:
+    """Load a cache file, returning an empty dict if it is missing or corrupted."""
+    try:
+        raw = path.read_bytes()
+        loaded: dict[str, dict[str, Any]] = (
+            orjson.loads(raw) if orjson is not None else json.loads(raw)
+        )
+        return loaded
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _get_metadata_store() -> dict[str, dict[str, Any]]:
+    """Get the cached metadata payloads, loading them on first use.
+
+    Returns:
+        Dict mapping cache key to cached metadata
+    """
+    global _metadata_store
+
+    get_metadata_cache()
+    if _metadata_store is None:
+        assert _cache_file is not None
+        _metadata_store = _read_cache_file(_data_file(_cache_file))
+
+    return _metadata_store
+
+
+def _write_cache_file(path: Path, data: dict[str, Any]) -> None:
+    """Write a cache file in one compact write (the cache is machine-read)."""
+    if orjson is not None:
+        encoded = orjson.dumps(data)
+    else:
+        encoded = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    path.write_bytes(encoded)
+
+
 def save_metadata_cache() -> None:
-    """Save the metadata cache to disk."""
-    global _metadata_cache, _cache_file
+    """Save the metadata cache to disk.
+
+    The payload file is only rewritten if it was loaded, dropping payloads
+    whose index entries have since been removed.
+    """
+    global _metadata_cache, _cache_file, _metadata_store, _dirty
 
     if _metadata_cache is None or _cache_file is None:
         return
 
     try:
-        with _cache_file.open("w") as f:
-            json.dump(_metadata_cache, f, indent=2)
+        _write_cache_file(_cache_file, _metadata_cache)
+        if _metadata_store is not None:
+            _metadata_store = {
+                key: value for key, value in _metadata_store.items() if key in _metadata_cache
+            }
+            _write_cache_file(_data_file(_cache_file), _metadata_store)
+        _dirty = False
     except OSError as e:
         # Non-fatal - just means cache won't persist
         print(f"Warning: Could not save metadata cache: {e}")
 
 
+def flush_cache() -> None:
+    """Save the metadata cache if it has unsaved changes.
+
+    Cache updates only mark the cache dirty; this writes them out in one go.
+    It is registered to run at interpreter exit, and can be called as an
+    explicit checkpoint.
+    """
+    if _dirty:
+        save_metadata_cache()
+
+
+atexit.register(flush_cache)
+
+
+def _hash_file(file_path: Path, *hashers: Any) -> None:
+    """Feed a file's contents to one or more hashlib hash objects.
+
+    Small files are read in one call; larger ones are memory-mapped and hashed
+    in a single update, falling back to chunked reads where mmap isn't
+    available (e.g. some network filesystems). The file is read once however
+    many hashers are given.
+
+    Args:
+        file_path: Path to local file
+        *hashers: hashlib hash objects to update
+    """
+    with file_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            data = f.read()
+            for hasher in hashers:
+                hasher.update(data)
+            return
+
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Hashing reads front to back; let the kernel read ahead further
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                for hasher in hashers:
+                    hasher.update(mapped)
+                return
+        except (OSError, ValueError):
+            pass
+
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            for hasher in hashers:
+                hasher.update(chunk)
+
+
 def calculate_file_sha256(file_path: Path) -> str:
     """Calculate SHA256 hash of a file for integrity verification.
 
@@ -121,10 +257,7 @@ def calculate_file_sha256(file_path: Path) -> str:
         SHA256 hash in format "sha256:hexdigest"
     """
     sha256_hash = hashlib.sha256()
-    with file_path.open("rb") as f:
-        # Read in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
+    _hash_file(file_path, sha256_hash)
     return f"sha256:{sha256_hash.hexdigest()}"
 
 
@@ -138,16 +271,85 @@ def calculate_etag(file_path: Path) -> str:
         ETag in format '"md5hexdigest"' (quoted)
     """
     md5_hash = hashlib.md5(usedforsecurity=False)
-    with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            md5_hash.update(chunk)
+    _hash_file(file_path, md5_hash)
     return f'"{md5_hash.hexdigest()}"'
 
 
+def calculate_hashes(file_path: Path) -> tuple[str, str]:
+    """Calculate the SHA256 checksum and ETag of a file in a single read.
+
+    Reuses the result of an earlier batch_hash_files() call if the file's
+    mtime and size are unchanged since.
+
+    Args:
+        file_path: Path to local file
+
+    Returns:
+        Tuple of ("sha256:hexdigest", '"md5hexdigest"'), as returned by
+        calculate_file_sha256() and calculate_etag()
+    """
+    stat = file_path.stat()
+    cached = _file_hashes.get(file_path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+
+    sha256_hash = hashlib.sha256()
+    md5_hash = hashlib.md5(usedforsecurity=False)
+    _hash_file(file_path, sha256_hash, md5_hash)
+    return f"sha256:{sha256_hash.hexdigest()}", f'"{md5_hash.hexdigest()}"'
+
+
+def _hash_and_remember(file_path: Path) -> tuple[str, str]:
+    """Hash a file and remember the result for later calculate_hashes() calls."""
+    stat = file_path.stat()
+    sha256, etag = calculate_hashes(file_path)
+    _file_hashes[file_path] = (stat.st_mtime_ns, stat.st_size, sha256, etag)
+    return sha256, etag
+
+
+def batch_hash_files(paths: list[Path], workers: int = HASH_WORKERS) -> dict[Path, tuple[str, str]]:
+    """Hash many files concurrently.
+
+    Results are also remembered, so later calculate_hashes() calls for the
+    same (unchanged) files return immediately.
+
+    Args:
+        paths: Local files to hash
+        workers: Number of hashing threads
+
+    Returns:
+        Dict mapping each path to its (sha256, etag) tuple
+    """
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as executor:
+        return dict(zip(unique, executor.map(_hash_and_remember, unique), strict=True))
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(file_path: Path) -> str:
+    """Build the cache key for a file: its absolute path.
+
+    os.path.abspath() is purely lexical, unlike Path.resolve() which stats
+    every path component. Symlinks are therefore cached under their own path.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Absolute path string
+    """
+    return os.path.abspath(file_path)  # noqa: PTH100
+
+
 def is_cache_valid(
     cache_entry: dict[str, Any],
     file_path: Path,
     ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+    stat: os.stat_result | None = None,
+    now: float | None = None,
 ) -> tuple[bool, str]:
     """Check if cached metadata is still valid.
 
@@ -160,12 +362,15 @@ def is_cache_valid(
         cache_entry: Cache entry dict
         file_path: Path to file
         ttl_seconds: Time-to-live in seconds (0 = no expiry)
+        stat: Already-fetched stat of file_path, to save another stat() call
+        now: Current time.time(), so loops over many entries read the clock once
 
     Returns:
         Tuple of (is_valid: bool, reason: str)
     """
     try:
-        stat = file_path.stat()
+        if stat is None:
+            stat = file_path.stat()
 
         # Check file modification time and size
         if stat.st_mtime != cache_entry.get("mtime"):
@@ -176,9 +381,13 @@ def is_cache_valid(
 
         # Check TTL if enabled
         if ttl_seconds > 0:
-            cached_at = cache_entry.get("cached_at", 0)
-            age = time.time() - cached_at
-            if age > ttl_seconds:
+            if now is None:
+                now = time.time()
+            expires_at = cache_entry.get("expires_at")
+            if expires_at is None or cache_entry.get("ttl_seconds") != ttl_seconds:
+                # Older entry, or checked against a different TTL than it was cached with
+                expires_at = cache_entry.get("cached_at", 0) + ttl_seconds
+            if now > expires_at:
                 return (False, "ttl_expired")
 
         return (True, "valid")
@@ -204,7 +413,7 @@ def get_cached_metadata(
         - (None, "invalid:reason") - Cache invalid
     """
     cache = get_metadata_cache()
-    file_key = str(file_path.resolve())
+    file_key = _cache_key(file_path)
 
     if file_key not in cache:
         return (None, "miss")
@@ -213,7 +422,13 @@ def get_cached_metadata(
     is_valid, reason = is_cache_valid(cache_entry, file_path, ttl_seconds)
 
     if is_valid:
-        return (cache_entry.get("metadata"), "hit")
+        metadata = _get_metadata_store().get(file_key)
+        if metadata is None:
+            return (None, "miss")
+
+        # Mark as most recently used
+        cache[file_key] = cache.pop(file_key)
+        return (metadata, "hit")
     else:
         return (None, f"invalid:{reason}")
 
@@ -231,18 +446,34 @@ def update_cache_entry(
         ttl_seconds: Cache TTL in seconds
     """
     cache = get_metadata_cache()
-    file_key = str(file_path.resolve())
+    file_key = _cache_key(file_path)
 
     stat = file_path.stat()
+    now = time.time()
+    # Re-insert at the end so the dict stays in least-recently-used order
+    cache.pop(file_key, None)
     cache[file_key] = {
         "checksum": metadata.get("checksum", {}).get("value", "unknown"),
         "mtime": stat.st_mtime,
         "size": stat.st_size,
-        "metadata": metadata,
-        "cached_at": time.time(),
+        "cached_at": now,
         "ttl_seconds": ttl_seconds,
+        "expires_at": now + ttl_seconds,
     }
 
+    _get_metadata_store()[file_key] = metadata
+
+    while len(cache) > MAX_CACHE_ENTRIES:
+        del cache[next(iter(cache))]
+
+    _mark_dirty()
+
+
+def _mark_dirty() -> None:
+    """Record that the cache must be written out by the next flush_cache()."""
+    global _dirty
+    _dirty = True
+
 
 def invalidate_cache_entry(file_path: Path) -> None:
     """Invalidate (remove) a cache entry.
@@ -251,10 +482,11 @@ def invalidate_cache_entry(file_path: Path) -> None:
         file_path: Path to file
     """
     cache = get_metadata_cache()
-    file_key = str(file_path.resolve())
+    file_key = _cache_key(file_path)
 
     if file_key in cache:
         del cache[file_key]
+        _mark_dirty()
 
 
 def clear_metadata_cache() -> int:
@@ -266,7 +498,8 @@ def clear_metadata_cache() -> int:
     cache = get_metadata_cache()
     count = len(cache)
     cache.clear()
-    save_metadata_cache()
+    _get_metadata_store().clear()
+    _mark_dirty()
     return count
 
 
@@ -290,17 +523,23 @@ def get_cache_stats() -> dict[str, int]:
         "expired_entries": 0,
         "total_size_bytes": 0,
     }
+    now = time.time()
 
     for file_key, entry in cache.items():
         file_path = Path(file_key)
-        if file_path.exists():
-            is_valid, _ = is_cache_valid(entry, file_path)
-            if is_valid:
-                stats["valid_entries"] += 1
-            else:
-                stats["expired_entries"] += 1
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # File no longer exists
+            continue
+
+        is_valid, _ = is_cache_valid(entry, file_path, stat=stat, now=now)
+        if is_valid:
+            stats["valid_entries"] += 1
+        else:
+            stats["expired_entries"] += 1
 
-            stats["total_size_bytes"] += entry.get("size", 0)
+        stats["total_size_bytes"] += entry.get("size", 0)
 
     return stats
 
@@ -316,25 +555,28 @@ def prune_cache(max_age_seconds: int | None = None) -> int:
     """
     cache = get_metadata_cache()
     to_remove = []
+    now = time.time()
 
     for file_key, entry in cache.items():
         file_path = Path(file_key)
 
         # Remove if file doesn't exist
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             to_remove.append(file_key)
             continue
 
         # Remove if max_age specified and exceeded
         if max_age_seconds is not None:
             cached_at = entry.get("cached_at", 0)
-            age = time.time() - cached_at
+            age = now - cached_at
             if age > max_age_seconds:
                 to_remove.append(file_key)
                 continue
 
         # Remove if cache is invalid
-        is_valid, _ = is_cache_valid(entry, file_path)
+        is_valid, _ = is_cache_valid(entry, file_path, stat=stat, now=now)
         if not is_valid:
             to_remove.append(file_key)
 
@@ -343,7 +585,7 @@ def prune_cache(max_age_seconds: int | None = None) -> int:
         del cache[file_key]
 
     if to_remove:
-        save_metadata_cache()
+        _mark_dirty()
 
     return len(to_remove)
 
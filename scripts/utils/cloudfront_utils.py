@@ -2,17 +2,22 @@
 """CloudFront utility functions for cache invalidation and distribution management."""
 
 import time
+from functools import lru_cache
+from types import TracebackType
 
 import boto3
 from botocore.exceptions import ClientError
 
-from .config import Config
+from .config import get_config
 
 
+@lru_cache(maxsize=4)
 def get_cloudfront_client(region: str = "us-east-1"):
     """Get configured CloudFront client.
 
     CloudFront is a global service, but we specify us-east-1 as the region.
+    The client is created once per region and shared (boto3 clients are
+    thread-safe), since building one parses the service model each time.
 
     Args:
         region: AWS region (CloudFront uses us-east-1)
@@ -46,7 +51,7 @@ def invalidate_cloudfront_cache(
     Example:
         invalidate_cloudfront_cache(['/metadata/manifest.json', '/covers/*'])
     """
-    config = Config()
+    config = get_config()
 
     if not distribution_id:
         distribution_id = config.cloudfront_distribution_id
@@ -125,7 +130,112 @@ def invalidate_cloudfront_cache(
         return None
 
 
-def invalidate_all_music_content(wait: bool = False, dry_run: bool = False) -> str | None:
+class InvalidationBatch:
+    """Collect CloudFront invalidation paths and submit them as one invalidation.
+
+    CloudFront allows only a few invalidations in progress at once, so code
+    that changes several kinds of content should queue its paths here rather
+    than invalidating each group separately. Paths covered by a queued
+    wildcard are dropped.
+
+    Example:
+        with InvalidationBatch() as inv:
+            inv.add("/metadata/*")
+            inv.add("/covers/album.png")
+    """
+
+    def __init__(
+        self,
+        distribution_id: str | None = None,
+        wait: bool = False,
+        dry_run: bool = False,
+    ):
+        """Initialize an empty batch.
+
+        Args:
+            distribution_id: CloudFront distribution ID (from config if not provided)
+            wait: If True, wait for the invalidation to complete on flush
+            dry_run: If True, only print what would be invalidated
+        """
+        self.distribution_id = distribution_id
+        self.wait = wait
+        self.dry_run = dry_run
+        self.paths: set[str] = set()
+        self.invalidation_id: str | None = None
+
+    def add(self, path: str) -> None:
+        """Queue a path, skipping it if a queued wildcard already covers it.
+
+        Args:
+            path: Path to invalidate (e.g., '/metadata/*' or '/covers/album.png')
+        """
+        if any(_covers(queued, path) for queued in self.paths):
+            return
+
+        if path.endswith("*"):
+            self.paths = {queued for queued in self.paths if not _covers(path, queued)}
+
+        self.paths.add(path)
+
+    def flush(self) -> str | None:
+        """Submit all queued paths as a single invalidation and empty the batch.
+
+        Returns:
+            Invalidation ID if successful, None if nothing was queued, dry-run or error
+        """
+        if not self.paths:
+            return None
+
+        paths = sorted(self.paths)
+        self.paths.clear()
+        self.invalidation_id = invalidate_cloudfront_cache(
+            paths, distribution_id=self.distribution_id, wait=self.wait, dry_run=self.dry_run
+        )
+        return self.invalidation_id
+
+    def __enter__(self) -> "InvalidationBatch":
+        """Start collecting paths."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush queued paths, unless the block raised part-way through."""
+        if exc_type is None:
+            self.flush()
+
+
+def _covers(wildcard: str, path: str) -> bool:
+    """Check whether a wildcard invalidation path also covers another path."""
+    return wildcard != path and wildcard.endswith("*") and path.startswith(wildcard[:-1])
+
+
+def _invalidate_paths(
+    paths: list[str],
+    wait: bool,
+    dry_run: bool,
+    batch: InvalidationBatch | None,
+) -> str | None:
+    """Queue paths on a caller's batch, or submit them as one invalidation now."""
+    if batch is not None:
+        for path in paths:
+            batch.add(path)
+        return None
+
+    own_batch = InvalidationBatch(wait=wait, dry_run=dry_run)
+    for path in paths:
+        own_batch.add(path)
+    return own_batch.flush()
+
+
+def invalidate_all_music_content(
+    wait: bool = False,
+    dry_run: bool = False,
+    batch: InvalidationBatch | None = None,
+) -> str | None:
     """Invalidate all music-related content in CloudFront.
 
     This invalidates all albums, covers, trackers, and metadata.
@@ -134,9 +244,11 @@ def invalidate_all_music_content(wait: bool = False, dry_run: bool = False) -> s
     Args:
         wait: If True, wait for invalidation to complete
         dry_run: If True, only print what would be invalidated
+        batch: Queue the paths on this batch instead of invalidating now
+            (wait and dry_run are then taken from the batch)
 
     Returns:
-        Invalidation ID if successful, None if dry-run or error
+        Invalidation ID if successful, None if queued, dry-run or error
     """
     paths = [
         "/albums/*",
@@ -145,10 +257,14 @@ def invalidate_all_music_content(wait: bool = False, dry_run: bool = False) -> s
         "/metadata/*",
     ]
 
-    return invalidate_cloudfront_cache(paths, wait=wait, dry_run=dry_run)
+    return _invalidate_paths(paths, wait, dry_run, batch)
 
 
-def invalidate_metadata_only(wait: bool = False, dry_run: bool = False) -> str | None:
+def invalidate_metadata_only(
+    wait: bool = False,
+    dry_run: bool = False,
+    batch: InvalidationBatch | None = None,
+) -> str | None:
     """Invalidate only metadata files in CloudFront.
 
     Useful when only metadata has changed (e.g., updated manifests)
@@ -157,13 +273,15 @@ def invalidate_metadata_only(wait: bool = False, dry_run: bool = False) -> str |
     Args:
         wait: If True, wait for invalidation to complete
         dry_run: If True, only print what would be invalidated
+        batch: Queue the paths on this batch instead of invalidating now
+            (wait and dry_run are then taken from the batch)
 
     Returns:
-        Invalidation ID if successful, None if dry-run or error
+        Invalidation ID if successful, None if queued, dry-run or error
     """
     paths = ["/metadata/*"]
 
-    return invalidate_cloudfront_cache(paths, wait=wait, dry_run=dry_run)
+    return _invalidate_paths(paths, wait, dry_run, batch)
 
 
 def get_invalidation_status(
@@ -178,7 +296,7 @@ def get_invalidation_status(
     Returns:
         Invalidation details dict or None if error
     """
-    config = Config()
+    config = get_config()
 
     if not distribution_id:
         distribution_id = config.cloudfront_distribution_id
@@ -222,7 +340,7 @@ def list_recent_invalidations(distribution_id: str | None = None, max_items: int
         distribution_id: CloudFront distribution ID (from config if not provided)
         max_items: Maximum number of invalidations to list
     """
-    config = Config()
+    config = get_config()
 
     if not distribution_id:
         distribution_id = config.cloudfront_distribution_id
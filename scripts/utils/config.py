@@ -4,24 +4,77 @@ Handles configuration from multiple sources with precedence:
 CLI arguments > config file > environment variables > defaults
 """
 
+import fnmatch
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
-import yaml
+# .env is loaded by the first Config(), not at import
+_dotenv_loaded = False
 
-# Try to load python-dotenv for .env file support
-try:
-    from dotenv import load_dotenv
 
-    load_dotenv()  # Load .env file from current directory
-except ImportError:
-    pass  # python-dotenv not installed, will use system env vars only
+def _load_dotenv_once() -> None:
+    """Load the .env file from the current directory, once per process."""
+    global _dotenv_loaded
+
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    # Try to load python-dotenv for .env file support
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()  # Load .env file from current directory
+    except ImportError:
+        pass  # python-dotenv not installed, will use system env vars only
+
+
+def _yaml_load(stream: Any) -> Any:
+    """Parse YAML with the C-accelerated safe loader when libyaml is available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)  # noqa: S506  # nosec B506 - safe loaders only
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config file, memoized until the file changes.
+
+    Args:
+        path: Config file path
+        mtime_ns: File modification time, part of the cache key
+
+    Returns:
+        Parsed configuration (treat as read-only)
+    """
+    with Path(path).open() as f:
+        file_config: dict[str, Any] = _yaml_load(f) or {}
+    return file_config
 
 
 class Config:
     """Configuration manager for music sync operations."""
 
+    __slots__ = (
+        "album_dirs",
+        "albums_dir",
+        "base_path",
+        "cdn_base",
+        "cdn_base_url",
+        "config",
+        "covers_dir",
+        "metadata_dir",
+        "s3_base_url",
+        "s3_bucket",
+        "s3_region",
+        "thumbs_dir",
+        "trackers_dir",
+    )
+
     # Default configuration values
     DEFAULTS: ClassVar[dict[str, Any]] = {
         "base_path": "./Music",
@@ -46,40 +99,48 @@ class Config:
     }
 
     # File extensions
-    TRACKER_EXTS: ClassVar[set[str]] = {
-        ".it",  # Impulse Tracker
-        ".xm",  # Extended Module (FastTracker II)
-        ".mod",  # ProTracker Module
-        ".s3m",  # ScreamTracker 3
-        ".ftm",  # FamiTracker Module
-        ".nsf",  # NES Sound Format
-        ".mptm",  # OpenMPT Module
-        ".umx",  # Unreal Music Package
-        ".mt2",  # MadTracker 2
-        ".mdz",  # Compressed MOD
-        ".s3z",  # Compressed S3M
-        ".xmz",  # Compressed XM
-        ".itz",  # Compressed IT
-    }
-    AUDIO_EXTS: ClassVar[set[str]] = {".mp3"}
-    IMAGE_EXTS: ClassVar[set[str]] = {".png", ".jpg", ".jpeg"}
+    TRACKER_EXTS: ClassVar[frozenset[str]] = frozenset(
+        {
+            ".it",  # Impulse Tracker
+            ".xm",  # Extended Module (FastTracker II)
+            ".mod",  # ProTracker Module
+            ".s3m",  # ScreamTracker 3
+            ".ftm",  # FamiTracker Module
+            ".nsf",  # NES Sound Format
+            ".mptm",  # OpenMPT Module
+            ".umx",  # Unreal Music Package
+            ".mt2",  # MadTracker 2
+            ".mdz",  # Compressed MOD
+            ".s3z",  # Compressed S3M
+            ".xmz",  # Compressed XM
+            ".itz",  # Compressed IT
+        }
+    )
+    AUDIO_EXTS: ClassVar[frozenset[str]] = frozenset({".mp3"})
+    IMAGE_EXTS: ClassVar[frozenset[str]] = frozenset({".png", ".jpg", ".jpeg"})
 
     # System files and patterns to remove
-    IGNORE_FILES: ClassVar[set[str]] = {
-        ".DS_Store",
-        "Thumbs.db",
-        ".gitkeep",
-        ".gitignore",
-        "desktop.ini",
-        "Folder.jpg",
-        "AlbumArtSmall.jpg",
-    }
+    IGNORE_FILES: ClassVar[frozenset[str]] = frozenset(
+        {
+            ".DS_Store",
+            "Thumbs.db",
+            ".gitkeep",
+            ".gitignore",
+            "desktop.ini",
+            "Folder.jpg",
+            "AlbumArtSmall.jpg",
+        }
+    )
 
     # Patterns for system files (glob-style)
     IGNORE_PATTERNS: ClassVar[list[str]] = [
         "AlbumArt_*_Large.jpg",
         "AlbumArt_*_Small.jpg",
     ]
+    # All IGNORE_PATTERNS as one compiled regex, so a name is checked in a single match
+    IGNORE_RE: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in IGNORE_PATTERNS)
+    )
 
     def __init__(
         self,
@@ -94,6 +155,7 @@ class Config:
             config_file: Path to YAML config file
             **overrides: Direct configuration overrides
         """
+        _load_dotenv_once()
         self.config = self.DEFAULTS.copy()
 
         # Load from config file if provided
@@ -111,16 +173,36 @@ class Config:
         # Resolve paths
         self.base_path = Path(str(self.config["base_path"])).resolve()
 
+        # Album directories, cached by callers for the length of a run
+        self.album_dirs: list[Path] | None = None
+
         # Compute S3 base URL if not set
         if not self.config.get("s3_base_url"):
             self.config["s3_base_url"] = f"https://{self.config['s3_bucket']}.s3.amazonaws.com"
 
+        # Derived values, read per file during scans and uploads, so computed once here
+        self.albums_dir = self.base_path / self.DIR_STRUCTURE["albums"]
+        self.covers_dir = self.base_path / self.DIR_STRUCTURE["covers"]
+        self.trackers_dir = self.base_path / self.DIR_STRUCTURE["trackers"]
+        self.metadata_dir = self.base_path / self.DIR_STRUCTURE["metadata"]
+        self.thumbs_dir = self.covers_dir / self.DIR_STRUCTURE["thumbs"]  # under covers
+
+        self.s3_bucket = str(self.config["s3_bucket"])
+        self.s3_region = str(self.config["s3_region"])
+        self.s3_base_url = str(self.config["s3_base_url"]).rstrip("/")
+
+        # CDN base URL for serving assets, falling back to S3 if no CDN configured
+        cdn = self.config.get("cdn_base_url")
+        self.cdn_base_url = str(cdn).rstrip("/") if cdn else self.s3_base_url
+        self.cdn_base = self.cdn_base_url  # legacy name
+
     def _load_config_file(self, config_file: str) -> None:
         """Load configuration from YAML file."""
+        import yaml
+
         try:
-            with Path(config_file).open() as f:
-                file_config: dict[str, Any] = yaml.safe_load(f) or {}
-                self.config.update(file_config)
+            mtime_ns = Path(config_file).stat().st_mtime_ns
+            self.config.update(_parse_config_file(config_file, mtime_ns))
         except FileNotFoundError:
             print(f"Warning: Config file '{config_file}' not found, using defaults")
         except yaml.YAMLError as e:
@@ -141,65 +223,6 @@ class Config:
             if value:
                 self.config[config_key] = value
 
-    @property
-    def albums_dir(self) -> Path:
-        """Path to albums directory."""
-        return self.base_path / self.DIR_STRUCTURE["albums"]
-
-    @property
-    def covers_dir(self) -> Path:
-        """Path to covers directory."""
-        return self.base_path / self.DIR_STRUCTURE["covers"]
-
-    @property
-    def trackers_dir(self) -> Path:
-        """Path to trackers directory."""
-        return self.base_path / self.DIR_STRUCTURE["trackers"]
-
-    @property
-    def metadata_dir(self) -> Path:
-        """Path to metadata directory."""
-        return self.base_path / self.DIR_STRUCTURE["metadata"]
-
-    @property
-    def thumbs_dir(self) -> Path:
-        """Path to thumbnails directory (under covers)."""
-        return self.covers_dir / self.DIR_STRUCTURE["thumbs"]
-
-    @property
-    def s3_bucket(self) -> str:
-        """S3 bucket name."""
-        return str(self.config["s3_bucket"])
-
-    @property
-    def s3_region(self) -> str:
-        """S3 region."""
-        return str(self.config["s3_region"])
-
-    @property
-    def cdn_base(self) -> str:
-        """CDN base URL (legacy compatibility - returns cdn_base_url)."""
-        return self.cdn_base_url
-
-    @property
-    def cdn_base_url(self) -> str:
-        """CDN base URL for serving assets."""
-        cdn = self.config.get("cdn_base_url")
-        if cdn:
-            return str(cdn).rstrip("/")
-        # Fallback to S3 base if no CDN configured
-        return self.s3_base_url
-
-    @property
-    def s3_base_url(self) -> str:
-        """S3 base URL for direct S3 access."""
-        s3_base = self.config.get("s3_base_url")
-        if s3_base:
-            return str(s3_base).rstrip("/")
-        # Auto-compute from bucket
-        bucket = self.s3_bucket
-        return f"https://{bucket}.s3.amazonaws.com"
-
     @property
     def default_artist(self) -> str:
         """Default artist name."""
@@ -233,6 +256,18 @@ class Config:
         """CloudFront distribution ID for cache invalidation."""
         return self.config.get("cloudfront_distribution_id")
 
+    @classmethod
+    def is_ignored(cls, name: str) -> bool:
+        """Check whether a filename is a system file to remove.
+
+        Args:
+            name: Filename (no directory)
+
+        Returns:
+            True if the name is in IGNORE_FILES or matches an IGNORE_PATTERNS glob
+        """
+        return name in cls.IGNORE_FILES or cls.IGNORE_RE.match(name) is not None
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key."""
         return self.config.get(key, default)
@@ -253,7 +288,7 @@ class Config:
 
         try:
             with metadata_file.open("r", encoding="utf-8") as f:
-                data: Any = yaml.safe_load(f)
+                data: Any = _yaml_load(f)
 
             if not data or "albums" not in data:
                 return {}
@@ -293,3 +328,21 @@ def load_config(
                 break
 
     return Config(base_path=base_path, config_file=config_file, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared default Config, constructed on first use.
+
+    For code that needs the environment-driven defaults (e.g. the CloudFront
+    distribution ID) rather than a config built from CLI arguments.
+
+    Returns:
+        Config instance
+    """
+    return Config()
+
+
+def reset_config() -> None:
+    """Discard the shared Config so the next get_config() rebuilds it (for tests)."""
+    get_config.cache_clear()
@@ -3,14 +3,37 @@
 Handles filename sanitization, system file removal, and directory traversal.
 """
 
-import fnmatch
+import os
 import re
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .config import Config
 
+# Renames and deletions are independent syscalls, so they overlap well on threads
+FS_WORKERS = 16
 
+# url_safe_name() patterns
+_TRACK_NUMBER_RE = re.compile(r"^(\d+)\.")
+_AMPERSAND_RE = re.compile(r"\s*&\s*")
+_SLASHES = str.maketrans("/\\", "--")
+_DISALLOWED_RE = re.compile(r"[^\w\s\-]")  # also drops dots
+_SEPARATOR_RE = re.compile(r"[\s\-]+")
+# Names url_safe_name() would return unchanged: word runs joined by single dashes,
+# an optional track number and a short extension
+_CLEAN_NAME_RE = re.compile(r"(?:\d+\.)?\w+(?:-\w+)*(?:\.[^.\s]{1,5})?")
+
+# normalize_stem() patterns
+_STEM_TRACK_NUMBER_RE = re.compile(r"^\d+\.\s*")
+_STEM_DISALLOWED_RE = re.compile(r"[^\w\s-]")
+
+
+# Album names and track titles recur across passes, so both name functions are memoized
+@lru_cache(maxsize=4096)
 def url_safe_name(name: str) -> str:
     """Convert a filename to a URL-safe format.
 
@@ -45,6 +68,10 @@ def url_safe_name(name: str) -> str:
     if not name:
         return "unnamed"
 
+    # Already-sanitized names (the common case on repeat runs) need no rewriting
+    if _CLEAN_NAME_RE.fullmatch(name):
+        return name
+
     name = name.strip()
 
     # Separate filename and extension
@@ -62,32 +89,20 @@ def url_safe_name(name: str) -> str:
 
     # Check if it starts with a track number (e.g., "01.", "02.", "123.")
     track_number = ""
-    track_match = re.match(r"^(\d+)\.", base_name)
+    track_match = _TRACK_NUMBER_RE.match(base_name)
     if track_match:
         track_number = track_match.group(1) + "."
         base_name = base_name[len(track_number) :]
 
-    # Convert & to "-and-"
-    base_name = re.sub(r"\s*&\s*", "-and-", base_name)
-
-    # Replace slashes with dashes
-    base_name = re.sub(r"[\/\\]+", "-", base_name)
-
-    # Remove all special characters and parentheses/brackets
-    # Keep only: alphanumeric, spaces, dots, dashes, underscores
-    base_name = re.sub(r"[^\w\s.\-]", "", base_name)
+    # Convert & to "-and-" and slashes to dashes
+    base_name = _AMPERSAND_RE.sub("-and-", base_name).translate(_SLASHES)
 
-    # Remove all dots (they'll be re-added only for extension)
-    base_name = base_name.replace(".", "")
+    # Remove special characters, brackets and dots (the extension is re-added below)
+    # Keep only: alphanumeric, spaces, dashes, underscores
+    base_name = _DISALLOWED_RE.sub("", base_name)
 
-    # Replace whitespace runs with single dash
-    base_name = re.sub(r"\s+", "-", base_name)
-
-    # Collapse multiple dashes into one
-    base_name = re.sub(r"-{2,}", "-", base_name)
-
-    # Remove leading/trailing dashes
-    base_name = base_name.strip("-")
+    # Collapse whitespace and dash runs into a single dash, trimmed at the ends
+    base_name = _SEPARATOR_RE.sub("-", base_name).strip("-")
 
     # Reconstruct the filename
     if not base_name:
@@ -101,6 +116,171 @@ def url_safe_name(name: str) -> str:
     return result
 
 
+def _walk_entries(root: Path, recursive: bool = True) -> Iterator[os.DirEntry[str]]:
+    """Yield the directory entries under root, like Path.rglob("*").
+
+    Directory symlinks are listed but not descended into, and unreadable
+    subdirectories are skipped. Yielding the os.DirEntry objects lets callers
+    use their cached file type and path string instead of stat'ing a Path.
+
+    Args:
+        root: Directory to walk
+        recursive: If False, only list root itself
+
+    Yields:
+        Directory entries, depth first
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    yield entry
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+
+def _ext_tuple(extensions: set[str] | frozenset[str]) -> tuple[str, ...]:
+    """Lowercase extensions as a tuple, for a single str.endswith() test per name."""
+    return tuple(ext.lower() for ext in extensions)
+
+
+def _sanitize_listing(
+    dir_path: Path,
+    filenames: list[str],
+    dirnames: list[str],
+    root: Path,
+    dry_run: bool,
+    verbose: bool,
+    remove_ignored: bool,
+) -> tuple[dict[str, int], list[str]]:
+    """Clean up and rename the entries of one directory.
+
+    Entries are handled in order, so collision suffixes don't depend on
+    which thread runs the directory.
+
+    Args:
+        dir_path: Directory containing the entries
+        filenames: Names of the non-directory entries
+        dirnames: Names of the subdirectories
+        root: Root being sanitized, for relative paths in messages
+        dry_run: If True, only preview changes without executing
+        verbose: If True, collect progress messages
+        remove_ignored: If True, delete system files instead of skipping them
+
+    Returns:
+        Tuple of (statistics for this directory, progress lines to print)
+    """
+    stats = {"removed": 0, "renamed": 0, "skipped": 0, "errors": 0}
+    lines: list[str] = []
+
+    names = filenames + dirnames
+    if remove_ignored:
+        keep = []
+        for name in filenames:
+            path = dir_path / name
+            if not Config.is_ignored(name) or not path.is_file():
+                keep.append(name)
+                continue
+
+            if verbose:
+                lines.append(f"  Remove: {path.relative_to(root)}\n")
+            error = None if dry_run else _unlink(os.fspath(path))
+            if error is None:
+                stats["removed"] += 1
+            else:
+                if verbose:
+                    lines.append(f"    Error removing {path}: {error}\n")
+                stats["errors"] += 1
+        names = keep + dirnames
+
+    for name in names:
+        # Skip system files
+        if name.startswith(".") or name in Config.IGNORE_FILES:
+            continue
+
+        safe_name = url_safe_name(name)
+
+        if safe_name == name:
+            stats["skipped"] += 1
+            continue
+
+        path = dir_path / name
+        new_path = dir_path / safe_name
+
+        if verbose:
+            rel_old = path.relative_to(root)
+            rel_new = new_path.relative_to(root)
+            lines.append(f"  Rename: {rel_old} -> {rel_new}\n")
+
+        if dry_run:
+            stats["renamed"] += 1
+            continue
+
+        try:
+            # Handle name collisions
+            if os.path.lexists(new_path):
+                base = Path(safe_name).stem
+                suffix = Path(safe_name).suffix
+                counter = 1
+                while os.path.lexists(new_path):
+                    new_path = dir_path / f"{base}-{counter}{suffix}"
+                    counter += 1
+
+            path.rename(new_path)
+            stats["renamed"] += 1
+        except Exception as e:
+            if verbose:
+                lines.append(f"    Error renaming {path}: {e}\n")
+            stats["errors"] += 1
+
+    return stats, lines
+
+
+def _sanitize_tree(
+    root: Path, dry_run: bool, verbose: bool, remove_ignored: bool
+) -> dict[str, int]:
+    """Walk root once and clean up/rename every directory, deepest level first.
+
+    Directories at the same depth are independent, so each level runs on a
+    thread pool before moving up to their parents.
+
+    Args:
+        root: Root directory (must exist)
+        dry_run: If True, only preview changes without executing
+        verbose: If True, print progress messages
+        remove_ignored: If True, delete system files as well
+
+    Returns:
+        Dict with statistics: {"removed", "renamed", "skipped", "errors"}
+    """
+    stats = {"removed": 0, "renamed": 0, "skipped": 0, "errors": 0}
+
+    # Directory listings grouped by depth, taken before anything is changed
+    levels: dict[int, list[tuple[Path, list[str], list[str]]]] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        levels.setdefault(dirpath.count(os.sep), []).append((Path(dirpath), filenames, dirnames))
+
+    def run(listing: tuple[Path, list[str], list[str]]) -> tuple[dict[str, int], list[str]]:
+        dir_path, filenames, dirnames = listing
+        return _sanitize_listing(
+            dir_path, filenames, dirnames, root, dry_run, verbose, remove_ignored
+        )
+
+    with ThreadPoolExecutor(max_workers=FS_WORKERS) as executor:
+        # Deepest level first: every entry is renamed before its parent directory
+        for depth in sorted(levels, reverse=True):
+            for dir_stats, lines in executor.map(run, levels[depth]):
+                if lines:
+                    sys.stdout.write("".join(lines))
+                for key, count in dir_stats.items():
+                    stats[key] += count
+
+    return stats
+
+
 def sanitize_directory(
     root: Path,
     dry_run: bool = False,
@@ -108,7 +288,8 @@ def sanitize_directory(
 ) -> dict[str, int]:
     """Recursively sanitize filenames and directory names to URL-safe format.
 
-    Processes directories bottom-up to avoid path confusion.
+    Processes directories bottom-up to avoid path confusion, renaming
+    directories of the same depth concurrently.
 
     Args:
         root: Root directory to sanitize
@@ -118,54 +299,50 @@ def sanitize_directory(
     Returns:
         Dict with statistics: {"renamed": count, "skipped": count, "errors": count}
     """
-    stats = {"renamed": 0, "skipped": 0, "errors": 0}
-
     if not root.exists():
         if verbose:
             print(f"Warning: Directory {root} does not exist")
-        return stats
+        return {"renamed": 0, "skipped": 0, "errors": 0}
 
-    # Collect all paths, sorted by depth (deepest first)
-    all_paths = sorted(root.rglob("*"), key=lambda x: len(x.parts), reverse=True)
+    stats = _sanitize_tree(root, dry_run, verbose, remove_ignored=False)
+    del stats["removed"]
+    return stats
 
-    for path in all_paths:
-        # Skip system files
-        if path.name.startswith(".") or path.name in Config.IGNORE_FILES:
-            continue
 
-        safe_name = url_safe_name(path.name)
+def clean_and_sanitize(
+    root: Path,
+    dry_run: bool = False,
+    verbose: bool = True,
+) -> dict[str, int]:
+    """Remove system files and sanitize names in a single walk of the tree.
 
-        if safe_name != path.name:
-            new_path = path.with_name(safe_name)
+    Equivalent to remove_system_files() followed by sanitize_directory(),
+    except that a dry run doesn't preview renames of files it would delete.
 
-            if verbose:
-                rel_old = path.relative_to(root)
-                rel_new = new_path.relative_to(root)
-                print(f"  Rename: {rel_old} -> {rel_new}")
-
-            if not dry_run:
-                try:
-                    # Handle name collisions
-                    if new_path.exists():
-                        base = new_path.stem
-                        suffix = new_path.suffix
-                        counter = 1
-                        while new_path.exists():
-                            new_path = new_path.with_name(f"{base}-{counter}{suffix}")
-                            counter += 1
-
-                    path.rename(new_path)
-                    stats["renamed"] += 1
-                except Exception as e:
-                    if verbose:
-                        print(f"    Error renaming {path}: {e}")
-                    stats["errors"] += 1
-            else:
-                stats["renamed"] += 1
-        else:
-            stats["skipped"] += 1
+    Args:
+        root: Root directory to clean and sanitize
+        dry_run: If True, only preview changes without executing
+        verbose: If True, print progress messages
+
+    Returns:
+        Dict with statistics:
+        {"removed": count, "renamed": count, "skipped": count, "errors": count}
+    """
+    if not root.exists():
+        if verbose:
+            print(f"Warning: Directory {root} does not exist")
+        return {"removed": 0, "renamed": 0, "skipped": 0, "errors": 0}
+
+    return _sanitize_tree(root, dry_run, verbose, remove_ignored=True)
 
-    return stats
+
+def _unlink(path: str) -> Exception | None:
+    """Delete a file, returning the error instead of raising it."""
+    try:
+        Path(path).unlink()
+        return None
+    except Exception as e:
+        return e
 
 
 def remove_system_files(
@@ -180,6 +357,8 @@ def remove_system_files(
     - Folder.jpg, AlbumArtSmall.jpg
     - AlbumArt_*_Large.jpg, AlbumArt_*_Small.jpg (pattern matching)
 
+    Deletions run on a thread pool.
+
     Args:
         root: Root directory to clean
         dry_run: If True, only preview deletions
@@ -195,36 +374,28 @@ def remove_system_files(
             print(f"Warning: Directory {root} does not exist")
         return stats
 
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-
-        should_remove = False
+    targets = [
+        entry.path
+        for entry in _walk_entries(root)
+        if entry.is_file() and Config.is_ignored(entry.name)
+    ]
 
-        # Check exact matches
-        if path.name in Config.IGNORE_FILES:
-            should_remove = True
+    if verbose:
+        for path in targets:
+            print(f"  Remove: {os.path.relpath(path, root)}")
 
-        # Check pattern matches
-        for pattern in Config.IGNORE_PATTERNS:
-            if fnmatch.fnmatch(path.name, pattern):
-                should_remove = True
-                break
+    if dry_run or not targets:
+        stats["removed"] = len(targets)
+        return stats
 
-        if should_remove:
-            if verbose:
-                print(f"  Remove: {path.relative_to(root)}")
-
-            if not dry_run:
-                try:
-                    path.unlink()
-                    stats["removed"] += 1
-                except Exception as e:
-                    if verbose:
-                        print(f"    Error removing {path}: {e}")
-                    stats["errors"] += 1
-            else:
+    with ThreadPoolExecutor(max_workers=min(FS_WORKERS, len(targets))) as executor:
+        for path, error in zip(targets, executor.map(_unlink, targets), strict=True):
+            if error is None:
                 stats["removed"] += 1
+            else:
+                if verbose:
+                    print(f"    Error removing {path}: {error}")
+                stats["errors"] += 1
 
     return stats
 
@@ -243,14 +414,34 @@ def get_album_directories(config: Config) -> list[Path]:
     if not albums_dir.exists():
         return []
 
-    return sorted([d for d in albums_dir.iterdir() if d.is_dir()])
+    # scandir reports entry types from the directory listing, avoiding a stat per entry
+    with os.scandir(albums_dir) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.is_dir())
 
 
-def get_tracker_files(
+def get_cached_album_directories(config: Config) -> list[Path]:
+    """Get album directories, scanning the albums directory once per config.
+
+    The list is kept on config.album_dirs; set that back to None after
+    renaming album directories.
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        List of album directory paths, sorted alphabetically
+    """
+    album_dirs = config.album_dirs
+    if album_dirs is None:
+        album_dirs = config.album_dirs = get_album_directories(config)
+    return album_dirs
+
+
+def iter_tracker_files(
     trackers_dir: Path,
     config: Config,
-) -> dict[str, list[dict[str, Any]]]:
-    """Scan trackers directory and categorize files.
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Scan trackers directory and categorize files as they are found.
 
     Categories:
     - linked: Tracker files that correspond to released MP3s
@@ -261,65 +452,84 @@ def get_tracker_files(
         trackers_dir: Path to trackers root directory
         config: Configuration instance
 
-    Returns:
-        Dict with categorized tracker files:
-        {
-            "linked": [{path, album, is_extra}, ...],
-            "unreleased_album": [{path, album, is_extra}, ...],
-            "unreleased_standalone": [{path}, ...],
-        }
+    Yields:
+        (category, info) tuples, where info is {path, album, is_extra}
+        ({path} for unreleased_standalone), in directory walk order
     """
-    result: dict[str, list[dict[str, Any]]] = {
-        "linked": [],
-        "unreleased_album": [],
-        "unreleased_standalone": [],
-    }
-
     if not trackers_dir.exists():
-        return result
+        return
 
-    for item in trackers_dir.rglob("*"):
-        if not item.is_file():
-            continue
+    prefix_len = len(os.fspath(trackers_dir)) + 1
+    tracker_exts = _ext_tuple(config.TRACKER_EXTS)
 
-        if item.suffix.lower() not in config.TRACKER_EXTS:
+    for entry in _walk_entries(trackers_dir):
+        if not entry.name.lower().endswith(tracker_exts) or not entry.is_file():
             continue
 
-        # Get relative path from trackers root
-        rel_path = item.relative_to(trackers_dir)
-        parts = rel_path.parts
+        # Relative path parts from trackers root, by string slicing rather than Path.parts
+        parts = entry.path[prefix_len:].split(os.sep)  # noqa: PTH206
 
         if len(parts) < 2:
             continue
 
+        item = Path(entry.path)
+
         # Check if in unreleased directory
         if parts[0] == "unreleased":
             if len(parts) == 2:
                 # Direct file in unreleased/
-                result["unreleased_standalone"].append({"path": item})
+                yield "unreleased_standalone", {"path": item}
             else:
                 # File in unreleased/{album}/ or unreleased/{album}/Extras/
-                album = parts[1]
-                is_extra = "Extras" in parts
-                result["unreleased_album"].append(
+                yield (
+                    "unreleased_album",
                     {
                         "path": item,
-                        "album": album,
-                        "is_extra": is_extra,
-                    }
+                        "album": parts[1],
+                        "is_extra": "Extras" in parts,
+                    },
                 )
         else:
             # Regular album tracker (linked)
-            album = parts[0]
-            is_extra = "Extras" in parts
-            result["linked"].append(
+            yield (
+                "linked",
                 {
                     "path": item,
-                    "album": album,
-                    "is_extra": is_extra,
-                }
+                    "album": parts[0],
+                    "is_extra": "Extras" in parts,
+                },
             )
 
+
+def get_tracker_files(
+    trackers_dir: Path,
+    config: Config,
+) -> dict[str, list[dict[str, Any]]]:
+    """Scan trackers directory and categorize files.
+
+    Collects iter_tracker_files() into one list per category.
+
+    Args:
+        trackers_dir: Path to trackers root directory
+        config: Configuration instance
+
+    Returns:
+        Dict with categorized tracker files:
+        {
+            "linked": [{path, album, is_extra}, ...],
+            "unreleased_album": [{path, album, is_extra}, ...],
+            "unreleased_standalone": [{path}, ...],
+        }
+    """
+    result: dict[str, list[dict[str, Any]]] = {
+        "linked": [],
+        "unreleased_album": [],
+        "unreleased_standalone": [],
+    }
+
+    for category, info in iter_tracker_files(trackers_dir, config):
+        result[category].append(info)
+
     return result
 
 
@@ -348,35 +558,57 @@ def ensure_directory(path: Path, dry_run: bool = False) -> bool:
         return True
 
 
-def get_file_list(
+def iter_files(
     directory: Path,
-    extensions: set[str] | None = None,
+    extensions: set[str] | frozenset[str] | None = None,
     recursive: bool = True,
-) -> list[Path]:
-    """Get list of files in directory, optionally filtered by extension.
+) -> Iterator[Path]:
+    """Yield files in directory as they are found, optionally filtered by extension.
+
+    Unlike get_file_list(), nothing is collected or sorted, so callers that
+    only need one pass in no particular order don't hold the whole list.
 
     Args:
         directory: Directory to search
         extensions: Set of extensions to include (e.g., {'.mp3', '.png'})
         recursive: If True, search recursively
 
-    Returns:
-        List of matching file paths, sorted
+    Yields:
+        Matching file paths, in directory walk order
     """
     if not directory.exists():
-        return []
-
-    file_iter = directory.rglob("*") if recursive else directory.glob("*")
+        return
 
-    files = [f for f in file_iter if f.is_file()]
+    entries = _walk_entries(directory, recursive=recursive)
 
     if extensions:
-        extensions_lower = {ext.lower() for ext in extensions}
-        files = [f for f in files if f.suffix.lower() in extensions_lower]
+        exts = _ext_tuple(extensions)
+        entries = (e for e in entries if e.name.lower().endswith(exts))
+
+    for entry in entries:
+        if entry.is_file():
+            yield Path(entry.path)
+
+
+def get_file_list(
+    directory: Path,
+    extensions: set[str] | frozenset[str] | None = None,
+    recursive: bool = True,
+) -> list[Path]:
+    """Get list of files in directory, optionally filtered by extension.
 
-    return sorted(files)
+    Args:
+        directory: Directory to search
+        extensions: Set of extensions to include (e.g., {'.mp3', '.png'})
+        recursive: If True, search recursively
+
+    Returns:
+        List of matching file paths, sorted
+    """
+    return sorted(iter_files(directory, extensions, recursive))
 
 
+@lru_cache(maxsize=4096)
 def normalize_stem(filename: str) -> str:
     """Normalize a filename stem for matching purposes.
 
@@ -394,19 +626,19 @@ def normalize_stem(filename: str) -> str:
         >>> normalize_stem("The Day They Landed.xm")
         'the-day-they-landed'
     """
-    # Remove extension if present
-    stem = Path(filename).stem if "." in filename else filename
+    # Remove extension if present (same result as Path.stem, without building a Path)
+    stem = filename
+    if "." in filename:
+        if "/" in filename:
+            stem = Path(filename).stem
+        else:
+            dot = filename.rfind(".")
+            if 0 < dot < len(filename) - 1:
+                stem = filename[:dot]
 
     # Remove leading track numbers (01., 02., etc.)
-    stem = re.sub(r"^\d+\.\s*", "", stem)
-
-    # Convert to lowercase
-    stem = stem.lower()
-
-    # Remove special characters and normalize whitespace
-    stem = re.sub(r"[^\w\s-]", "", stem)
-    stem = re.sub(r"\s+", "-", stem)
-    stem = re.sub(r"-{2,}", "-", stem)
-    stem = stem.strip("-")
+    stem = _STEM_TRACK_NUMBER_RE.sub("", stem, count=1)
 
-    return stem
+    # Lowercase, remove special characters, and collapse whitespace/dash runs
+    stem = _STEM_DISALLOWED_RE.sub("", stem.lower())
+    return _SEPARATOR_RE.sub("-", stem).strip("-")
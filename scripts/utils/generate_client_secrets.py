@@ -14,74 +14,92 @@ Output:
     Copy these values to AWS Parameter Store.
 """
 
+import base64
+import io
 import json
 import secrets
+import sys
 from datetime import UTC, datetime
 
+# Local development servers allowed by the web clients
+LOCAL_DEV_ORIGINS = (
+    "http://localhost:4321",
+    "http://localhost:4322",
+    "http://localhost:3000",
+    "http://localhost:8080",
+    "http://localhost:8888",
+    "http://127.0.0.1:4321",
+    "http://127.0.0.1:4322",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:8080",
+    "http://127.0.0.1:8888",
+)
+
+CLIENTS = (
+    {
+        "client_id": "alexmbugua-personal",
+        "description": "Personal portfolio/blog music player",
+        "allowed_origins": [
+            "https://alexmbugua.me",
+            "https://www.alexmbugua.me",
+            *LOCAL_DEV_ORIGINS,
+            "https://alexmbugua.netlify.app",
+        ],
+    },
+    {
+        "client_id": "music-app-web",
+        "description": "Dedicated music web application",
+        "allowed_origins": [
+            "https://asce1062.github.io",
+            "https://music.alexmbugua.me",
+            *LOCAL_DEV_ORIGINS,
+            "https://alexmbugua.netlify.app",
+        ],
+    },
+    {
+        "client_id": "alex-immer-mobile",
+        "description": "Alex.Immer iOS & Android app",
+        "allowed_origins": [
+            "app://alex.immer",
+            "aleximmermobile://",
+            "capacitor://localhost",
+        ],
+    },
+)
+
 
 def generate_client_secret(length: int = 64) -> str:
     """Generate a cryptographically secure random secret."""
     return secrets.token_urlsafe(length)
 
 
+def generate_client_secrets(count: int, length: int = 64) -> list[str]:
+    """Generate several secrets from a single read of the OS random source.
+
+    Each secret has the same form as generate_client_secret(length).
+    """
+    raw = secrets.token_bytes(length * count)
+    return [
+        base64.urlsafe_b64encode(raw[i : i + length]).rstrip(b"=").decode("ascii")
+        for i in range(0, length * count, length)
+    ]
+
+
 def main():
     """Generate secrets for all clients."""
-    clients = [
-        {
-            "client_id": "alexmbugua-personal",
-            "description": "Personal portfolio/blog music player",
-            "allowed_origins": [
-                "https://alexmbugua.me",
-                "https://www.alexmbugua.me",
-                "http://localhost:4321",
-                "http://localhost:4322",
-                "http://localhost:3000",
-                "http://localhost:8080",
-                "http://localhost:8888",
-                "http://127.0.0.1:4321",
-                "http://127.0.0.1:4322",
-                "http://127.0.0.1:3000",
-                "http://127.0.0.1:8080",
-                "http://127.0.0.1:8888",
-                "https://alexmbugua.netlify.app",
-            ],
-        },
-        {
-            "client_id": "music-app-web",
-            "description": "Dedicated music web application",
-            "allowed_origins": [
-                "https://asce1062.github.io",
-                "https://music.alexmbugua.me",
-                "http://localhost:4321",
-                "http://localhost:4322",
-                "http://localhost:3000",
-                "http://localhost:8080",
-                "http://localhost:8888",
-                "http://127.0.0.1:4321",
-                "http://127.0.0.1:4322",
-                "http://127.0.0.1:3000",
-                "http://127.0.0.1:8080",
-                "http://127.0.0.1:8888",
-                "https://alexmbugua.netlify.app",
-            ],
-        },
-        {
-            "client_id": "alex-immer-mobile",
-            "description": "Alex.Immer iOS & Android app",
-            "allowed_origins": [
-                "app://alex.immer",
-                "aleximmermobile://",
-                "capacitor://localhost",
-            ],
-        },
-    ]
+    # Collect the report and write it in one go rather than line by line
+    out = io.StringIO()
+
+    print("🔐 Generating Client Secrets for Music Service API", file=out)
+    print("=" * 80, file=out)
+    print(file=out)
 
-    print("🔐 Generating Client Secrets for Music Service API")
-    print("=" * 80)
-    print()
+    # Secrets from one run form a single batch and share its creation time
+    created_at = datetime.now(UTC).isoformat()
 
-    for client in clients:
-        client_secret = generate_client_secret()
+    client_secrets = generate_client_secrets(len(CLIENTS))
+
+    for client, client_secret in zip(CLIENTS, client_secrets, strict=True):
         parameter_name = f"/music-service/clients/{client['client_id']}"
 
         secret_value = {
@@ -90,45 +108,52 @@ def main():
             "allowed_origins": client["allowed_origins"],
             "description": client["description"],
             "cookie_duration_hours": 2,
-            "created_at": datetime.now(UTC).isoformat(),
+            "created_at": created_at,
         }
-
-        print(f"Client: {client['client_id']}")
-        print(f"Description: {client['description']}")
-        print(f"Parameter Name: {parameter_name}")
-        print("Parameter Value:")
-        print(json.dumps(secret_value, indent=2))
-        print()
-        print("AWS CLI Command to update parameter:")
+        # Compact form for the stored value, indented form for reading
+        compact_value = json.dumps(secret_value, separators=(",", ":"))
+        pretty_value = json.dumps(secret_value, indent=2)
+
+        print(f"Client: {client['client_id']}", file=out)
+        print(f"Description: {client['description']}", file=out)
+        print(f"Parameter Name: {parameter_name}", file=out)
+        print("Parameter Value:", file=out)
+        print(pretty_value, file=out)
+        print(file=out)
+        print("AWS CLI Command to update parameter:", file=out)
         print(
             f"aws ssm put-parameter \\\n"
             f"  --name {parameter_name} \\\n"
             f"  --type SecureString \\\n"
-            f"  --value '{json.dumps(secret_value)}' \\\n"
-            f"  --overwrite"
+            f"  --value '{compact_value}' \\\n"
+            f"  --overwrite",
+            file=out,
         )
-        print()
-        print("-" * 80)
-        print()
-
-    print("✅ Client secrets generated successfully!")
-    print()
-    print("📋 Next steps:")
-    print()
-    print("1. Run terraform apply to create the parameter resources")
-    print("2. Use the AWS CLI commands above to update each parameter")
-    print("3. Verify parameters are stored correctly:")
+        print(file=out)
+        print("-" * 80, file=out)
+        print(file=out)
+
+    print("✅ Client secrets generated successfully!", file=out)
+    print(file=out)
+    print("📋 Next steps:", file=out)
+    print(file=out)
+    print("1. Run terraform apply to create the parameter resources", file=out)
+    print("2. Use the AWS CLI commands above to update each parameter", file=out)
+    print("3. Verify parameters are stored correctly:", file=out)
     print(
-        "   aws ssm get-parameter --name /music-service/clients/alexmbugua-personal --with-decryption"  # noqa: E501
+        "   aws ssm get-parameter --name /music-service/clients/alexmbugua-personal --with-decryption",  # noqa: E501
+        file=out,
     )
-    print()
-    print("⚠️  IMPORTANT: Keep these secrets secure!")
-    print("   Do NOT commit them to version control.")
-    print("   Store them in AWS Parameter Store only.")
-    print()
-    print("💡 NOTE: Using Parameter Store instead of Secrets Manager saves $1.20/month")
-    print("   Parameter Store is free for standard parameters with KMS encryption.")
-    print()
+    print(file=out)
+    print("⚠️  IMPORTANT: Keep these secrets secure!", file=out)
+    print("   Do NOT commit them to version control.", file=out)
+    print("   Store them in AWS Parameter Store only.", file=out)
+    print(file=out)
+    print("💡 NOTE: Using Parameter Store instead of Secrets Manager saves $1.20/month", file=out)
+    print("   Parameter Store is free for standard parameters with KMS encryption.", file=out)
+    print(file=out)
+
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 Handles cover art extraction from MP3 files and thumbnail generation.
 """
 
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -22,6 +23,33 @@ class APICLike(Protocol):
     desc: str
 
 
+def read_id3v2_tag(mp3_path: Path) -> ID3 | None:
+    """Read only the ID3v2 tag at the start of an MP3 file.
+
+    Embedded cover art lives in the ID3v2 tag, so the audio payload (and the
+    trailing ID3v1 tag) never needs to be touched. The tag size is the 28-bit
+    syncsafe integer in bytes 6-9 of the header.
+
+    Args:
+        mp3_path: Path to MP3 file
+
+    Returns:
+        Parsed ID3 tags, or None if the file has no ID3v2 tag
+    """
+    with mp3_path.open("rb") as f:
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return None
+
+        size = (header[6] & 0x7F) << 21 | (header[7] & 0x7F) << 14
+        size |= (header[8] & 0x7F) << 7 | (header[9] & 0x7F)
+        if header[5] & 0x10:
+            size += 10  # Footer present
+        body = f.read(size)
+
+    return ID3(BytesIO(header + body))
+
+
 def find_cover_for_album(
     album_name: str,
     config: Config,
@@ -110,6 +138,7 @@ def extract_embedded_cover(
     output_path: Path,
     dry_run: bool = False,
     verbose: bool = True,
+    tags: ID3 | None = None,
 ) -> Path | None:
     """Extract embedded cover art from MP3 file and save to disk.
 
@@ -120,6 +149,7 @@ def extract_embedded_cover(
         output_path: Where to save extracted cover
         dry_run: If True, only simulate extraction
         verbose: If True, print progress messages
+        tags: Already-parsed ID3 tags for mp3_path (read from disk if not given)
 
     Returns:
         Path to extracted/existing cover if successful, None otherwise
@@ -127,12 +157,16 @@ def extract_embedded_cover(
     if output_path.exists():
         return output_path
 
-    try:
-        tags = ID3(mp3_path)
-    except Exception as e:
-        if verbose:
-            print(f"    Warning: Could not read ID3 tags from {mp3_path.name}: {e}")
-        return None
+    if tags is None:
+        try:
+            tags = read_id3v2_tag(mp3_path)
+        except Exception as e:
+            if verbose:
+                print(f"    Warning: Could not read ID3 tags from {mp3_path.name}: {e}")
+            return None
+
+        if tags is None:
+            return None
 
     # Find APIC frames (embedded pictures)
     apic_frames = [v for _k, v in tags.items() if isinstance(v, APIC)]
@@ -211,6 +245,11 @@ def generate_thumbnail(
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             with Image.open(source_image) as img:
+                # Let libjpeg decode JPEGs at a reduced scale (1/2, 1/4, 1/8) straight
+                # from the DCT coefficients; must happen before the pixels are loaded
+                # by convert(). No-op for PNG.
+                img.draft("RGB", (size[0] * 2, size[1] * 2))
+
                 # Convert to RGB if needed (handles RGBA, P, etc.)
                 if img.mode not in ("RGB", "L"):
                     img = img.convert("RGB")
@@ -293,7 +332,9 @@ def extract_or_find_cover(
     for mp3_file in mp3_files:
         # Determine output format based on embedded image
         try:
-            tags = ID3(mp3_file)
+            tags = read_id3v2_tag(mp3_file)
+            if tags is None:
+                continue
             apic_frames = [v for _k, v in tags.items() if isinstance(v, APIC)]
 
             if apic_frames:
@@ -311,6 +352,7 @@ def extract_or_find_cover(
                     output_path,
                     dry_run=dry_run,
                     verbose=verbose,
+                    tags=tags,
                 )
 
                 if result:
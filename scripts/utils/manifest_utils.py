@@ -55,7 +55,7 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
-from .cache_utils import get_manifest_cache_info
+from .cache_utils import batch_hash_files, get_manifest_cache_info
 from .config import Config
 from .file_utils import get_file_list, normalize_stem, url_safe_name
 from .id_utils import (
@@ -68,6 +68,29 @@ from .id_utils import (
 from .image_utils import find_cover_for_album, find_thumbnail_for_album
 from .metadata_utils import extract_mp3_metadata, extract_tracker_metadata
 
+# Use orjson for faster manifest serialization if available
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_manifest(manifest_data: Any) -> bytes:
+    """Serialize manifest data to indented UTF-8 JSON.
+
+    Uses orjson when installed (writes bytes directly), falling back to the
+    standard library with the same two-space layout.
+
+    Args:
+        manifest_data: Data to serialize (dict or list)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(manifest_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest_data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def build_albums_manifest(
     albums_data: list[dict[str, Any]],
@@ -557,8 +580,10 @@ def write_manifest_file(
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(manifest_data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename so readers never see a partial manifest
+            tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+            tmp_path.write_bytes(dumps_manifest(manifest_data))
+            tmp_path.replace(output_path)
 
             if verbose:
                 entries = len(manifest_data) if isinstance(manifest_data, list) else "1"
@@ -660,6 +685,21 @@ def scan_and_build_manifests(
     if verbose:
         print(f"  Linked {len(stem_to_trackers)} track stems to tracker files")
 
+    # Collect tracker directory files (tracker/albums/, tracker/unreleased/)
+    tracker_files: list[Path] = []
+    if config.trackers_dir.exists():
+        tracker_files = get_file_list(
+            config.trackers_dir,
+            extensions=config.TRACKER_EXTS,
+            recursive=True,
+        )
+
+    # Hash everything up front in parallel; extraction below reuses the results
+    if verbose:
+        print("  Hashing files...")
+
+    batch_hash_files(all_mp3_files + all_tracker_files + tracker_files)
+
     # === PHASE 2: Extract metadata with linkage ===
     if verbose:
         print("\nExtracting album metadata...")
@@ -762,13 +802,6 @@ def scan_and_build_manifests(
         print("\nScanning trackers directory...")
 
     if config.trackers_dir.exists():
-        # Get all tracker files recursively
-        tracker_files = get_file_list(
-            config.trackers_dir,
-            extensions=config.TRACKER_EXTS,
-            recursive=True,
-        )
-
         for tracker_file in tracker_files:
             rel_path = tracker_file.relative_to(config.trackers_dir)
             parts = rel_path.parts
@@ -885,11 +918,11 @@ def check_manifest_changes(
 
     # Generate new manifest content as strings
     new_files = {
-        "albums.json": json.dumps(manifests["albums"], indent=2, ensure_ascii=False),
-        "tracks.json": json.dumps(manifests["tracks"], indent=2, ensure_ascii=False),
-        "tracker.json": json.dumps(manifests["trackers"], indent=2, ensure_ascii=False),
-        "unreleased.json": json.dumps(manifests["unreleased"], indent=2, ensure_ascii=False),
-        "manifest.json": json.dumps(manifests["manifest"], indent=2, ensure_ascii=False),
+        "albums.json": dumps_manifest(manifests["albums"]),
+        "tracks.json": dumps_manifest(manifests["tracks"]),
+        "tracker.json": dumps_manifest(manifests["trackers"]),
+        "unreleased.json": dumps_manifest(manifests["unreleased"]),
+        "manifest.json": dumps_manifest(manifests["manifest"]),
     }
 
     # Compare hashes to detect changes
@@ -898,7 +931,7 @@ def check_manifest_changes(
         for filename, new_content in new_files.items():
             if filename in existing_files:
                 old_hash = hashlib.sha256(existing_files[filename].encode()).hexdigest()
-                new_hash = hashlib.sha256(new_content.encode()).hexdigest()
+                new_hash = hashlib.sha256(new_content).hexdigest()
                 if old_hash != new_hash:
                     has_changes = True
                     if verbose:
@@ -28,7 +28,7 @@ from mutagen.id3._frames import APIC
 from mutagen.id3._util import ID3NoHeaderError
 from mutagen.mp3 import MP3
 
-from .cache_utils import calculate_etag, calculate_file_sha256
+from .cache_utils import calculate_hashes
 from .config import Config
 from .id_utils import (
     extract_title_from_filename,
@@ -273,10 +273,14 @@ def extract_mp3_metadata(
     """
     metadata: dict[str, Any] = {}
 
-    # File-level information
+    # File-level information (MP3 also parses the ID3 tag in the same pass)
+    tags: ID3 | None = None
+    tags_loaded = False
     try:
         mp3 = MP3(mp3_path)
         info = mp3.info
+        tags = mp3.tags
+        tags_loaded = True
     except Exception as e:
         print(f"    Warning: Failed reading audio info for {mp3_path}: {e}")
         info = None
@@ -353,14 +357,15 @@ def extract_mp3_metadata(
         if hasattr(info_any, "layer") and info_any.layer is not None:
             metadata["format_profile"] = f"Layer {info_any.layer}"
 
-    # ID3 Tags
-    try:
-        tags = ID3(mp3_path)
-    except ID3NoHeaderError:
-        tags = None
-    except Exception as e:
-        print(f"    Warning: ID3 read error for {mp3_path}: {e}")
-        tags = None
+    # ID3 Tags (read separately only if the audio stream couldn't be parsed)
+    if not tags_loaded:
+        try:
+            tags = ID3(mp3_path)
+        except ID3NoHeaderError:
+            tags = None
+        except Exception as e:
+            print(f"    Warning: ID3 read error for {mp3_path}: {e}")
+            tags = None
 
     if tags:
         # Helper to extract text from ID3 frames
@@ -489,7 +494,7 @@ def extract_mp3_metadata(
     metadata["released"] = True  # All MP3s in albums/ are released
 
     # Integrity - SHA256 checksum for file verification
-    sha256_checksum = calculate_file_sha256(mp3_path)
+    sha256_checksum, etag = calculate_hashes(mp3_path)
     metadata["checksum"] = {
         "algorithm": "sha256",
         "value": sha256_checksum.replace("sha256:", ""),  # Store without prefix
@@ -500,7 +505,7 @@ def extract_mp3_metadata(
     metadata["content_length"] = file_stat.st_size
     metadata["last_modified"] = get_file_last_modified_iso8601(mp3_path)
     metadata["accept_ranges"] = "bytes"
-    metadata["etag"] = calculate_etag(mp3_path)
+    metadata["etag"] = etag
 
     # Explicit content rating
     metadata["explicit"] = detect_explicit_content(metadata)
@@ -548,7 +553,7 @@ def extract_mp3_metadata(
             # Add tracker file size and checksum
             tracker_stat = tracker_path.stat()
             tracker_file_size = normalize_file_size(tracker_stat.st_size)
-            tracker_checksum = calculate_file_sha256(tracker_path)
+            tracker_checksum, _ = calculate_hashes(tracker_path)
 
             tracker_entry = {
                 "tracker_id": tracker_id,
@@ -640,7 +645,7 @@ def extract_tracker_metadata(
         metadata["tracker_tools"] = ["Unknown"]
 
     # Integrity - SHA256 checksum
-    sha256_checksum = calculate_file_sha256(tracker_path)
+    sha256_checksum, etag = calculate_hashes(tracker_path)
     metadata["checksum"] = {
         "algorithm": "sha256",
         "value": sha256_checksum.replace("sha256:", ""),
@@ -650,7 +655,7 @@ def extract_tracker_metadata(
     metadata["content_length"] = file_stat.st_size
     metadata["last_modified"] = get_file_last_modified_iso8601(tracker_path)
     metadata["accept_ranges"] = "bytes"
-    metadata["etag"] = calculate_etag(tracker_path)
+    metadata["etag"] = etag
 
     # Explicit content rating (default: False for tracker files)
     metadata["explicit"] = False
@@ -0,0 +1,120 @@
+"""Upload session journal for resumable uploads.
+
+Records every object uploaded during a multi-step upload (upload-all, publish)
+so that a run interrupted part-way can be restarted without re-uploading what
+already made it to S3, or rolled back by deleting the objects it created. The
+journal is removed once a session completes without errors.
+
+Journal format (Music/.music_sync_session.jsonl), one JSON object per line:
+    {"key": "albums/Album/01.Track.mp3", "etag": "abc123...", "created": true}
+
+"created" is only written for objects that did not exist in S3 before the
+upload; overwritten objects can't be restored, so rollback leaves them.
+
+Lines are appended and flushed as uploads finish, so a crash loses at most the
+line being written; a truncated last line is ignored when loading, and the
+next record is written on a new line after it.
+
+Functions:
+- load_session(): Read committed keys from a journal
+- load_created_keys(): Read the keys a journaled session created
+- record(): Append one committed upload to a journal
+- clear_session(): Remove a journal after a successful run
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+SESSION_FILENAME = ".music_sync_session.jsonl"
+
+# Uploads run on several threads; keep their journal lines whole
+_write_lock = threading.Lock()
+
+
+def load_session(path: Path) -> dict[str, str]:
+    """Load the keys committed by a previous, unfinished session.
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        Dict mapping S3 key to ETag, empty if there is no journal
+    """
+    session: dict[str, str] = {}
+
+    try:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    session[entry["key"]] = entry["etag"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # Partially written line from an interrupted run
+                    continue
+    except FileNotFoundError:
+        pass
+
+    return session
+
+
+def load_created_keys(path: Path) -> list[str]:
+    """Load the keys of objects a session created (rather than overwrote).
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        S3 keys in upload order, empty if there is no journal
+    """
+    keys: list[str] = []
+
+    try:
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if entry.get("created"):
+                        keys.append(entry["key"])
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    # Partially written line from an interrupted run
+                    continue
+    except FileNotFoundError:
+        pass
+
+    return keys
+
+
+def record(path: Path, key: str, etag: str, created: bool = False) -> None:
+    """Append a committed upload to the journal.
+
+    Args:
+        path: Journal file path
+        key: S3 object key
+        etag: ETag (or MD5) of the uploaded content
+        created: True if the object did not exist before this upload
+    """
+    entry: dict[str, str | bool] = {"key": key, "etag": etag}
+    if created:
+        entry["created"] = True
+    line = (json.dumps(entry) + "\n").encode("utf-8")
+
+    with _write_lock, path.open("a+b") as f:
+        # A crash can leave a partial last line; start a new line so this
+        # record isn't merged into it and lost as well
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+
+def clear_session(path: Path) -> None:
+    """Remove the journal once every upload in the session has succeeded.
+
+    Args:
+        path: Journal file path
+    """
+    path.unlink(missing_ok=True)
@@ -8,8 +8,12 @@ Features local cache to minimize S3 API calls and speed up subsequent uploads.
 
 import hashlib
 import json
+import mmap
 import os
+import sys
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,8 +26,15 @@ if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 
 from .config import Config
-from .file_utils import get_file_list
+from .file_utils import get_cached_album_directories, get_file_list
 from .secrets_manager import get_aws_credentials
+from .session import (
+    SESSION_FILENAME,
+    clear_session,
+    load_created_keys,
+    load_session,
+    record,
+)
 
 # Global S3 client singleton
 _s3_client: "S3Client | None" = None
@@ -32,11 +43,25 @@ _s3_client: "S3Client | None" = None
 _upload_cache: dict[str, dict[str, str | float]] | None = None
 _cache_file: Path | None = None
 
+# Active upload session journal (see session.py)
+_session: dict[str, str] | None = None
+_session_file: Path | None = None
+
 # Multipart upload thresholds (optimized for international uploads)
-# Files larger than 50MB use multipart upload with 10MB chunks
-MULTIPART_THRESHOLD = 50 * 1024 * 1024  # 50 MB
-MULTIPART_CHUNKSIZE = 10 * 1024 * 1024  # 10 MB per part
-MAX_CONCURRENCY = 10  # Concurrent upload threads
+# Files larger than 8MB use multipart upload with 8MB parts sent in parallel.
+# Albums already upload concurrently, so per-file concurrency stays low.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8 MB
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # 8 MB per part
+MAX_CONCURRENCY = 4  # Concurrent part uploads per file
+
+# Connection pool size, sized for several albums uploading concurrently
+MAX_POOL_CONNECTIONS = 64
+
+# Retries per request; long accelerated uploads from slow links see transient resets
+MAX_ATTEMPTS = 10
+
+# Files uploaded concurrently by upload_covers/upload_trackers/upload_metadata
+FILE_UPLOAD_WORKERS = 16
 
 
 def get_s3_client(region: str | None = None, use_accelerate: bool = True) -> "S3Client":
@@ -90,24 +115,25 @@ def get_s3_client(region: str | None = None, use_accelerate: bool = True) -> "S3
         enable_acceleration = os.getenv("S3_USE_ACCELERATION", "true").lower() == "true"
         use_accelerate = use_accelerate and enable_acceleration
 
+        # Shared by concurrent uploads; adaptive retries back off on throttling
+        boto_config = BotocoreConfig(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            retries={"mode": "adaptive", "max_attempts": MAX_ATTEMPTS},
+        )
         if use_accelerate:
-            # Use Transfer Acceleration endpoint
-            boto_config = BotocoreConfig(s3={"use_accelerate_endpoint": True})
-            _s3_client = boto3.client(
-                "s3",
-                region_name=region,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                config=boto_config,
-            )
-        else:
-            _s3_client = boto3.client(
-                "s3",
-                region_name=region,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
+            # Use Transfer Acceleration endpoint (only served virtual-hosted style)
+            boto_config = boto_config.merge(
+                BotocoreConfig(s3={"use_accelerate_endpoint": True, "addressing_style": "virtual"})
             )
 
+        _s3_client = boto3.client(
+            "s3",
+            region_name=region,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            config=boto_config,
+        )
+
     return _s3_client
 
 
@@ -232,6 +258,114 @@ def check_local_cache(
     return (False, "cached")
 
 
+def start_upload_session(config: Config) -> int:
+    """Start (or resume) a journaled upload session.
+
+    Objects recorded by an earlier, interrupted session are skipped by
+    upload_file until the session is finished.
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        Number of uploads already committed by an interrupted session
+    """
+    global _session, _session_file
+
+    _session_file = config.base_path / SESSION_FILENAME
+    _session = load_session(_session_file)
+    return len(_session)
+
+
+def finish_upload_session(success: bool) -> None:
+    """End the active upload session.
+
+    Args:
+        success: If True, remove the journal; otherwise keep it so the next
+            run resumes where this one stopped
+    """
+    global _session, _session_file
+
+    if success and _session_file is not None:
+        clear_session(_session_file)
+
+    _session = None
+    _session_file = None
+
+
+def rollback_upload_session(
+    config: Config,
+    s3_client: "S3Client | None" = None,
+    dry_run: bool = False,
+    verbose: bool = True,
+) -> dict[str, int]:
+    """Delete the objects created by an interrupted upload session.
+
+    Objects the session overwrote are left in place (their previous content is
+    gone). Deleted objects are dropped from the upload cache so the next run
+    uploads them again, and the journal is removed once every created object
+    is deleted.
+
+    Args:
+        config: Configuration instance
+        s3_client: boto3 S3 client (optional)
+        dry_run: If True, only list what would be deleted
+        verbose: If True, print progress
+
+    Returns:
+        Dict with statistics: {"deleted": count, "kept": count, "errors": count}
+    """
+    stats = {"deleted": 0, "kept": 0, "errors": 0}
+
+    session_file = config.base_path / SESSION_FILENAME
+    created_keys = load_created_keys(session_file)
+    stats["kept"] = len(load_session(session_file)) - len(set(created_keys))
+
+    if dry_run:
+        for s3_key in created_keys:
+            if verbose:
+                print(f"  Delete: s3://{config.s3_bucket}/{s3_key}")
+        stats["deleted"] = len(created_keys)
+        return stats
+
+    client = s3_client if s3_client is not None else get_s3_client(config.s3_region)
+    cache = get_upload_cache()
+
+    # DeleteObjects accepts up to 1000 keys per request
+    for start in range(0, len(created_keys), 1000):
+        batch = created_keys[start : start + 1000]
+        try:
+            response = client.delete_objects(
+                Bucket=config.s3_bucket,
+                Delete={"Objects": [{"Key": s3_key} for s3_key in batch], "Quiet": True},
+            )
+        except ClientError as e:
+            if verbose:
+                print(f"    Error deleting {len(batch)} objects: {e}")
+            stats["errors"] += len(batch)
+            continue
+
+        errors = response.get("Errors", [])
+        for error in errors:
+            if verbose:
+                print(f"    Error deleting {error.get('Key')}: {error.get('Message')}")
+        stats["errors"] += len(errors)
+        stats["deleted"] += len(batch) - len(errors)
+
+        # Deleted objects must not be skipped as "unchanged" on the next upload
+        failed = {error.get("Key") for error in errors}
+        for s3_key in batch:
+            if s3_key not in failed:
+                cache.pop(s3_key, None)
+
+    save_upload_cache()
+
+    if stats["errors"] == 0:
+        clear_session(session_file)
+
+    return stats
+
+
 def get_transfer_config() -> TransferConfig:
     """Get optimized TransferConfig for multipart uploads.
 
@@ -239,9 +373,9 @@ def get_transfer_config() -> TransferConfig:
         TransferConfig with settings optimized for large file uploads
 
     Settings:
-        - multipart_threshold: 50 MB (use multipart for files > 50MB)
-        - multipart_chunksize: 10 MB (upload in 10MB chunks)
-        - max_concurrency: 10 (use up to 10 threads)
+        - multipart_threshold: 8 MB (use multipart for files > 8MB)
+        - multipart_chunksize: 8 MB (upload in 8MB chunks)
+        - max_concurrency: 4 (use up to 4 threads per file)
         - use_threads: True (enable concurrent uploads)
     """
     return TransferConfig(
@@ -264,12 +398,98 @@ def calculate_file_md5(file_path: Path) -> str:
     Returns:
         Hex string of MD5 hash
     """
-    md5_hash = hashlib.md5(usedforsecurity=False)  # Used for checksums, not security
     with file_path.open("rb") as f:
-        # Read in chunks to handle large files efficiently
-        for chunk in iter(lambda: f.read(8192), b""):
-            md5_hash.update(chunk)
-    return md5_hash.hexdigest()
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.md5(b"", usedforsecurity=False).hexdigest()
+
+        # Hash the memory-mapped file directly instead of copying it in chunks
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.md5(mapped, usedforsecurity=False).hexdigest()  # Checksum only
+
+
+def calculate_multipart_etag(file_path: Path, chunksize: int = MULTIPART_CHUNKSIZE) -> str:
+    """Calculate the ETag S3 assigns to a multipart upload of a file.
+
+    Multipart ETags are the MD5 of the concatenated per-part MD5 digests,
+    suffixed with the part count (e.g. "abc123...-3").
+
+    Args:
+        file_path: Path to local file
+        chunksize: Part size used for the upload
+
+    Returns:
+        Multipart ETag string (without quotes)
+    """
+    part_digests = []
+    with file_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > 0:
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                for offset in range(0, size, chunksize):
+                    with view[offset : offset + chunksize] as part:
+                        part_digests.append(hashlib.md5(part, usedforsecurity=False).digest())
+
+    combined = hashlib.md5(b"".join(part_digests), usedforsecurity=False)
+    return f"{combined.hexdigest()}-{len(part_digests)}"
+
+
+class RemoteETagIndex:
+    """ETags of the S3 objects under a set of key prefixes, listed on first use.
+
+    A single ListObjectsV2 page returns up to 1000 keys, so one listing per
+    album replaces a HeadObject request per file. Nothing is listed if every
+    file is answered by the local upload cache. Object sizes are kept too, so
+    a changed file can be detected without hashing it.
+    """
+
+    def __init__(self, s3_client: "S3Client", bucket: str, prefixes: list[str]) -> None:
+        """Initialize the index.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: S3 bucket name
+            prefixes: Key prefixes to list (e.g. ["albums/{album}/"])
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefixes = prefixes
+        self._objects: dict[str, tuple[str, int]] | None = None
+        self._lock = threading.Lock()
+
+    def _listing(self) -> dict[str, tuple[str, int]]:
+        """List the prefixes once, even when several uploads ask at the same time."""
+        with self._lock:
+            if self._objects is None:
+                objects: dict[str, tuple[str, int]] = {}
+                paginator = self.s3_client.get_paginator("list_objects_v2")
+                for prefix in self.prefixes:
+                    for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                        for obj in page.get("Contents", []):
+                            objects[obj["Key"]] = (obj["ETag"].strip('"'), obj["Size"])
+                self._objects = objects
+
+        return self._objects
+
+    def etag(self, s3_key: str) -> str | None:
+        """Get the ETag (without quotes) for a key, or None if it doesn't exist.
+
+        Raises:
+            ClientError: If the bucket listing fails
+        """
+        entry = self._listing().get(s3_key)
+        return entry[0] if entry else None
+
+    def size(self, s3_key: str) -> int | None:
+        """Get the size in bytes for a key, or None if it doesn't exist.
+
+        Raises:
+            ClientError: If the bucket listing fails
+        """
+        entry = self._listing().get(s3_key)
+        return entry[1] if entry else None
 
 
 def file_needs_upload(
@@ -277,16 +497,19 @@ def file_needs_upload(
     s3_key: str,
     s3_client: "S3Client",
     bucket: str,
+    remote_etags: RemoteETagIndex | None = None,
 ) -> tuple[bool, str]:
     """Check if a local file needs to be uploaded to S3.
 
-    Compares local file MD5 hash with S3 ETag to determine if file has changed.
+    Compares local file MD5 hash (or multipart ETag) with S3 ETag to determine
+    if file has changed.
 
     Args:
         local_path: Path to local file
         s3_key: S3 object key
         s3_client: boto3 S3 client
         bucket: S3 bucket name
+        remote_etags: Listed ETags to use instead of a HeadObject request (optional)
 
     Returns:
         Tuple of (needs_upload: bool, reason: str)
@@ -295,15 +518,27 @@ def file_needs_upload(
         - (False, "unchanged") - File unchanged, skip upload
     """
     try:
-        # Get S3 object metadata
-        response = s3_client.head_object(Bucket=bucket, Key=s3_key)
-        s3_etag = response["ETag"].strip('"')  # ETags are quoted
+        if remote_etags is not None:
+            listed_etag = remote_etags.etag(s3_key)
+            if listed_etag is None:
+                return (True, "new")
+            # A different size means different content; no need to hash
+            if remote_etags.size(s3_key) != local_path.stat().st_size:
+                return (True, "modified")
+            s3_etag = listed_etag
+        else:
+            # Get S3 object metadata
+            response = s3_client.head_object(Bucket=bucket, Key=s3_key)
+            s3_etag = response["ETag"].strip('"')  # ETags are quoted
 
-        # Calculate local file MD5
-        local_md5 = calculate_file_md5(local_path)
+        # Calculate local ETag (multipart uploads have a "-{parts}" suffix)
+        if "-" in s3_etag:
+            local_etag = calculate_multipart_etag(local_path)
+        else:
+            local_etag = calculate_file_md5(local_path)
 
         # Compare hashes
-        if local_md5 == s3_etag:
+        if local_etag == s3_etag:
             return (False, "unchanged")
         else:
             return (True, "modified")
@@ -322,6 +557,19 @@ def file_needs_upload(
         return (True, f"error: {e!s}")
 
 
+def _print_line(message: str) -> None:
+    """Print a progress line in one write so concurrent uploads don't interleave."""
+    sys.stdout.write(f"{message}\n")
+
+
+def _report_error(message: str, verbose: bool, errors: list[str] | None) -> None:
+    """Print an upload error, or collect it for the caller to print later."""
+    if verbose:
+        _print_line(message)
+    if errors is not None:
+        errors.append(message)
+
+
 def upload_file(
     local_path: Path,
     s3_key: str,
@@ -330,6 +578,9 @@ def upload_file(
     dry_run: bool = False,
     verbose: bool = True,
     skip_unchanged: bool = True,
+    remote_etags: RemoteETagIndex | None = None,
+    conditional: bool = False,
+    errors: list[str] | None = None,
 ) -> tuple[bool, bool]:
     """Upload a single file to S3 with incremental upload support.
 
@@ -344,6 +595,11 @@ def upload_file(
         dry_run: If True, only simulate upload
         verbose: If True, print progress
         skip_unchanged: If True, skip files that haven't changed (default: True)
+        remote_etags: Listed ETags to check instead of a HeadObject request (optional)
+        conditional: If True, create new objects with If-None-Match so a copy
+            written by another publish in the meantime is left untouched
+        errors: List to append the error message to if the upload fails, for
+            callers that run quietly and report errors afterwards (optional)
 
     Returns:
         Tuple of (success: bool, skipped: bool)
@@ -352,14 +608,33 @@ def upload_file(
         - (False, False): Upload failed
     """
     if not local_path.exists():
-        if verbose:
-            print(f"    Error: File {local_path} does not exist")
+        _report_error(f"    Error: File {local_path} does not exist", verbose, errors)
         return (False, False)  # Failed, not skipped
 
+    bucket = config.s3_bucket
+
     # Get S3 client
     if s3_client is None:
         s3_client = get_s3_client(config.s3_region)
 
+    # Already uploaded by an interrupted session, and unchanged since (manifests
+    # are rebuilt before every publish, so the journaled copy may be stale)
+    if (
+        _session is not None
+        and s3_key in _session
+        and not dry_run
+        and _session[s3_key] == calculate_file_md5(local_path)
+    ):
+        if verbose:
+            _print_line(f"  Skip: {local_path.name} (uploaded before interruption)")
+        return (True, True)  # Success, skipped
+
+    # Preconditions for the PUT request
+    put_conditions: dict[str, str] = {}
+
+    # Why the file is uploaded ("new", "modified", ...); unknown if not checked
+    reason = ""
+
     # Check if file needs upload (unless dry run or skip_unchanged disabled)
     if skip_unchanged and not dry_run:
         # Fast path: Check local cache first
@@ -368,41 +643,46 @@ def upload_file(
         if not needs_upload_cache and cache_reason == "cached":
             # File unchanged locally since last upload - skip
             if verbose:
-                print(f"  Skip: {local_path.name} (unchanged)")
+                _print_line(f"  Skip: {local_path.name} (unchanged)")
             return (True, True)  # Success, skipped
 
         # Cache miss or file modified - verify with S3
-        needs_upload, reason = file_needs_upload(local_path, s3_key, s3_client, config.s3_bucket)
+        needs_upload, reason = file_needs_upload(
+            local_path, s3_key, s3_client, bucket, remote_etags
+        )
 
         if not needs_upload:
             # File unchanged in S3 - update cache
             local_md5 = calculate_file_md5(local_path)
             update_cache_entry(s3_key, local_path, local_md5)
             if verbose:
-                print(f"  Skip: {local_path.name} (unchanged)")
+                _print_line(f"  Skip: {local_path.name} (unchanged)")
             return (True, True)  # Success, skipped
 
+        if conditional and reason == "new":
+            put_conditions["IfNoneMatch"] = "*"
+
         # Show reason for upload if modified
         if verbose and reason == "modified":
             size_mb = local_path.stat().st_size / (1024 * 1024)
-            s3_url = f"s3://{config.s3_bucket}/{s3_key}"
-            print(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB) [modified]")
+            s3_url = f"s3://{bucket}/{s3_key}"
+            _print_line(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB) [modified]")
         elif verbose and reason == "new":
             size_mb = local_path.stat().st_size / (1024 * 1024)
-            s3_url = f"s3://{config.s3_bucket}/{s3_key}"
-            print(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB) [new]")
+            s3_url = f"s3://{bucket}/{s3_key}"
+            _print_line(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB) [new]")
         else:
             # For other reasons (errors, etc.)
             if verbose:
                 size_mb = local_path.stat().st_size / (1024 * 1024)
-                s3_url = f"s3://{config.s3_bucket}/{s3_key}"
-                print(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB)")
+                s3_url = f"s3://{bucket}/{s3_key}"
+                _print_line(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB)")
     else:
         # Dry run or skip_unchanged disabled - always show upload message
         if verbose:
             size_mb = local_path.stat().st_size / (1024 * 1024)
-            s3_url = f"s3://{config.s3_bucket}/{s3_key}"
-            print(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB)")
+            s3_url = f"s3://{bucket}/{s3_key}"
+            _print_line(f"  Upload: {local_path.name} -> {s3_url} ({size_mb:.2f} MB)")
 
     if dry_run:
         return (True, False)  # Success, not skipped (simulated upload)
@@ -437,30 +717,109 @@ def upload_file(
     else:
         extra_args["CacheControl"] = "public, max-age=31536000, immutable"
 
-    # Upload with optimized transfer config
     try:
-        transfer_config = get_transfer_config()
-        s3_client.upload_file(
-            str(local_path),
-            config.s3_bucket,
-            s3_key,
-            ExtraArgs=extra_args,
-            Config=transfer_config,
-        )
+        if local_path.stat().st_size < MULTIPART_THRESHOLD:
+            # Single PUT streamed straight from the file object; skips the
+            # transfer manager's thread pool for covers, trackers and JSON
+            with local_path.open("rb") as body:
+                s3_client.put_object(
+                    Bucket=bucket,
+                    Key=s3_key,
+                    Body=body,
+                    **extra_args,  # type: ignore[arg-type]
+                    **put_conditions,  # type: ignore[arg-type]
+                )
+        else:
+            # Multipart upload with optimized transfer config
+            transfer_config = get_transfer_config()
+            s3_client.upload_file(
+                str(local_path),
+                bucket,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=transfer_config,
+            )
 
-        # Update cache after successful upload
+        # Update cache (and session journal) after successful upload
         if not dry_run:
             local_md5 = calculate_file_md5(local_path)
             update_cache_entry(s3_key, local_path, local_md5)
+            if _session_file is not None:
+                record(_session_file, s3_key, local_md5, created=reason == "new")
 
         return (True, False)  # Success, not skipped (uploaded)
 
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "Unknown")
+        if error_code == "PreconditionFailed":
+            # Created by someone else since we checked - leave it for the next run
+            if verbose:
+                _print_line(f"  Skip: {local_path.name} (created concurrently)")
+            return (True, True)  # Success, skipped
+        _report_error(f"    Error uploading {local_path.name}: {e}", verbose, errors)
+        return (False, False)  # Failed, not skipped
+
     except Exception as e:
-        if verbose:
-            print(f"    Error uploading {local_path.name}: {e}")
+        _report_error(f"    Error uploading {local_path.name}: {e}", verbose, errors)
         return (False, False)  # Failed, not skipped
 
 
+def _upload_files(
+    uploads: list[tuple[Path, str]],
+    config: Config,
+    s3_client: "S3Client",
+    dry_run: bool,
+    verbose: bool,
+    remote_etags: RemoteETagIndex | None = None,
+    conditional: bool = False,
+) -> list[tuple[bool, bool]]:
+    """Upload several files concurrently.
+
+    Args:
+        uploads: (local path, S3 key) pairs
+        config: Configuration instance
+        s3_client: boto3 S3 client
+        dry_run: If True, only simulate uploads
+        verbose: If True, print progress
+        remote_etags: Bucket listing to check before falling back to HEAD
+        conditional: Passed through to upload_file()
+
+    Returns:
+        upload_file() results, in the same order as uploads
+    """
+    if len(uploads) < 2:
+        return [
+            upload_file(
+                path,
+                s3_key,
+                config,
+                s3_client,
+                dry_run,
+                verbose,
+                remote_etags=remote_etags,
+                conditional=conditional,
+            )
+            for path, s3_key in uploads
+        ]
+
+    with ThreadPoolExecutor(max_workers=min(FILE_UPLOAD_WORKERS, len(uploads))) as executor:
+        return list(
+            executor.map(
+                lambda upload: upload_file(
+                    upload[0],
+                    upload[1],
+                    config,
+                    s3_client,
+                    dry_run,
+                    verbose,
+                    remote_etags=remote_etags,
+                    conditional=conditional,
+                ),
+                uploads,
+            )
+        )
+
+
 def upload_album(
     album_dir: Path,
     album_name: str,
@@ -468,6 +827,7 @@ def upload_album(
     s3_client: "S3Client | None" = None,
     dry_run: bool = False,
     verbose: bool = True,
+    errors: list[str] | None = None,
 ) -> dict[str, int]:
     """Upload all MP3 files and tracker files for an album.
 
@@ -484,6 +844,7 @@ def upload_album(
         s3_client: boto3 S3 client (optional)
         dry_run: If True, only simulate uploads
         verbose: If True, print progress
+        errors: List to collect per-file error messages in (optional)
 
     Returns:
         Dict with upload statistics:
@@ -499,6 +860,13 @@ def upload_album(
     if s3_client is None:
         s3_client = get_s3_client(config.s3_region)
 
+    # One listing per prefix answers every cache miss in this album
+    remote_etags = RemoteETagIndex(
+        s3_client,
+        config.s3_bucket,
+        [f"albums/{album_name}/", f"tracker/{album_name}/"],
+    )
+
     # Upload MP3 files (recursively to handle Extras)
     mp3_files = get_file_list(album_dir, extensions={".mp3"}, recursive=True)
 
@@ -513,7 +881,16 @@ def upload_album(
             # Regular MP3
             s3_key = f"albums/{album_name}/{mp3_file.name}"
 
-        success, skipped = upload_file(mp3_file, s3_key, config, s3_client, dry_run, verbose)
+        success, skipped = upload_file(
+            mp3_file,
+            s3_key,
+            config,
+            s3_client,
+            dry_run,
+            verbose,
+            remote_etags=remote_etags,
+            errors=errors,
+        )
         if success:
             if skipped:
                 stats["skipped"] += 1
@@ -536,7 +913,14 @@ def upload_album(
 
             for s3_key in s3_keys:
                 success, skipped = upload_file(
-                    tracker_file, s3_key, config, s3_client, dry_run, verbose
+                    tracker_file,
+                    s3_key,
+                    config,
+                    s3_client,
+                    dry_run,
+                    verbose,
+                    remote_etags=remote_etags,
+                    errors=errors,
                 )
                 if success:
                     if skipped:
@@ -562,7 +946,14 @@ def upload_album(
 
             for s3_key in s3_keys:
                 success, skipped = upload_file(
-                    tracker_file, s3_key, config, s3_client, dry_run, verbose
+                    tracker_file,
+                    s3_key,
+                    config,
+                    s3_client,
+                    dry_run,
+                    verbose,
+                    remote_etags=remote_etags,
+                    errors=errors,
                 )
                 if success:
                     if skipped:
@@ -605,6 +996,10 @@ def upload_covers(
     if s3_client is None:
         s3_client = get_s3_client(config.s3_region)
 
+    # Covers rarely change: one listing answers every cache miss, and new
+    # covers are written conditionally so concurrent publishes don't clobber them
+    remote_etags = RemoteETagIndex(s3_client, config.s3_bucket, ["covers/"])
+
     # Upload cover images
     cover_files = get_file_list(
         config.covers_dir,
@@ -612,10 +1007,17 @@ def upload_covers(
         recursive=False,
     )
 
-    for cover_file in cover_files:
-        s3_key = f"covers/{cover_file.name}"
+    results = _upload_files(
+        [(cover_file, f"covers/{cover_file.name}") for cover_file in cover_files],
+        config,
+        s3_client,
+        dry_run,
+        verbose,
+        remote_etags=remote_etags,
+        conditional=True,
+    )
 
-        success, skipped = upload_file(cover_file, s3_key, config, s3_client, dry_run, verbose)
+    for success, skipped in results:
         if success:
             if skipped:
                 stats["skipped"] += 1
@@ -632,10 +1034,18 @@ def upload_covers(
             recursive=False,
         )
 
-        for thumb_file in thumb_files:
-            s3_key = f"covers/{config.DIR_STRUCTURE['thumbs']}/{thumb_file.name}"
+        thumbs_prefix = f"covers/{config.DIR_STRUCTURE['thumbs']}"
+        results = _upload_files(
+            [(thumb_file, f"{thumbs_prefix}/{thumb_file.name}") for thumb_file in thumb_files],
+            config,
+            s3_client,
+            dry_run,
+            verbose,
+            remote_etags=remote_etags,
+            conditional=True,
+        )
 
-            success, skipped = upload_file(thumb_file, s3_key, config, s3_client, dry_run, verbose)
+        for success, skipped in results:
             if success:
                 if skipped:
                     stats["skipped"] += 1
@@ -679,6 +1089,8 @@ def upload_trackers(
     if s3_client is None:
         s3_client = get_s3_client(config.s3_region)
 
+    remote_etags = RemoteETagIndex(s3_client, config.s3_bucket, ["tracker/"])
+
     # Get all tracker files
     tracker_files = get_file_list(
         config.trackers_dir,
@@ -714,14 +1126,17 @@ def upload_trackers(
                 # Files in tracker/{album}/
                 print(f"\n  Tracker Albums: {parent_dir}")
 
-        for tracker_file in files:
-            # Preserve directory structure in S3
-            rel_path = tracker_file.relative_to(config.trackers_dir)
-            s3_key = f"tracker/{rel_path.as_posix()}"
+        # Preserve directory structure in S3
+        uploads = [
+            (tracker_file, f"tracker/{tracker_file.relative_to(config.trackers_dir).as_posix()}")
+            for tracker_file in files
+        ]
 
-            success, skipped = upload_file(
-                tracker_file, s3_key, config, s3_client, dry_run, verbose
-            )
+        results = _upload_files(
+            uploads, config, s3_client, dry_run, verbose, remote_etags=remote_etags
+        )
+
+        for success, skipped in results:
             if success:
                 if skipped:
                     stats["skipped"] += 1
@@ -767,10 +1182,18 @@ def upload_metadata(
         recursive=False,
     )
 
-    for json_file in json_files:
-        s3_key = f"metadata/{json_file.name}"
+    remote_etags = RemoteETagIndex(s3_client, config.s3_bucket, ["metadata/"])
+
+    results = _upload_files(
+        [(json_file, f"metadata/{json_file.name}") for json_file in json_files],
+        config,
+        s3_client,
+        dry_run,
+        verbose,
+        remote_etags=remote_etags,
+    )
 
-        success, skipped = upload_file(json_file, s3_key, config, s3_client, dry_run, verbose)
+    for success, skipped in results:
         if success:
             if skipped:
                 stats["skipped"] += 1
@@ -787,6 +1210,7 @@ def upload_all(
     with_thumbs: bool = False,
     dry_run: bool = False,
     verbose: bool = True,
+    jobs: int = 1,
 ) -> dict[str, dict[str, int]]:
     """Upload all assets to S3: albums, covers, trackers, and metadata.
 
@@ -795,6 +1219,8 @@ def upload_all(
         with_thumbs: If True, upload thumbnails
         dry_run: If True, only simulate uploads
         verbose: If True, print progress
+        jobs: Number of albums to upload concurrently (per-file progress is
+            only printed when uploading one album at a time)
 
     Returns:
         Dict with all upload statistics by category
@@ -807,21 +1233,59 @@ def upload_all(
     s3_client = get_s3_client(config.s3_region)
     results: dict[str, dict[str, int]] = {}
 
+    # Journal uploads so an interrupted run can resume
+    if not dry_run:
+        resumed = start_upload_session(config)
+        if verbose and resumed:
+            print(f"\nResuming interrupted upload ({resumed} files already uploaded)")
+
     # Upload albums
     if verbose:
         print("\nUploading albums...")
 
-    album_dirs = sorted([d for d in config.albums_dir.iterdir() if d.is_dir()])
+    album_dirs = get_cached_album_directories(config)
     total_album_stats = {"mp3s": 0, "trackers": 0, "errors": 0, "skipped": 0}
 
-    for album_dir in album_dirs:
-        album_name = album_dir.name
-        if verbose:
-            print(f"\n  Album: {album_name}")
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # Albums upload quietly; each one's errors are printed when it finishes
+            futures = {}
+            for album_dir in album_dirs:
+                album_errors: list[str] = []
+                future = executor.submit(
+                    upload_album,
+                    album_dir,
+                    album_dir.name,
+                    config,
+                    s3_client,
+                    dry_run,
+                    False,
+                    album_errors,
+                )
+                futures[future] = (album_dir.name, album_errors)
+
+            for future in as_completed(futures):
+                stats = future.result()
+                album_name, album_errors = futures[future]
+                if verbose:
+                    print(
+                        f"  Album: {album_name} - {stats['mp3s']} MP3s, "
+                        f"{stats['trackers']} trackers, {stats['skipped']} skipped, "
+                        f"{stats['errors']} errors"
+                    )
+                    for message in album_errors:
+                        print(message)
+                for key in stats:
+                    total_album_stats[key] = total_album_stats.get(key, 0) + stats[key]
+    else:
+        for album_dir in album_dirs:
+            album_name = album_dir.name
+            if verbose:
+                print(f"\n  Album: {album_name}")
 
-        stats = upload_album(album_dir, album_name, config, s3_client, dry_run, verbose)
-        for key in stats:
-            total_album_stats[key] = total_album_stats.get(key, 0) + stats[key]
+            stats = upload_album(album_dir, album_name, config, s3_client, dry_run, verbose)
+            for key in stats:
+                total_album_stats[key] = total_album_stats.get(key, 0) + stats[key]
 
     results["albums"] = total_album_stats
 
@@ -843,6 +1307,8 @@ def upload_all(
 
     results["metadata"] = upload_metadata(config, s3_client, dry_run, verbose)
 
+    total_errors = sum(stats["errors"] for stats in results.values())
+
     # Summary
     if verbose:
         print("\n" + "=" * 60)
@@ -866,17 +1332,12 @@ def upload_all(
         if total_skipped > 0:
             print(f"  Skipped: {total_skipped} files (unchanged)")
 
-        total_errors = (
-            total_album_stats["errors"]
-            + results["covers"]["errors"]
-            + results["trackers"]["errors"]
-            + results["metadata"]["errors"]
-        )
         if total_errors > 0:
             print(f"  Errors: {total_errors}")
 
-    # Save cache to disk after all uploads
+    # Save cache to disk after all uploads; keep the journal if anything failed
     if not dry_run:
         save_upload_cache()
+        finish_upload_session(success=total_errors == 0)
 
     return results